@@ -1,127 +1,321 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import Dict, Any, Optional
-import random
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
 import time
 import asyncio
+import hashlib
+import json
+import uuid
 from datetime import datetime
 
-router = APIRouter()
+import numpy as np
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal, get_db
+from app.models.database import AnalysisBatch, AnalysisBatchItem, AnalysisResult, Candidate, Job
+from app.services.aggregates import candidate_aggregates
+from app.services.ai_engine import job_embedding_text
+from app.services.batch_scheduler import BatchScheduler
+from app.services.candidate_repository import (
+    candidate_profile, index_analysis_results, index_candidate_embeddings, index_candidates, index_status_change,
+    record_index_changes
+)
+from app.services.embedding_store import get_embedding_store, stored_embeddings
+from app.services.events import get_event_bus
+from app.services.job_queue import get_job_queue
+from app.services.leaderboard import job_leaderboards
+from app.services.scorer import score_pairs
+from app.services.skill_vectors import candidate_skill_matrix
 
-# Mock analysis results storage
-analysis_results = {}
+router = APIRouter()
 
 @router.post("/analyze/{candidate_id}")
 async def analyze_resume(
     candidate_id: int, 
     job_id: int,
-    background_tasks: BackgroundTasks
+    db: AsyncSession = Depends(get_db)
 ):
     """Trigger resume analysis for candidate"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    from app.api.jobs import jobs_db
-    
     # Validate candidate and job exist
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
+    candidate = await db.get(Candidate, candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Start background analysis
-    background_tasks.add_task(perform_analysis, candidate_id, job_id)
-    
-    # Update candidate status
-    candidate["status"] = "analyzing"
+    # Update candidate status before queueing, so a fast worker's "analyzed" is not overwritten
+    previous_status = candidate.status
+    candidate.status = "analyzing"
+    record_index_changes(db, [candidate_id])
+    await db.commit()
+    index_status_change([candidate_id], "analyzing")
+    
+    # Queue the analysis (re-posting while it is still pending returns the same queue job)
+    try:
+        queue_job = await enqueue_analysis([candidate_id], job_id, key=f"analysis:{candidate_id}:{job_id}")
+    except Exception:
+        await db.execute(
+            update(Candidate)
+            .where(Candidate.id == candidate_id, Candidate.status == "analyzing")
+            .values(status=previous_status)
+        )
+        record_index_changes(db, [candidate_id])
+        await db.commit()
+        index_status_change([candidate_id], previous_status, where_status="analyzing")
+        raise
+    publish_candidate_event(candidate_id, job_id, "analyzing")
     
     return {
         "message": "🔄 Analysis started",
         "candidate_id": candidate_id,
         "job_id": job_id,
+        "queue_job_id": queue_job["id"],
         "status": "analyzing",
         "estimated_time": "2-3 minutes"
     }
 
-async def perform_analysis(candidate_id: int, job_id: int):
-    """Perform AI analysis (background task)"""
-    
-    # Simulate analysis processing time
-    await asyncio.sleep(2)
-    
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    from app.api.jobs import jobs_db
-    
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
-    
-    if not candidate or not job:
+async def enqueue_analysis(candidate_ids: List[int], job_id: int, key: str, batch_id: Optional[str] = None) -> Dict[str, Any]:
+    """Put an analysis job on the durable queue (see app.worker)"""
+    payload = {"candidate_ids": candidate_ids, "job_id": job_id}
+    if batch_id:
+        payload["batch_id"] = batch_id
+    return await asyncio.to_thread(get_job_queue().enqueue, "analysis", payload, key)
+
+async def run_analysis_job(payload: Dict[str, Any]):
+    """Queue handler for "analysis" jobs"""
+    async with SessionLocal() as db:
+        job = await db.get(Job, payload["job_id"])
+    if job is None:
+        # Deleted while queued: nothing to score against, so release the candidates
+        await analysis_job_failed(payload)
         return
     
-    # Generate realistic analysis results
-    analysis_result = generate_analysis_result(candidate, job)
-    
-    # Store analysis results
-    analysis_results[candidate_id] = analysis_result
+    if payload.get("batch_id"):
+        await perform_batch_analysis(payload["batch_id"])
+        return
     
-    # Update candidate with analysis results
-    candidate["overall_score"] = analysis_result["overall_score"]
-    candidate["verdict"] = analysis_result["verdict"]
-    candidate["matched_skills"] = analysis_result["matched_skills"]
-    candidate["missing_skills"] = analysis_result["missing_skills"]
-    candidate["status"] = "analyzed"
+    job_data = job.to_dict()
+    await analyze_candidates(payload["candidate_ids"], job_data, await asyncio.to_thread(job_vectors, [job_data]))
+
+async def analysis_job_failed(payload: Dict[str, Any]):
+    """Queue handler for an analysis job that ran out of attempts: un-stick its candidates"""
+    async with SessionLocal() as db:
+        batch_id = payload.get("batch_id")
+        if batch_id:
+            pending = list(await db.scalars(
+                select(AnalysisBatchItem.candidate_id)
+                .where(AnalysisBatchItem.batch_id == batch_id, AnalysisBatchItem.status == "pending")
+            ))
+            await mark_batch_items_failed(db, batch_id, pending)
+            await db.execute(
+                update(AnalysisBatch).where(AnalysisBatch.id == batch_id).values(status="failed", finished_at=datetime.now())
+            )
+        await db.execute(
+            update(Candidate)
+            .where(Candidate.id.in_(payload["candidate_ids"]), Candidate.status == "analyzing")
+            .values(status="uploaded")
+        )
+        record_index_changes(db, payload["candidate_ids"])
+        await db.commit()
+        index_status_change(payload["candidate_ids"], "uploaded", where_status="analyzing")
+        
+        if batch_id:
+            await publish_batch_event(db, batch_id, payload["job_id"], "failed", failed=pending)
+        else:
+            for candidate_id in payload["candidate_ids"]:
+                publish_candidate_event(candidate_id, payload["job_id"], "failed")
+
+async def analyze_candidates(candidate_ids: List[int], job_data: Dict, job_embeddings: np.ndarray, batch_id: Optional[str] = None):
+    """Score candidates against one job in a single vectorized scorer call and store the results"""
+    async with SessionLocal() as db:
+        # Scored from the extraction stored at upload; the resume files are not read again
+        candidates = (await db.scalars(
+            select(Candidate).where(Candidate.id.in_(candidate_ids)).options(undefer(Candidate.resume_data))
+        )).all()
+        results = []
+        if candidates:
+            profiles = [c.to_dict(include_resume=True) for c in candidates]
+            started = time.perf_counter()
+            rows = await asyncio.to_thread(score_candidates, profiles, job_data, job_embeddings)
+            processing_time = (time.perf_counter() - started) / len(candidates)
+            results = [
+                (candidate, build_analysis_result(profile, job_data, row[0], processing_time))
+                for candidate, profile, row in zip(candidates, profiles, rows)
+            ]
+        
+        if batch_id:
+            # Committed together with the results, so a retried batch skips these candidates
+            await db.execute(
+                update(AnalysisBatchItem)
+                .where(AnalysisBatchItem.batch_id == batch_id, AnalysisBatchItem.candidate_id.in_(candidate_ids))
+                .values(status="done")
+            )
+        await store_analysis_results(db, results)
+        
+        for candidate, analysis_result in results:
+            publish_candidate_event(
+                candidate.id, job_data["id"], "analyzed", batch_id,
+                overall_score=analysis_result["overall_score"], verdict=analysis_result["verdict"]
+            )
+        if batch_id:
+            await publish_batch_event(db, batch_id, job_data["id"], "running")
+
+async def perform_batch_analysis(batch_id: str):
+    """Score a batch's pending candidates in chunks of BATCH_SIZE, at most BATCH_CONCURRENCY chunks at once"""
+    settings = get_settings()
+    
+    async with SessionLocal() as db:
+        batch = await db.get(AnalysisBatch, batch_id)
+        job = await db.get(Job, batch.job_id) if batch else None
+        if not batch or not job:
+            return
+        
+        pending = list(await db.scalars(
+            select(AnalysisBatchItem.candidate_id)
+            .where(AnalysisBatchItem.batch_id == batch_id, AnalysisBatchItem.status == "pending")
+            .order_by(AnalysisBatchItem.candidate_id)
+        ))
+        batch.status = "running"
+        await db.commit()
+        await publish_batch_event(db, batch_id, batch.job_id, "running")
+    
+    job_data = job.to_dict()
+    job_embeddings = await asyncio.to_thread(job_vectors, [job_data])
+    scheduler = BatchScheduler(chunk_size=settings.BATCH_SIZE, concurrency=settings.BATCH_CONCURRENCY)
+    outcomes = await scheduler.run(
+        pending, lambda chunk: analyze_candidates(chunk, job_data, job_embeddings, batch_id=batch_id)
+    )
+    
+    failed = [candidate_id for chunk, error in outcomes if error is not None for candidate_id in chunk]
+    async with SessionLocal() as db:
+        await mark_batch_items_failed(db, batch_id, failed)
+        await db.execute(
+            update(AnalysisBatch).where(AnalysisBatch.id == batch_id).values(status="completed", finished_at=datetime.now())
+        )
+        await db.commit()
+        index_status_change(failed, "uploaded", where_status="analyzing")
+        await publish_batch_event(db, batch_id, job_data["id"], "completed", failed=failed)
+
+async def mark_batch_items_failed(db: AsyncSession, batch_id: str, candidate_ids: List[int]):
+    """Mark batch items failed and return their candidates to "uploaded" (caller commits)"""
+    if not candidate_ids:
+        return
+    await db.execute(
+        update(AnalysisBatchItem)
+        .where(AnalysisBatchItem.batch_id == batch_id, AnalysisBatchItem.candidate_id.in_(candidate_ids))
+        .values(status="failed")
+    )
+    await db.execute(
+        update(Candidate)
+        .where(Candidate.id.in_(candidate_ids), Candidate.status == "analyzing")
+        .values(status="uploaded")
+    )
+    record_index_changes(db, candidate_ids)
+
+async def batch_progress(db: AsyncSession, batch_id: str) -> Dict[str, int]:
+    """Count a batch's items by state"""
+    counts = dict((await db.execute(
+        select(AnalysisBatchItem.status, func.count())
+        .where(AnalysisBatchItem.batch_id == batch_id)
+        .group_by(AnalysisBatchItem.status)
+    )).all())
+    return {status: counts.get(status, 0) for status in ("done", "failed", "pending")}
+
+def percent_complete(progress: Dict[str, int]) -> float:
+    total = sum(progress.values())
+    return round(100 * (progress["done"] + progress["failed"]) / total, 1) if total else 100.0
+
+def publish_candidate_event(candidate_id: int, job_id: int, status: str, batch_id: Optional[str] = None, **fields):
+    """Announce a candidate's analysis state change on the event bus"""
+    get_event_bus().publish({
+        "type": "candidate",
+        "candidate_id": candidate_id,
+        "job_id": job_id,
+        "batch_id": batch_id,
+        "status": status,
+        **fields
+    })
+
+async def publish_batch_event(db: AsyncSession, batch_id: str, job_id: int, status: str, failed: Optional[List[int]] = None):
+    """Announce a batch's state and progress (and any candidates that just failed) on the event bus"""
+    for candidate_id in failed or []:
+        publish_candidate_event(candidate_id, job_id, "failed", batch_id)
+    progress = await batch_progress(db, batch_id)
+    get_event_bus().publish({
+        "type": "batch",
+        "batch_id": batch_id,
+        "job_id": job_id,
+        "status": status,
+        "progress": progress,
+        "percent_complete": percent_complete(progress)
+    })
+
+async def store_analysis_results(db: AsyncSession, results: List[tuple]):
+    """Save (candidate, analysis result) pairs and copy headline fields onto the candidates"""
+    stored = []
+    for candidate, analysis_result in results:
+        stored.append(await db.merge(AnalysisResult(
+            candidate_id=candidate.id,
+            job_id=analysis_result["job_id"],
+            overall_score=analysis_result["overall_score"],
+            verdict=analysis_result["verdict"],
+            result=analysis_result
+        )))
+        
+        # Update candidate with analysis results
+        candidate.overall_score = analysis_result["overall_score"]
+        candidate.verdict = analysis_result["verdict"]
+        candidate.matched_skills = analysis_result["matched_skills"]
+        candidate.missing_skills = analysis_result["missing_skills"]
+        candidate.status = "analyzed"
+    record_index_changes(db, [candidate.id for candidate, _ in results])
+    await db.commit()
+    
+    await index_candidates([candidate.to_dict(include_resume=True) for candidate, _ in results])
+    index_analysis_results([result.to_dict() for result in stored])
+
+def score_candidates(candidates: List[Dict], job_data: Dict, job_embeddings: np.ndarray) -> List[List[Dict[str, Any]]]:
+    """Scorer rows for candidates against one job, using their stored resume embeddings"""
+    resumes = [candidate_profile(c) for c in candidates]
+    # Through the repository hook, so vectors embedded here reach the ANN index too
+    index_candidate_embeddings(candidates)
+    _, resume_embeddings = get_embedding_store("resumes").get_many([c["id"] for c in candidates])
+    return score_pairs(resumes, [job_data], resume_embeddings=resume_embeddings, job_embeddings=job_embeddings)
+
+def job_vectors(jobs: List[Dict]):
+    """Stored job embeddings, rows aligned with ``jobs``"""
+    return stored_embeddings("jobs", {job["id"]: job_embedding_text(job) for job in jobs})
 
 def generate_analysis_result(candidate: Dict, job: Dict) -> Dict[str, Any]:
-    """Generate realistic analysis results"""
-    
-    # Simulate skill matching
-    job_skills = set(skill.lower() for skill in job["skills_required"])
-    candidate_skills = set(skill.lower() for skill in (candidate.get("matched_skills", []) or []))
-    
-    # Calculate scores
-    skills_match = len(candidate_skills.intersection(job_skills)) / len(job_skills) if job_skills else 0
-    
-    # Generate scores with some randomness but based on skill matching
-    base_score = (skills_match * 60) + random.uniform(20, 40)
-    overall_score = min(100, max(30, base_score))
-    
-    # Determine verdict based on score
-    if overall_score >= 75:
-        verdict = "High"
-    elif overall_score >= 50:
-        verdict = "Medium"
-    else:
-        verdict = "Low"
-    
-    # Generate matched and missing skills
-    matched_skills = list(candidate_skills.intersection(job_skills))
-    missing_skills = list(job_skills - candidate_skills)
-    
-    # Add some randomness to skills if lists are empty
-    if not matched_skills:
-        matched_skills = random.sample(job["skills_required"], min(3, len(job["skills_required"])))
-    if not missing_skills:
-        all_skills = job["skills_required"] + (job.get("skills_preferred", []) or [])
-        missing_skills = random.sample(all_skills, min(2, len(all_skills)))
-    
+    """Score a candidate against a job"""
+    started = time.perf_counter()
+    scores = score_pairs([candidate_profile(candidate)], [job], job_embeddings=job_vectors([job]))[0][0]
+    return build_analysis_result(candidate, job, scores, time.perf_counter() - started)
+
+def build_analysis_result(candidate: Dict, job: Dict, scores: Dict[str, Any], processing_time: float) -> Dict[str, Any]:
+    """Shape scorer output for one candidate/job pair into an analysis result"""
     return {
         "candidate_id": candidate["id"],
         "job_id": job["id"],
-        "overall_score": round(overall_score, 1),
-        "hard_match_score": round(overall_score * 0.6, 1),
-        "soft_match_score": round(overall_score * 0.4, 1),
-        "matched_skills": matched_skills[:5],
-        "missing_skills": missing_skills[:5],
-        "verdict": verdict,
-        "suggestions": generate_suggestions(verdict, missing_skills),
-        "processing_time": 2.3,
-        "skills_match_score": round(skills_match * 100, 1),
-        "experience_match_score": round(random.uniform(60, 90), 1),
-        "education_match_score": round(random.uniform(70, 95), 1),
-        "projects_relevance_score": round(random.uniform(55, 85), 1),
+        "overall_score": scores["overall_score"],
+        "hard_match_score": scores["hard_match_score"],
+        "soft_match_score": scores["soft_match_score"],
+        "matched_skills": scores["matched_skills"][:5],
+        "missing_skills": scores["missing_skills"][:5],
+        "verdict": scores["verdict"],
+        "suggestions": generate_suggestions(scores["verdict"], scores["missing_skills"]),
+        "processing_time": round(processing_time, 3),
+        "skills_match_score": scores["skills_match_score"],
+        "experience_match_score": scores["experience_match_score"],
+        "education_match_score": scores["education_match_score"],
+        "projects_relevance_score": scores["projects_relevance_score"],
+        "semantic_similarity_score": scores["semantic_similarity_score"],
         "analyzed_at": datetime.now().isoformat()
     }
 
@@ -156,24 +350,21 @@ def generate_suggestions(verdict: str, missing_skills: list) -> list:
     return suggestions[:5]
 
 @router.get("/results/{candidate_id}")
-async def get_analysis_results(candidate_id: int):
+async def get_analysis_results(candidate_id: int, db: AsyncSession = Depends(get_db)):
     """Get analysis results for candidate"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
+    candidate = await db.get(Candidate, candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    if candidate["status"] == "analyzing":
+    if candidate.status == "analyzing":
         return {
             "status": "analyzing",
             "message": "🔄 Analysis in progress...",
             "candidate_id": candidate_id
         }
     
-    if candidate["status"] != "analyzed":
+    if candidate.status != "analyzed":
         return {
             "status": "pending",
             "message": "Analysis not started yet",
@@ -181,16 +372,17 @@ async def get_analysis_results(candidate_id: int):
         }
     
     # Get stored analysis results
-    analysis_result = analysis_results.get(candidate_id)
+    stored = await db.get(AnalysisResult, candidate_id)
+    analysis_result = stored.result if stored else None
     
     if not analysis_result:
         # If no stored results, create basic results from candidate data
         analysis_result = {
             "candidate_id": candidate_id,
-            "overall_score": candidate.get("overall_score"),
-            "verdict": candidate.get("verdict"),
-            "matched_skills": candidate.get("matched_skills", []),
-            "missing_skills": candidate.get("missing_skills", []),
+            "overall_score": candidate.overall_score,
+            "verdict": candidate.verdict,
+            "matched_skills": candidate.matched_skills or [],
+            "missing_skills": candidate.missing_skills or [],
             "status": "completed"
         }
     
@@ -204,70 +396,180 @@ async def get_analysis_results(candidate_id: int):
 async def batch_analyze_candidates(
     job_id: int,
     candidate_ids: list[int],
-    background_tasks: BackgroundTasks
+    db: AsyncSession = Depends(get_db)
 ):
     """Analyze multiple candidates at once"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    
     # Validate all candidates exist
-    valid_candidates = []
-    for candidate_id in candidate_ids:
-        candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
-        if candidate:
-            valid_candidates.append(candidate_id)
+    existing = set(await db.scalars(select(Candidate.id).where(Candidate.id.in_(candidate_ids))))
+    valid_candidates = [candidate_id for candidate_id in candidate_ids if candidate_id in existing]
     
     if not valid_candidates:
         raise HTTPException(status_code=404, detail="No valid candidates found")
     
-    # Start batch analysis
-    for candidate_id in valid_candidates:
-        background_tasks.add_task(perform_analysis, candidate_id, job_id)
+    if not await db.get(Job, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    # Record the batch so its progress can be followed at /batch/{batch_id}
+    batch = AnalysisBatch(id=uuid.uuid4().hex, job_id=job_id, total=len(valid_candidates))
+    db.add(batch)
+    db.add_all([AnalysisBatchItem(batch_id=batch.id, candidate_id=candidate_id) for candidate_id in valid_candidates])
+    await db.commit()
+    
+    # Queue batch analysis (scored in BATCH_SIZE chunks, one vectorized call each)
+    batch_key = hashlib.sha1(",".join(map(str, sorted(valid_candidates))).encode()).hexdigest()[:16]
+    queue_job = await enqueue_analysis(valid_candidates, job_id, key=f"analysis-batch:{job_id}:{batch_key}", batch_id=batch.id)
+    
+    if queue_job["payload"].get("batch_id") != batch.id:
+        # The same batch is still queued or running: report that one and leave its candidates alone
+        await db.delete(batch)
+        await db.commit()
+        batch = await db.get(AnalysisBatch, queue_job["payload"]["batch_id"])
+    else:
+        # Only items still pending: a worker may already have scored (and committed) some
+        analyzing = list(await db.scalars(
+            update(Candidate)
+            .where(Candidate.id.in_(
+                select(AnalysisBatchItem.candidate_id)
+                .where(AnalysisBatchItem.batch_id == batch.id, AnalysisBatchItem.status == "pending")
+            ))
+            .values(status="analyzing")
+            .returning(Candidate.id)
+        ))
+        record_index_changes(db, analyzing)
+        await db.commit()
+        index_status_change(analyzing, "analyzing")
+        await publish_batch_event(db, batch.id, job_id, "queued")
     
     return {
         "message": f"🔄 Batch analysis started for {len(valid_candidates)} candidates",
+        "batch_id": batch.id,
         "candidate_ids": valid_candidates,
         "job_id": job_id,
+        "queue_job_id": queue_job["id"],
         "estimated_time": "3-5 minutes"
     }
 
+@router.get("/batch/{batch_id}")
+async def get_batch_progress(batch_id: str, db: AsyncSession = Depends(get_db)):
+    """Progress of a batch analysis (done / failed / pending candidates)"""
+    
+    batch = await db.get(AnalysisBatch, batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    
+    progress = await batch_progress(db, batch_id)
+    
+    return {
+        "batch": batch.to_dict(),
+        "progress": progress,
+        "percent_complete": percent_complete(progress)
+    }
+
+@router.get("/events")
+async def stream_analysis_events(
+    request: Request,
+    job_id: Optional[int] = None,
+    batch_id: Optional[str] = None,
+    candidate_id: Optional[int] = None
+):
+    """Server-sent events stream of candidate and batch analysis state changes"""
+    heartbeat = get_settings().EVENTS_HEARTBEAT_INTERVAL
+    
+    async def event_stream():
+        # Subscribe before reading the snapshot so no transition falls in between
+        with get_event_bus().subscribe(job_id=job_id, batch_id=batch_id, candidate_id=candidate_id) as subscription:
+            if batch_id and candidate_id is None:
+                async with SessionLocal() as db:
+                    batch = await db.get(AnalysisBatch, batch_id)
+                    if batch:
+                        progress = await batch_progress(db, batch_id)
+                        yield format_event({
+                            "type": "batch",
+                            "batch_id": batch_id,
+                            "job_id": batch.job_id,
+                            "status": batch.status,
+                            "progress": progress,
+                            "percent_complete": percent_complete(progress)
+                        })
+            
+            while True:
+                event = await subscription.get(timeout=heartbeat)
+                if event is not None:
+                    yield format_event(event)
+                elif await request.is_disconnected():
+                    break
+                else:
+                    yield ": keep-alive\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def format_event(event: Dict[str, Any]) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
 @router.get("/summary/{job_id}")
-async def get_analysis_summary(job_id: int):
+async def get_analysis_summary(job_id: int, db: AsyncSession = Depends(get_db)):
     """Get analysis summary for a job"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    from app.api.jobs import jobs_db
-    
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job_candidates = [c for c in candidates_db if c["job_id"] == job_id and c["status"] == "analyzed"]
+    pool = candidate_aggregates.pool(job_id)
+    total = pool.total(status="analyzed")
     
-    if not job_candidates:
+    if not total:
         return {
             "job_id": job_id,
-            "job_title": job["title"],
+            "job_title": job.title,
             "total_candidates": 0,
             "message": "No analyzed candidates found for this job"
         }
     
     # Calculate summary statistics
-    scores = [c["overall_score"] for c in job_candidates if c["overall_score"] is not None]
-    avg_score = sum(scores) / len(scores) if scores else 0
-    
-    verdict_counts = {}
-    for candidate in job_candidates:
-        verdict = candidate.get("verdict", "Unknown")
-        verdict_counts[verdict] = verdict_counts.get(verdict, 0) + 1
+    verdict_counts = {verdict or "Unknown": count for verdict, count in pool.verdicts(status="analyzed").items()}
+    top_ids = [candidate_id for candidate_id, _ in job_leaderboards.get(job_id).top(5)]
+    by_id = {c.id: c for c in await db.scalars(select(Candidate).where(Candidate.id.in_(top_ids)))}
+    top_candidates = [by_id[candidate_id] for candidate_id in top_ids if candidate_id in by_id]
     
     return {
         "job_id": job_id,
-        "job_title": job["title"],
-        "total_candidates": len(job_candidates),
-        "average_score": round(avg_score, 1),
+        "job_title": job.title,
+        "total_candidates": total,
+        "average_score": round(pool.average_score(status="analyzed"), 1),
         "verdict_distribution": verdict_counts,
-        "top_candidates": sorted(job_candidates, key=lambda x: x.get("overall_score", 0), reverse=True)[:5]
+        "top_candidates": [c.to_dict() for c in top_candidates]
+    }
+
+@router.get("/skill-match/{job_id}")
+async def get_skill_match(job_id: int, limit: int = 50, db: AsyncSession = Depends(get_db)):
+    """Required-skill coverage of a job's whole applicant pool"""
+    
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    applicant_ids = (await db.scalars(select(Candidate.id).where(Candidate.job_id == job_id))).all()
+    match = candidate_skill_matrix.match(job.skills_required, keys=applicant_ids)
+    
+    # Best coverage first
+    order = np.argsort(-match["coverage"], kind="stable")[:limit]
+    
+    return {
+        "job_id": job_id,
+        "required_skills": job.skills_required,
+        "total_candidates": len(match["keys"]),
+        "candidates": [
+            {
+                "candidate_id": int(match["keys"][i]),
+                "matched_count": int(match["matched"][i]),
+                "missing_count": int(match["missing"][i]),
+                "coverage": round(float(match["coverage"][i]) * 100, 1)
+            }
+            for i in order
+        ]
     }
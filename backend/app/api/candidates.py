@@ -1,113 +1,71 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File, Form
+from typing import Any, Dict, List, Optional
+import asyncio
 import json
+import logging
+import re
+import shutil
+import uuid
+import zipfile
 from datetime import datetime
+from pathlib import Path, PurePosixPath
 
-router = APIRouter()
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-# Mock database for candidates
-candidates_db = [
-    {
-        "id": 1,
-        "name": "Sarah Johnson",
-        "email": "sarah.johnson@email.com",
-        "phone": "+1-555-0123",
-        "location": "San Francisco, CA",
-        "job_id": 1,
-        "resume_filename": "sarah_resume.pdf",
-        "overall_score": 92,
-        "verdict": "High",
-        "matched_skills": ["React", "TypeScript", "JavaScript", "CSS", "HTML"],
-        "missing_skills": ["Docker", "Kubernetes"],
-        "status": "analyzed",
-        "applied_at": "2024-01-15T10:30:00Z"
-    },
-    {
-        "id": 2,
-        "name": "Emily Rodriguez",
-        "email": "emily.rodriguez@email.com", 
-        "phone": "+1-555-0124",
-        "location": "Austin, TX",
-        "job_id": 1,
-        "resume_filename": "emily_resume.pdf",
-        "overall_score": 85,
-        "verdict": "High",
-        "matched_skills": ["React", "JavaScript", "Node.js", "CSS"],
-        "missing_skills": ["TypeScript", "GraphQL"],
-        "status": "analyzed",
-        "applied_at": "2024-01-13T14:20:00Z"
-    },
-    {
-        "id": 3,
-        "name": "Michael Chen",
-        "email": "michael.chen@email.com",
-        "phone": "+1-555-0125", 
-        "location": "New York, NY",
-        "job_id": 2,
-        "resume_filename": "michael_resume.pdf",
-        "overall_score": 78,
-        "verdict": "Medium",
-        "matched_skills": ["Python", "Django", "SQL", "Git"],
-        "missing_skills": ["React", "AWS"],
-        "status": "analyzed",
-        "applied_at": "2024-01-14T09:15:00Z"
-    },
-    {
-        "id": 4,
-        "name": "David Kim",
-        "email": "david.kim@email.com",
-        "phone": "+1-555-0126",
-        "location": "Seattle, WA", 
-        "job_id": 2,
-        "resume_filename": "david_resume.pdf",
-        "overall_score": 65,
-        "verdict": "Medium",
-        "matched_skills": ["Java", "Spring", "MySQL"],
-        "missing_skills": ["React", "JavaScript"],
-        "status": "analyzed",
-        "applied_at": "2024-01-12T16:45:00Z"
-    },
-    {
-        "id": 5,
-        "name": "Lisa Wang",
-        "email": "lisa.wang@email.com",
-        "phone": "+1-555-0127",
-        "location": "Los Angeles, CA",
-        "job_id": 1,
-        "resume_filename": "lisa_resume.pdf", 
-        "overall_score": 45,
-        "verdict": "Low",
-        "matched_skills": ["HTML", "CSS", "JavaScript"],
-        "missing_skills": ["React", "TypeScript", "Node.js"],
-        "status": "analyzed",
-        "applied_at": "2024-01-11T11:30:00Z"
-    }
-]
+from app.core.config import get_settings
+from app.core.database import SessionLocal, get_db
+from app.models.database import Candidate, Job, UploadBatch, UploadBatchItem
+from app.services.aggregates import candidate_aggregates
+from app.services.candidate_repository import (
+    compact_candidate_embeddings, count_candidates, index_candidate, index_resume_text, index_status_change,
+    list_candidates, record_index_changes, unindex_candidate
+)
+from app.services.job_queue import get_job_queue
+from app.services.parser_pool import ParserQueueFullError
+from app.services.resume_parser import parse_resume
+from app.services.skill_index import candidate_skill_index, page_after
+from app.services.text_search import get_resume_text_index
+from app.utils.filehandlers import FileTooLargeError, UploadRejectedError, extract_zip_resumes, spool_upload
+
+logger = logging.getLogger(__name__)
+
+# Resume headings that end the name at the top of a resume
+NOT_NAME_WORDS = {
+    "email", "e-mail", "phone", "mobile", "contact", "address", "resume", "cv", "curriculum",
+    "vitae", "profile", "summary", "objective", "skills", "experience", "education"
+}
+
+router = APIRouter()
 
 @router.get("/")
 async def get_candidates(
     skip: int = 0,
     limit: int = 100,
     job_id: Optional[int] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    verdict: Optional[str] = None,
+    email: Optional[str] = None,
+    cursor: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all candidates with filtering"""
-    filtered_candidates = candidates_db.copy()
-    
-    # Filter by job_id if provided
-    if job_id:
-        filtered_candidates = [c for c in filtered_candidates if c["job_id"] == job_id]
+    # Pass next_cursor back as ?cursor= for the following page; skip still works for shallow pages
+    limit = max(1, limit)
+    paginated, next_cursor = await list_candidates(
+        db, job_id=job_id or None, status=status or None, verdict=verdict or None, email=email or None,
+        after_id=cursor, skip=skip, limit=limit
+    )
     
-    # Filter by status if provided
-    if status:
-        filtered_candidates = [c for c in filtered_candidates if c["status"] == status]
-    
-    # Apply pagination
-    paginated = filtered_candidates[skip:skip + limit]
+    # Email is unique, so its page is the whole result
+    total = len(paginated) if email else await count_candidates(db, job_id or None, status or None, verdict or None)
     
     return {
-        "total": len(filtered_candidates),
-        "candidates": paginated,
+        "total": total,
+        "candidates": [c.to_dict() for c in paginated],
+        "next_cursor": next_cursor,
         "message": "Candidates retrieved successfully"
     }
 
@@ -118,83 +76,352 @@ async def upload_resume(
     phone: Optional[str] = Form(None),
     location: Optional[str] = Form(None),
     job_id: int = Form(...),
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db)
 ):
     """Upload candidate resume"""
+    settings = get_settings()
     
     # Validate file type
     if not file.filename.lower().endswith(('.pdf', '.docx', '.doc')):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
     
+    if not await db.get(Job, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
     # Check if candidate already exists
-    existing = next((c for c in candidates_db if c["email"] == email), None)
+    existing = await db.scalar(select(Candidate.id).where(Candidate.email == email))
     if existing:
         raise HTTPException(status_code=400, detail="Candidate with this email already exists")
     
+    # Stream the file to disk, checking its content type and size as it arrives
+    try:
+        resume_path, content_hash = await spool_upload(
+            file, settings.UPLOAD_DIR / "resumes", settings.ALLOWED_FILE_TYPES, settings.MAX_FILE_SIZE
+        )
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UploadRejectedError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Parse once now; every later analysis reads the stored extraction instead of the file
+    try:
+        resume_data = await parse_resume(resume_path, content_hash=content_hash)
+    except ParserQueueFullError as e:
+        await discard_upload(db, resume_path, content_hash)
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        # Unreadable document (legacy .doc, corrupt file, timeout): keep the upload; the
+        # candidate is scored on the skills on record until re-uploaded
+        logger.warning(f"Could not parse resume {file.filename}: {type(e).__name__}: {e}")
+        resume_data = None
+    
     # Create new candidate
-    candidate = {
-        "id": len(candidates_db) + 1,
-        "name": name,
-        "email": email,
-        "phone": phone,
-        "location": location,
+    candidate = Candidate(
+        name=name,
+        email=email,
+        phone=phone,
+        location=location,
+        job_id=job_id,
+        resume_filename=file.filename,
+        resume_path=str(resume_path),
+        content_hash=content_hash,
+        matched_skills=[],
+        missing_skills=[],
+        status="uploaded",
+        applied_at=datetime.now(),
+        resume_data=resume_data
+    )
+    
+    db.add(candidate)
+    try:
+        await db.flush()
+        record_index_changes(db, [candidate.id])
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        await discard_upload(db, resume_path, content_hash)
+        raise HTTPException(status_code=400, detail="Candidate with this email already exists")
+    
+    await index_candidate(candidate.to_dict(include_resume=True))
+    index_resume_text(candidate.id, (resume_data or {}).get("text", ""))
+    
+    return {
+        "message": "✅ Resume uploaded successfully",
+        "candidate": candidate.to_dict()
+    }
+
+@router.post("/bulk-upload")
+async def bulk_upload_resumes(
+    job_id: int = Form(...),
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_db)
+):
+    """Upload many resumes at once (PDF/DOCX files and/or ZIP archives of them)"""
+    settings = get_settings()
+    
+    if not await db.get(Job, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    # Stream every file (and ZIP entry) to disk under its content hash
+    resume_dir = settings.UPLOAD_DIR / "resumes"
+    staging_dir = settings.UPLOAD_DIR / "incoming" / uuid.uuid4().hex
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    entries = []
+    try:
+        for upload in files:
+            entries.extend(await store_upload(upload, resume_dir, staging_dir, settings.BULK_UPLOAD_MAX_FILES - len(entries)))
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    # Drop files we already have, by content hash, within the upload and against existing candidates
+    hashes = {entry["content_hash"] for entry in entries if entry["status"] == "stored"}
+    known = set(await db.scalars(select(Candidate.content_hash).where(Candidate.content_hash.in_(hashes)))) if hashes else set()
+    seen = set()
+    for entry in entries:
+        if entry["status"] != "stored":
+            continue
+        if entry["content_hash"] in known or entry["content_hash"] in seen:
+            entry.update(status="duplicate", detail="Same file as an existing resume")
+        seen.add(entry["content_hash"])
+    
+    batch = UploadBatch(id=uuid.uuid4().hex, job_id=job_id, total=len(entries))
+    items = [
+        UploadBatchItem(
+            batch_id=batch.id,
+            filename=entry["filename"][:255],
+            content_hash=entry.get("content_hash"),
+            status="queued" if entry["status"] == "stored" else entry["status"],
+            detail=entry.get("detail")
+        )
+        for entry in entries
+    ]
+    db.add(batch)
+    db.add_all(items)
+    await db.commit()
+    
+    # One parse job per new file; parsing also warms the parse cache for later analysis
+    queue = get_job_queue()
+    for item, entry in zip(items, entries):
+        if item.status == "queued":
+            payload = {"item_id": item.id, "resume_path": str(entry["path"])}
+            await asyncio.to_thread(queue.enqueue, "parse_resume", payload, f"parse_resume:{item.id}")
+    
+    counts = upload_batch_counts(items)
+    return {
+        "message": f"🔄 {counts['queued']} resumes queued for parsing",
+        "batch_id": batch.id,
         "job_id": job_id,
-        "resume_filename": file.filename,
-        "overall_score": None,
-        "verdict": None,
-        "matched_skills": [],
-        "missing_skills": [],
-        "status": "uploaded",
-        "applied_at": datetime.now().isoformat()
+        "total": len(items),
+        "queued": counts["queued"],
+        "duplicates": counts["duplicate"],
+        "skipped": counts["skipped"]
     }
+
+@router.get("/bulk-upload/{batch_id}")
+async def get_bulk_upload_status(batch_id: str, db: AsyncSession = Depends(get_db)):
+    """Progress and per-file outcome of a bulk upload"""
+    batch = await db.get(UploadBatch, batch_id)
     
-    candidates_db.append(candidate)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Upload batch not found")
+    
+    items = (await db.scalars(
+        select(UploadBatchItem).where(UploadBatchItem.batch_id == batch_id).order_by(UploadBatchItem.id)
+    )).all()
+    counts = upload_batch_counts(items)
     
     return {
-        "message": "✅ Resume uploaded successfully",
-        "candidate": candidate
+        "batch": batch.to_dict(),
+        "status": "processing" if counts["queued"] else "completed",
+        "progress": counts,
+        "files": [item.to_dict() for item in items]
     }
 
+async def store_upload(upload: UploadFile, resume_dir: Path, staging_dir: Path, max_files: int) -> List[Dict[str, Any]]:
+    """Store one uploaded file (or each resume inside an uploaded ZIP) in ``resume_dir``"""
+    settings = get_settings()
+    filename = PurePosixPath(upload.filename or "").name
+    
+    if max_files <= 0:
+        return [{"filename": filename, "status": "skipped", "detail": f"Upload has more than {settings.BULK_UPLOAD_MAX_FILES} files"}]
+    
+    try:
+        if filename.lower().endswith(".zip"):
+            archive_path, _ = await spool_upload(upload, staging_dir, [".zip"], settings.MAX_ARCHIVE_SIZE)
+            return await asyncio.to_thread(
+                extract_zip_resumes, archive_path, resume_dir, settings.ALLOWED_FILE_TYPES, max_files, settings.MAX_FILE_SIZE
+            )
+        path, content_hash = await spool_upload(upload, resume_dir, settings.ALLOWED_FILE_TYPES, settings.MAX_FILE_SIZE)
+    except (UploadRejectedError, zipfile.BadZipFile) as e:
+        return [{"filename": filename, "status": "skipped", "detail": str(e)}]
+    return [{"filename": filename, "status": "stored", "path": path, "content_hash": content_hash}]
+
+async def discard_upload(db: AsyncSession, resume_path: Path, content_hash: str):
+    """Delete a stored resume that no candidate or queued bulk upload uses (files are shared by content hash)"""
+    in_use = await db.scalar(select(Candidate.id).where(Candidate.content_hash == content_hash).limit(1))
+    if in_use is None:
+        in_use = await db.scalar(
+            select(UploadBatchItem.id)
+            .where(UploadBatchItem.content_hash == content_hash, UploadBatchItem.status == "queued")
+            .limit(1)
+        )
+    if in_use is None:
+        resume_path.unlink(missing_ok=True)
+
+def upload_batch_counts(items: List[UploadBatchItem]) -> Dict[str, int]:
+    counts = {status: 0 for status in ("queued", "created", "duplicate", "skipped", "failed")}
+    for item in items:
+        counts[item.status] = counts.get(item.status, 0) + 1
+    return counts
+
+def guess_candidate_name(text: str, filename: str) -> str:
+    """Candidate name from the words the resume opens with, else from the file name"""
+    words = []
+    for word in text.split()[:3]:
+        if not re.fullmatch(r"[A-Za-z][A-Za-z.'-]*", word) or word.lower() in NOT_NAME_WORDS:
+            break
+        words.append(word.capitalize() if word.isupper() else word)
+    if len(words) >= 2:
+        return " ".join(words)
+    stem = re.sub(r"(?i)[\s_-]*(resume|cv)[\s_-]*", " ", PurePosixPath(filename).stem)
+    return " ".join(re.split(r"[\s_.-]+", stem)).strip().title() or "Unknown Candidate"
+
+async def run_parse_job(payload: Dict[str, Any]):
+    """Queue handler for "parse_resume" jobs: parse a bulk-uploaded resume and create its candidate"""
+    async with SessionLocal() as db:
+        item = await db.get(UploadBatchItem, payload["item_id"])
+        if not item or item.status != "queued":
+            return
+        batch = await db.get(UploadBatch, item.batch_id)
+    
+    try:
+        parsed = await parse_resume(Path(payload["resume_path"]), content_hash=item.content_hash)
+    except ParserQueueFullError:
+        raise  # busy or restarted parser: the queue retries later
+    except Exception as e:
+        # Unreadable, unsupported or hanging documents will not parse on a retry either
+        await finish_upload_item(item.id, "failed", detail=str(e) or type(e).__name__)
+        return
+    
+    contact = parsed.get("contact_info") or {}
+    email = (contact.get("email") or "").strip()
+    if not email:
+        await finish_upload_item(item.id, "failed", detail="No email address found in resume")
+        return
+    
+    async with SessionLocal() as db:
+        # Same file or same person as an existing candidate
+        duplicate = await db.scalar(
+            select(Candidate.id).where(or_(Candidate.content_hash == item.content_hash, Candidate.email == email))
+        )
+        if duplicate:
+            await finish_upload_item(item.id, "duplicate", candidate_id=duplicate, detail="Candidate already exists")
+            return
+        
+        candidate = Candidate(
+            name=guess_candidate_name(parsed.get("text", ""), item.filename),
+            email=email,
+            phone=contact.get("phone") or None,
+            job_id=batch.job_id if batch else None,
+            resume_filename=item.filename,
+            resume_path=payload["resume_path"],
+            content_hash=item.content_hash,
+            matched_skills=[],
+            missing_skills=[],
+            status="uploaded",
+            applied_at=datetime.now(),
+            resume_data=parsed
+        )
+        db.add(candidate)
+        try:
+            await db.flush()
+            record_index_changes(db, [candidate.id])
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            await finish_upload_item(item.id, "duplicate", detail="Candidate already exists")
+            return
+    
+    # Index before reporting the file done, so a completed batch is fully searchable
+    await index_candidate(candidate.to_dict(include_resume=True))
+    index_resume_text(candidate.id, parsed.get("text", ""))
+    await finish_upload_item(item.id, "created", candidate_id=candidate.id)
+
+async def parse_job_failed(payload: Dict[str, Any]):
+    """Queue handler for a parse job that ran out of attempts"""
+    await finish_upload_item(payload["item_id"], "failed", detail="Resume could not be parsed")
+
+async def finish_upload_item(item_id: int, status: str, candidate_id: Optional[int] = None, detail: Optional[str] = None):
+    async with SessionLocal() as db:
+        item = await db.get(UploadBatchItem, item_id)
+        if item:
+            item.status = status
+            item.candidate_id = candidate_id
+            item.detail = detail
+            await db.commit()
+
 @router.get("/{candidate_id}")
-async def get_candidate(candidate_id: int):
+async def get_candidate(candidate_id: int, db: AsyncSession = Depends(get_db)):
     """Get specific candidate"""
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
+    candidate = await db.get(Candidate, candidate_id)
+    
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    
+    return candidate.to_dict()
+
+@router.get("/{candidate_id}/resume")
+async def get_candidate_resume(candidate_id: int, db: AsyncSession = Depends(get_db)):
+    """Structured data extracted from a candidate's resume at upload"""
+    candidate = await db.get(Candidate, candidate_id, options=[undefer(Candidate.resume_data)])
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
+    if candidate.resume_data is None:
+        raise HTTPException(status_code=404, detail="Resume could not be parsed")
     
-    return candidate
+    return {
+        "candidate_id": candidate.id,
+        "resume_filename": candidate.resume_filename,
+        "resume_data": candidate.resume_data
+    }
 
 @router.patch("/{candidate_id}/status")
-async def update_candidate_status(candidate_id: int, status: str):
+async def update_candidate_status(candidate_id: int, status: str, db: AsyncSession = Depends(get_db)):
     """Update candidate status"""
     valid_statuses = ["uploaded", "analyzed", "shortlisted", "rejected", "hired"]
     
     if status not in valid_statuses:
         raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
     
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
+    candidate = await db.get(Candidate, candidate_id)
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    candidate["status"] = status
+    candidate.status = status
+    record_index_changes(db, [candidate_id])
+    await db.commit()
+    index_status_change([candidate_id], status)
     return {
         "message": f"✅ Status updated to {status}",
-        "candidate": candidate
+        "candidate": candidate.to_dict()
     }
 
 @router.get("/stats/dashboard")
-async def get_dashboard_stats():
+async def get_dashboard_stats(db: AsyncSession = Depends(get_db)):
     """Get dashboard statistics for candidate overview"""
-    total = len(candidates_db)
-    high_match = len([c for c in candidates_db if c.get("verdict") == "High"])
-    medium_match = len([c for c in candidates_db if c.get("verdict") == "Medium"]) 
-    low_match = len([c for c in candidates_db if c.get("verdict") == "Low"])
+    # Maintained incrementally, so this does not scan the candidates table
+    pool = candidate_aggregates.pool()
+    total = pool.total()
+    verdicts = pool.verdicts()
+    high_match = verdicts.get("High", 0)
+    medium_match = verdicts.get("Medium", 0)
+    low_match = verdicts.get("Low", 0)
     
     # Calculate average score
-    scores = [c["overall_score"] for c in candidates_db if c["overall_score"] is not None]
-    avg_score = sum(scores) / len(scores) if scores else 0
+    avg_score = pool.average_score()
     
     return {
         "total_candidates": total,
@@ -205,15 +432,74 @@ async def get_dashboard_stats():
         "avg_score": round(avg_score, 1)
     }
 
+def split_skills(value: Optional[str]) -> List[str]:
+    """Skills from a comma-separated query parameter"""
+    return [skill.strip() for skill in (value or "").split(",") if skill.strip()]
+
+@router.get("/search/skills")
+async def search_candidates_by_skill(
+    skills: Optional[str] = None,
+    any_skills: Optional[str] = None,
+    exclude: Optional[str] = None,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db)
+):
+    """Find candidates with all of ``skills``, at least one of ``any_skills`` and none of ``exclude`` (comma-separated)"""
+    all_of, any_of, none_of = split_skills(skills), split_skills(any_skills), split_skills(exclude)
+    if not (all_of or any_of or none_of):
+        raise HTTPException(status_code=400, detail="Give at least one of skills, any_skills or exclude")
+    
+    matches = candidate_skill_index.search(all_of=all_of, any_of=any_of, none_of=none_of)
+    page, next_cursor = page_after(matches, cursor, max(1, limit))
+    by_id = {c.id: c.to_dict() for c in await db.scalars(select(Candidate).where(Candidate.id.in_(page)))}
+    
+    return {
+        "query": {"skills": all_of, "any_skills": any_of, "exclude": none_of},
+        "total": len(matches),
+        "candidates": [by_id[candidate_id] for candidate_id in page if candidate_id in by_id],
+        "next_cursor": next_cursor
+    }
+
+@router.get("/search/text")
+async def search_candidates_by_text(
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    match_all: bool = False,
+    db: AsyncSession = Depends(get_db)
+):
+    """Rank candidates by BM25 relevance of their resume text to a free-text query"""
+    limit, offset = max(1, min(limit, 100)), max(0, offset)
+    hits, total = await asyncio.to_thread(get_resume_text_index().search, q, limit, offset, match_all)
+    
+    ids = [hit["candidate_id"] for hit in hits]
+    by_id = {c.id: c.to_dict() for c in await db.scalars(select(Candidate).where(Candidate.id.in_(ids)))} if ids else {}
+    
+    return {
+        "query": q,
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "candidates": [
+            {**by_id[hit["candidate_id"]], "relevance": hit["relevance"], "snippet": hit["snippet"]}
+            for hit in hits
+            if hit["candidate_id"] in by_id
+        ]
+    }
+
 @router.delete("/{candidate_id}")
-async def delete_candidate(candidate_id: int):
+async def delete_candidate(candidate_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
     """Delete a candidate"""
-    global candidates_db
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
+    candidate = await db.get(Candidate, candidate_id)
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    candidates_db = [c for c in candidates_db if c["id"] != candidate_id]
+    await db.delete(candidate)
+    record_index_changes(db, [candidate_id])
+    await db.commit()
+    unindex_candidate(candidate_id)
+    background_tasks.add_task(compact_candidate_embeddings)
     
-    return {"message": f"✅ Candidate {candidate['name']} deleted successfully"}
+    return {"message": f"✅ Candidate {candidate.name} deleted successfully"}
@@ -1,8 +1,21 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
 from typing import List, Optional
+import asyncio
 from pydantic import BaseModel
 from datetime import datetime
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.database import Candidate, Job
+
+from app.services.ai_engine import get_embedding_engine, job_embedding_text
+from app.services.ann_index import get_candidate_index
+from app.services.candidate_repository import record_index_changes, unindex_job
+from app.services.embedding_store import get_embedding_store, stored_embeddings
+from app.services.leaderboard import job_leaderboards
+
 router = APIRouter()
 
 class JobCreate(BaseModel):
@@ -28,104 +41,70 @@ class JobUpdate(BaseModel):
     experience_max: Optional[int] = None
     is_active: Optional[bool] = None
 
-# Mock jobs database
-jobs_db = [
-    {
-        "id": 1,
-        "title": "Frontend Developer",
-        "company": "Tech Corp",
-        "description": "We are looking for a skilled React developer to join our dynamic team. The ideal candidate will have experience building responsive web applications using modern frontend technologies.",
-        "requirements": "Bachelor's degree in Computer Science or related field. Strong problem-solving skills and attention to detail.",
-        "skills_required": ["React", "JavaScript", "HTML", "CSS", "TypeScript"],
-        "skills_preferred": ["Node.js", "GraphQL", "Docker", "AWS", "Jest"],
-        "location": "Remote",
-        "experience_min": 2,
-        "experience_max": 5,
-        "is_active": True,
-        "created_at": "2024-01-10T09:00:00Z",
-        "candidates_count": 3
-    },
-    {
-        "id": 2,
-        "title": "Python Developer",
-        "company": "AI Solutions",
-        "description": "Seeking an experienced Python developer for ML and backend development projects. You will work on cutting-edge AI applications and scalable web services.",
-        "requirements": "3+ years of Python development experience. Experience with machine learning frameworks preferred.",
-        "skills_required": ["Python", "Django", "PostgreSQL", "Git"],
-        "skills_preferred": ["Machine Learning", "TensorFlow", "Docker", "Redis", "Celery"],
-        "location": "Bangalore, India",
-        "experience_min": 3,
-        "experience_max": 7,
-        "is_active": True,
-        "created_at": "2024-01-08T14:30:00Z",
-        "candidates_count": 2
-    },
-    {
-        "id": 3,
-        "title": "Full Stack Developer",
-        "company": "StartupXYZ",
-        "description": "Join our fast-growing startup as a full-stack developer. Work on both frontend and backend technologies to build innovative products.",
-        "requirements": "Experience with both frontend and backend technologies. Startup mindset and ability to work in a fast-paced environment.",
-        "skills_required": ["JavaScript", "React", "Node.js", "MongoDB"],
-        "skills_preferred": ["TypeScript", "AWS", "Docker", "Redis"],
-        "location": "San Francisco, CA",
-        "experience_min": 1,
-        "experience_max": 4,
-        "is_active": True,
-        "created_at": "2024-01-12T11:15:00Z",
-        "candidates_count": 0
-    }
-]
+def index_job_embeddings(jobs: List[dict]):
+    """Embed jobs whose text is new or changed into the job embedding store"""
+    texts = {job["id"]: job_embedding_text(job) for job in jobs}
+    get_embedding_store("jobs").sync(texts, get_embedding_engine())
+
+async def jobs_with_counts(db: AsyncSession, jobs: List[Job]) -> List[dict]:
+    """Job dicts with their applicant counts (one grouped query on candidates.job_id)"""
+    ids = [job.id for job in jobs]
+    counts = dict((await db.execute(
+        select(Candidate.job_id, func.count()).where(Candidate.job_id.in_(ids)).group_by(Candidate.job_id)
+    )).all()) if ids else {}
+    return [{**job.to_dict(), "candidates_count": counts.get(job.id, 0)} for job in jobs]
 
 @router.get("/")
-async def get_jobs(skip: int = 0, limit: int = 100, is_active: Optional[bool] = None):
+async def get_jobs(skip: int = 0, limit: int = 100, is_active: Optional[bool] = None, db: AsyncSession = Depends(get_db)):
     """Get all job descriptions"""
-    filtered_jobs = jobs_db.copy()
+    query = select(Job)
     
     # Filter by active status if provided
     if is_active is not None:
-        filtered_jobs = [job for job in filtered_jobs if job["is_active"] == is_active]
+        query = query.where(Job.is_active == is_active)
+    
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
     
     # Apply pagination
-    paginated = filtered_jobs[skip:skip + limit]
+    paginated = (await db.scalars(query.order_by(Job.id).offset(skip).limit(limit))).all()
     
     return {
-        "total": len(filtered_jobs),
-        "jobs": paginated
+        "total": total,
+        "jobs": await jobs_with_counts(db, paginated)
     }
 
 @router.post("/")
-async def create_job(job: JobCreate):
+async def create_job(job: JobCreate, db: AsyncSession = Depends(get_db)):
     """Create new job description"""
-    new_job = {
-        "id": len(jobs_db) + 1,
+    new_job = Job(
         **job.dict(),
-        "is_active": True,
-        "created_at": datetime.now().isoformat(),
-        "candidates_count": 0
-    }
+        is_active=True,
+        created_at=datetime.now()
+    )
     
-    jobs_db.append(new_job)
+    db.add(new_job)
+    await db.commit()
+    await asyncio.to_thread(index_job_embeddings, [new_job.to_dict()])
     
     return {
         "message": "✅ Job created successfully",
-        "job": new_job
+        "job": {**new_job.to_dict(), "candidates_count": 0}
     }
 
 @router.get("/{job_id}")
-async def get_job(job_id: int):
+async def get_job(job_id: int, db: AsyncSession = Depends(get_db)):
     """Get specific job"""
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return job
+    return (await jobs_with_counts(db, [job]))[0]
 
 @router.patch("/{job_id}")
-async def update_job(job_id: int, job_update: JobUpdate):
+async def update_job(job_id: int, job_update: JobUpdate, db: AsyncSession = Depends(get_db)):
     """Update job description"""
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -133,56 +112,132 @@ async def update_job(job_id: int, job_update: JobUpdate):
     # Update only provided fields
     update_data = job_update.dict(exclude_unset=True)
     for field, value in update_data.items():
-        job[field] = value
+        setattr(job, field, value)
+    await db.commit()
+    await asyncio.to_thread(index_job_embeddings, [job.to_dict()])
     
     return {
         "message": "✅ Job updated successfully",
-        "job": job
+        "job": (await jobs_with_counts(db, [job]))[0]
     }
 
 @router.delete("/{job_id}")
-async def delete_job(job_id: int):
+async def delete_job(job_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
     """Delete job description"""
-    global jobs_db
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    jobs_db = [j for j in jobs_db if j["id"] != job_id]
+    await db.delete(job)
+    record_index_changes(db, job_id=job_id)
+    await db.commit()
+    get_embedding_store("jobs").delete(job_id)
+    unindex_job(job_id)
+    background_tasks.add_task(get_embedding_store("jobs").compact_if_needed)
     
-    return {"message": f"✅ Job '{job['title']}' deleted successfully"}
+    return {"message": f"✅ Job '{job.title}' deleted successfully"}
 
 @router.patch("/{job_id}/toggle-status")
-async def toggle_job_status(job_id: int):
+async def toggle_job_status(job_id: int, db: AsyncSession = Depends(get_db)):
     """Toggle job active/inactive status"""
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job["is_active"] = not job["is_active"]
-    status = "activated" if job["is_active"] else "deactivated"
+    job.is_active = not job.is_active
+    await db.commit()
+    status = "activated" if job.is_active else "deactivated"
     
     return {
         "message": f"✅ Job {status} successfully",
-        "job": job
+        "job": (await jobs_with_counts(db, [job]))[0]
     }
 
 @router.get("/{job_id}/candidates")
-async def get_job_candidates(job_id: int):
+async def get_job_candidates(job_id: int, db: AsyncSession = Depends(get_db)):
     """Get candidates for specific job"""
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    
-    job = next((j for j in jobs_db if j["id"] == job_id), None)
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job_candidates = [c for c in candidates_db if c["job_id"] == job_id]
+    job_candidates = (await db.scalars(select(Candidate).where(Candidate.job_id == job_id).order_by(Candidate.id))).all()
     
     return {
-        "job": job,
+        "job": {**job.to_dict(), "candidates_count": len(job_candidates)},
         "total_candidates": len(job_candidates),
-        "candidates": job_candidates
-    }
\ No newline at end of file
+        "candidates": [c.to_dict() for c in job_candidates]
+    }
+
+@router.get("/{job_id}/top-candidates")
+async def get_top_candidates(job_id: int, k: int = 10, db: AsyncSession = Depends(get_db)):
+    """Best-matching candidates for a job by resume embedding, whether or not they applied"""
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    job_vector = (await asyncio.to_thread(stored_embeddings, "jobs", {job_id: job_embedding_text(job.to_dict())}))[0]
+    keys, similarities = await asyncio.to_thread(get_candidate_index().search, job_vector, k)
+    
+    by_id = {c.id: c.to_dict() for c in await db.scalars(select(Candidate).where(Candidate.id.in_(keys)))}
+    matches = [
+        {
+            **by_id[key],
+            "similarity": round(float(similarity) * 100, 1),
+            "applied": by_id[key]["job_id"] == job_id
+        }
+        for key, similarity in zip(keys, similarities)
+        if key in by_id
+    ]
+    
+    return {
+        "job": job.to_dict(),
+        "total_candidates": len(matches),
+        "candidates": matches
+    }
+
+@router.get("/{job_id}/leaderboard")
+async def get_job_leaderboard(job_id: int, offset: int = 0, limit: int = 20, db: AsyncSession = Depends(get_db)):
+    """Applicants of a job ranked by overall score, one page at a time"""
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    offset, limit = max(0, offset), max(1, min(limit, 100))
+    board = job_leaderboards.get(job_id)
+    page = [candidate_id for candidate_id, _ in board.top(limit, offset=offset)]
+    by_id = {c.id: c.to_dict() for c in await db.scalars(select(Candidate).where(Candidate.id.in_(page)))}
+    
+    return {
+        "job": job.to_dict(),
+        "total_ranked": len(board),
+        "offset": offset,
+        "limit": limit,
+        "candidates": [
+            {**by_id[candidate_id], "rank": offset + position + 1}
+            for position, candidate_id in enumerate(page)
+            if candidate_id in by_id
+        ]
+    }
+
+@router.get("/{job_id}/leaderboard/{candidate_id}")
+async def get_candidate_rank(job_id: int, candidate_id: int, db: AsyncSession = Depends(get_db)):
+    """A candidate's rank among a job's scored applicants"""
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    board = job_leaderboards.get(job_id)
+    rank = board.rank(candidate_id)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="Candidate has no score for this job")
+    
+    return {
+        "job_id": job_id,
+        "candidate_id": candidate_id,
+        "rank": rank,
+        "overall_score": board.score(candidate_id),
+        "total_ranked": len(board),
+        "percentile": round(100 * (len(board) - rank) / len(board), 1)
+    }
@@ -1,30 +1,35 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, Any, List
 import random
 from datetime import datetime, timedelta
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.database import Candidate, Job
+from app.services.aggregates import candidate_aggregates
+from app.services.skill_index import candidate_skill_index
+from app.services.skill_taxonomy import skill_taxonomy
+
 router = APIRouter()
 
 @router.get("/dashboard")
-async def get_dashboard_data():
+async def get_dashboard_data(db: AsyncSession = Depends(get_db)):
     """Get comprehensive dashboard analytics data"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    from app.api.jobs import jobs_db
-    
-    # Calculate real statistics from mock data
-    total_candidates = len(candidates_db)
-    analyzed_candidates = [c for c in candidates_db if c["status"] == "analyzed"]
+    # Calculate real statistics from the maintained candidate aggregates
+    pool = candidate_aggregates.pool()
+    total_candidates = pool.total()
     
     # Calculate scores
-    scores = [c["overall_score"] for c in analyzed_candidates if c["overall_score"] is not None]
-    avg_score = sum(scores) / len(scores) if scores else 0
+    avg_score = pool.average_score(status="analyzed")
     
     # Count verdicts
-    high_matches = len([c for c in analyzed_candidates if c.get("verdict") == "High"])
-    medium_matches = len([c for c in analyzed_candidates if c.get("verdict") == "Medium"])
-    low_matches = len([c for c in analyzed_candidates if c.get("verdict") == "Low"])
+    verdicts = pool.verdicts(status="analyzed")
+    high_matches = verdicts.get("High", 0)
+    medium_matches = verdicts.get("Medium", 0)
+    low_matches = verdicts.get("Low", 0)
     
     return {
         "overview": {
@@ -34,7 +39,7 @@ async def get_dashboard_data():
             "medium_matches": medium_matches,
             "low_matches": low_matches,
             "time_saved": "156h",
-            "active_jobs": len([j for j in jobs_db if j["is_active"]])
+            "active_jobs": await db.scalar(select(func.count(Job.id)).where(Job.is_active.is_(True)))
         },
         "skills_analysis": generate_skills_analysis(),
         "screening_performance": {
@@ -43,7 +48,7 @@ async def get_dashboard_data():
             "false_positives": "3.8%",
             "candidates_per_hour": 45
         },
-        "recent_activity": get_recent_activity(),
+        "recent_activity": await get_recent_activity(db),
         "monthly_trends": generate_monthly_trends()
     }
 
@@ -78,45 +83,42 @@ async def get_detailed_analytics():
     }
 
 @router.get("/skills-analysis")
-async def get_skills_analysis():
+async def get_skills_analysis(db: AsyncSession = Depends(get_db)):
     """Get detailed skills analysis report"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    from app.api.jobs import jobs_db
-    
     # Analyze skills from real data
     all_job_skills = []
-    for job in jobs_db:
-        all_job_skills.extend(job["skills_required"])
-        all_job_skills.extend(job.get("skills_preferred", []))
+    for skills_required, skills_preferred in await db.execute(select(Job.skills_required, Job.skills_preferred)):
+        all_job_skills.extend(skills_required or [])
+        all_job_skills.extend(skills_preferred or [])
     
-    all_candidate_skills = []
-    for candidate in candidates_db:
-        all_candidate_skills.extend(candidate.get("matched_skills", []))
+    # Candidate skill frequencies come straight from the inverted skill index
+    candidate_pool = len(candidate_skill_index)
     
-    # Count skill frequencies
+    # Count skill frequencies (by canonical name, so "NodeJS" and "Node.js" are one skill)
     skill_demand = {}
     for skill in all_job_skills:
+        skill = skill_taxonomy.canonical(skill)
         skill_demand[skill] = skill_demand.get(skill, 0) + 1
     
-    skill_availability = {}
-    for skill in all_candidate_skills:
-        skill_availability[skill] = skill_availability.get(skill, 0) + 1
-    
     # Get top skills
     top_demanded = sorted(skill_demand.items(), key=lambda x: x[1], reverse=True)[:10]
-    top_available = sorted(skill_availability.items(), key=lambda x: x[1], reverse=True)[:10]
+    top_available = candidate_skill_index.most_common(10)
     
     return {
         "most_demanded_skills": [
             {
                 "skill": skill,
+                "category": skill_taxonomy.category(skill),
                 "demand_count": count,
-                "availability_percentage": random.randint(40, 80)
+                "availability_percentage": round(100 * candidate_skill_index.count(skill) / candidate_pool) if candidate_pool else 0
             }
             for skill, count in top_demanded
         ],
+        "most_available_skills": [
+            {"skill": skill, "category": skill_taxonomy.category(skill), "candidate_count": count}
+            for skill, count in top_available
+        ],
         "skill_gaps": generate_skill_gaps(),
         "emerging_skills": [
             {"skill": "Kubernetes", "growth": "+45%"},
@@ -157,18 +159,15 @@ async def get_hiring_trends():
     }
 
 @router.get("/candidate-insights/{candidate_id}")
-async def get_candidate_insights(candidate_id: int):
+async def get_candidate_insights(candidate_id: int, db: AsyncSession = Depends(get_db)):
     """Get detailed insights for specific candidate"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    
-    candidate = next((c for c in candidates_db if c["id"] == candidate_id), None)
+    candidate = await db.get(Candidate, candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
     return {
-        "candidate": candidate,
+        "candidate": candidate.to_dict(),
         "strengths": [
             "Strong technical skills in required technologies",
             "Relevant project experience",
@@ -212,25 +211,18 @@ def generate_skills_analysis():
         "well_supplied_skills": sorted(skills, key=lambda x: x["gap"])[:3]
     }
 
-def get_recent_activity():
+async def get_recent_activity(db: AsyncSession):
     """Get recent screening activity"""
     
-    # Import here to avoid circular imports
-    from app.api.candidates import candidates_db
-    
-    recent_candidates = sorted(
-        candidates_db, 
-        key=lambda x: x.get("applied_at", ""), 
-        reverse=True
-    )[:10]
+    recent_candidates = (await db.scalars(select(Candidate).order_by(Candidate.applied_at.desc()).limit(10))).all()
     
     return [
         {
-            "id": c["id"],
-            "candidate": c["name"],
+            "id": c.id,
+            "candidate": c.name,
             "role": "Software Developer",  # Could be enhanced with job lookup
-            "score": c.get("overall_score", 0),
-            "verdict": c.get("verdict", "Pending"),
+            "score": c.overall_score,
+            "verdict": c.verdict,
             "time": "2 hours ago"  # Could be calculated from applied_at
         }
         for c in recent_candidates
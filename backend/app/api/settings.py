@@ -2,6 +2,8 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
 
+from app.core.config import get_settings
+
 router = APIRouter()
 
 class UserProfile(BaseModel):
@@ -259,13 +261,13 @@ async def get_validation_rules():
             "manual_review": current_settings["screening"]["require_manual_review_above"]
         },
         "file_upload_rules": {
-            "max_file_size": "10MB",
-            "allowed_formats": [".pdf", ".docx", ".doc"],
+            "max_file_size": f"{get_settings().MAX_FILE_SIZE // (1024 * 1024)}MB",
+            "allowed_formats": get_settings().ALLOWED_FILE_TYPES,
             "max_files_per_candidate": 1
         },
         "analysis_rules": {
             "max_processing_time": "5 minutes",
-            "retry_attempts": 3,
+            "retry_attempts": get_settings().QUEUE_MAX_ATTEMPTS,
             "confidence_threshold": 0.7
         }
     }
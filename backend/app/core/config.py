@@ -11,6 +11,11 @@ class Settings(BaseSettings):
     
     # Database Settings
     DATABASE_URL: str = "sqlite:///./resumeiq.db"
+    DB_POOL_SIZE: int = 5  # connections kept open in the pool
+    DB_MAX_OVERFLOW: int = 10  # extra connections allowed under load
+    DB_POOL_RECYCLE: int = 1800  # seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING: bool = True  # check connections before handing them out
+    DB_SEED_DEMO_DATA: bool = True  # load the demo jobs/candidates into an empty database
     
     # CORS Settings
     ALLOWED_ORIGINS: List[str] = [
@@ -25,11 +30,24 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     UPLOAD_DIR: Path = Path("uploads")
     ALLOWED_FILE_TYPES: List[str] = [".pdf", ".docx", ".doc"]
+    BULK_UPLOAD_MAX_FILES: int = 1000  # resumes accepted from one bulk upload (ZIP entries included)
+    MAX_ARCHIVE_SIZE: int = 500 * 1024 * 1024  # 500MB per ZIP archive in a bulk upload
+    PDF_MAX_PAGES: int = 20  # stop reading a PDF after this many pages
+    PDF_MAX_CHARS: int = 100_000  # ...or once this much text was extracted
+    PDF_MIN_TEXT_CHARS: int = 200  # below this, fall back to the next PDF backend
+    PDF_MIN_WORDS_PER_PAGE: int = 25  # ...or below this many words per page
     
     # AI/ML Settings
     OPENAI_API_KEY: str = ""  # Set in .env file
     HUGGINGFACE_API_KEY: str = ""  # Set in .env file
     EMBEDDING_MODEL: str = "sentence-transformers/all-mpnet-base-v2"
+    EMBEDDING_BACKEND: str = "auto"  # "auto" (model if available locally) or "hashed"
+    EMBEDDING_BATCH_SIZE: int = 32
+    EMBEDDING_FALLBACK_DIM: int = 512  # hashed TF-IDF vector size
+    EMBEDDING_IDF_REFIT_GROWTH: float = 2.0  # refit hashed TF-IDF weights at startup once the corpus grew this many times
+    EMBEDDING_STORE_COMPACT_RATIO: float = 0.25  # compact once this share of stored rows is dead
+    ANN_MIN_TRAIN_SIZE: int = 1024  # below this many resumes, top-k search is an exact scan
+    ANN_PROBES: int = 8  # inverted lists scanned per query
     
     # Scoring Weights
     HARD_MATCH_WEIGHT: float = 0.4
@@ -37,7 +55,29 @@ class Settings(BaseSettings):
     
     # Analysis Settings
     MAX_ANALYSIS_TIME: int = 300  # 5 minutes in seconds
-    BATCH_SIZE: int = 10
+    BATCH_SIZE: int = 10  # candidates scored per vectorized call in a batch analysis
+    BATCH_CONCURRENCY: int = 4  # chunks of one batch analysed at the same time
+    EVENTS_QUEUE_SIZE: int = 1000  # buffered events per progress-stream subscriber
+    EVENTS_HEARTBEAT_INTERVAL: float = 15.0  # seconds between keep-alives on an idle stream
+    
+    # Analysis Job Queue (SQLite under UPLOAD_DIR, or Redis when REDIS_ENABLED)
+    QUEUE_VISIBILITY_TIMEOUT: int = 600  # a claimed job is handed out again after this many seconds
+    QUEUE_MAX_ATTEMPTS: int = 3
+    QUEUE_RETRY_DELAY: float = 5.0  # seconds before the first retry, doubled on each later one
+    QUEUE_POLL_INTERVAL: float = 1.0  # idle workers check the queue this often
+    QUEUE_EMBEDDED_WORKERS: int = 1  # workers run inside the API process (0 = standalone workers only)
+    QUEUE_WORKER_CONCURRENCY: int = 2  # jobs a standalone worker process runs at once
+    INDEX_SYNC_INTERVAL: float = 1.0  # the API replays other processes' candidate writes this often
+    INDEX_CHANGES_RETENTION: int = 3600  # seconds a logged candidate write is kept for replay
+    
+    # Resume Parsing Pool
+    PARSER_WORKERS: int = 2  # parser processes
+    PARSER_QUEUE_DEPTH: int = 32  # documents allowed to wait for a free worker
+    PARSER_MAX_TASKS_PER_WORKER: int = 50  # recycle a worker after this many documents
+    
+    # Parse Cache (keyed by resume content hash)
+    PARSE_CACHE_MEMORY_ITEMS: int = 256  # parsed resumes kept in memory
+    PARSE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # on-disk tier under UPLOAD_DIR
     
     # Security Settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -0,0 +1,68 @@
+from typing import AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.core.config import get_settings
+
+# Async driver used for each database backend named in DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+class Base(DeclarativeBase):
+    """Declarative base for all ORM models"""
+
+def async_database_url(url: str) -> str:
+    """Rewrite a DATABASE_URL to its async driver (sqlite -> aiosqlite, postgresql -> asyncpg)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in ASYNC_DRIVERS and parsed.get_driver_name() != ASYNC_DRIVERS[backend]:
+        parsed = parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return parsed.render_as_string(hide_password=False)
+
+def _engine_options(url: str) -> dict:
+    settings = get_settings()
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if url.startswith("sqlite") and ":memory:" in url:
+        return options
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE
+    )
+    return options
+
+_url = async_database_url(get_settings().DATABASE_URL)
+engine = create_async_engine(_url, **_engine_options(_url))
+
+@event.listens_for(engine.sync_engine, "connect")
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    """Enforce foreign keys and use WAL so readers don't block the writer"""
+    if engine.dialect.name == "sqlite":
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: one pooled async session per request"""
+    async with SessionLocal() as db:
+        yield db
+
+async def init_db():
+    """Create tables (and demo data for an empty database)"""
+    # Import here to avoid circular imports
+    from app.models import database  # noqa: F401  (registers the ORM models)
+    from app.models.seed import seed_database
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    if get_settings().DB_SEED_DEMO_DATA:
+        async with SessionLocal() as db:
+            await seed_database(db)
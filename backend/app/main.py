@@ -1,9 +1,90 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+from sqlalchemy import select
+from sqlalchemy.orm import defer, undefer
 
 # Import API routers
 from app.api import candidates, jobs, analysis, reports, settings
+from app.core.database import SessionLocal, engine, init_db
+from app.models.database import AnalysisResult, Candidate, Job
+from app.services.parse_cache import get_parse_cache
+from app.services.ai_engine import get_embedding_engine, job_embedding_text, resume_embedding_text
+from app.services.candidate_repository import (
+    apply_index_changes, candidate_profile, latest_index_change, prune_index_changes, rebuild_indexes
+)
+from app.services.events import get_event_bus
+from app.services.job_queue import get_job_queue
+from app.services.parser_pool import shutdown_parsing_service
+from app.services.text_search import get_resume_text_index
+from app.core.config import get_settings
+from app.worker import start_workers, stop_workers
+
+logger = logging.getLogger(__name__)
+
+async def index_all() -> int:
+    """Fit the embedding weights and build the in-memory skill matrix and embedding indexes from the database
+
+    Returns the index_changes row the indexes are current to.
+    """
+    async with SessionLocal() as db:
+        # Read first: writes logged while the tables are loaded are replayed again, which is harmless
+        after_id = await latest_index_change(db)
+        all_candidates = [
+            c.to_dict(include_resume=True)
+            for c in await db.scalars(select(Candidate).options(undefer(Candidate.resume_data)))
+        ]
+        all_results = [
+            r.to_dict()
+            for r in await db.scalars(select(AnalysisResult).options(defer(AnalysisResult.result)))
+        ]
+        all_jobs = [j.to_dict() for j in await db.scalars(select(Job))]
+    # Hashed TF-IDF weights first: a refit re-embeds everything below
+    corpus = [resume_embedding_text(candidate_profile(c)) for c in all_candidates]
+    corpus += [job_embedding_text(j) for j in all_jobs]
+    get_embedding_engine().fit_if_needed(corpus)
+    rebuild_indexes(all_candidates, all_results)
+    jobs.index_job_embeddings(all_jobs)
+    return after_id
+
+async def follow_index_changes(stop: asyncio.Event, after_id: int):
+    """Replay candidate writes of standalone workers and other API processes into this process's indexes"""
+    settings = get_settings()
+    while not stop.is_set():
+        try:
+            async with SessionLocal() as db:
+                applied_id = await apply_index_changes(db, after_id)
+                if applied_id != after_id:
+                    await prune_index_changes(db, datetime.now() - timedelta(seconds=settings.INDEX_CHANGES_RETENTION))
+                after_id = applied_id
+        except Exception as e:
+            logger.error(f"Index sync failed: {type(e).__name__}: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.INDEX_SYNC_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start up and tear down shared services"""
+    await init_db()
+    after_id = await index_all()
+    stop, workers = await start_workers(get_settings().QUEUE_EMBEDDED_WORKERS)
+    sync_stop = asyncio.Event()
+    sync = asyncio.create_task(follow_index_changes(sync_stop, after_id))
+    yield
+    sync_stop.set()
+    await sync
+    await stop_workers(stop, workers)
+    get_job_queue().close()
+    shutdown_parsing_service()
+    get_parse_cache().close()
+    get_resume_text_index().close()
+    await engine.dispose()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -11,7 +92,8 @@ app = FastAPI(
     description="AI-Powered Resume Analysis System for Placement Teams",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware for React frontend
@@ -58,7 +140,10 @@ async def health_check():
         "service": "ResumeIQ Backend",
         "pdf_processing": "✅ Ready",
         "ai_analysis": "✅ Ready",
-        "database": "✅ Connected"
+        "database": "✅ Connected",
+        "parse_cache": get_parse_cache().stats(),
+        "job_queue": get_job_queue().stats(),
+        "event_stream": get_event_bus().stats()
     }
 
 if __name__ == "__main__":
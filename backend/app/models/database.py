@@ -0,0 +1,192 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    title: Mapped[str] = mapped_column(String(200))
+    company: Mapped[str] = mapped_column(String(200))
+    description: Mapped[str] = mapped_column(Text)
+    requirements: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    skills_required: Mapped[List[str]] = mapped_column(JSON, default=list)
+    skills_preferred: Mapped[List[str]] = mapped_column(JSON, default=list)
+    location: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    experience_min: Mapped[int] = mapped_column(Integer, default=0)
+    experience_max: Mapped[int] = mapped_column(Integer, default=10)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "company": self.company,
+            "description": self.description,
+            "requirements": self.requirements,
+            "skills_required": list(self.skills_required or []),
+            "skills_preferred": list(self.skills_preferred or []),
+            "location": self.location,
+            "experience_min": self.experience_min,
+            "experience_max": self.experience_max,
+            "is_active": self.is_active,
+            "created_at": _isoformat(self.created_at)
+        }
+
+class Candidate(Base):
+    __tablename__ = "candidates"
+    __table_args__ = (
+        # Filter columns paired with id, so filtered listings can seek to a keyset cursor
+        Index("ix_candidates_job_id_id", "job_id", "id"),
+        Index("ix_candidates_status_id", "status", "id"),
+        Index("ix_candidates_verdict_id", "verdict", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(200))
+    email: Mapped[str] = mapped_column(String(320), unique=True, index=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    location: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    job_id: Mapped[Optional[int]] = mapped_column(ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True)
+    resume_filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    resume_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)  # SHA-256 of the resume file
+    overall_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    verdict: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    matched_skills: Mapped[List[str]] = mapped_column(JSON, default=list)
+    missing_skills: Mapped[List[str]] = mapped_column(JSON, default=list)
+    status: Mapped[str] = mapped_column(String(20), default="uploaded")
+    applied_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, index=True)
+    # Structured extraction from parse_resume, stored once at upload (None if the resume could not be parsed).
+    # Deferred: listings never load it; query with undefer(Candidate.resume_data) where it is needed.
+    resume_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True, deferred=True)
+
+    def to_dict(self, include_resume: bool = False) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "location": self.location,
+            "job_id": self.job_id,
+            "resume_filename": self.resume_filename,
+            "overall_score": self.overall_score,
+            "verdict": self.verdict,
+            "matched_skills": list(self.matched_skills or []),
+            "missing_skills": list(self.missing_skills or []),
+            "status": self.status,
+            "applied_at": _isoformat(self.applied_at)
+        }
+        if include_resume:
+            data["resume_data"] = self.resume_data
+        return data
+
+class AnalysisResult(Base):
+    """Latest analysis of a candidate (the full result is kept as JSON)"""
+    __tablename__ = "analysis_results"
+
+    candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    job_id: Mapped[Optional[int]] = mapped_column(ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True)
+    overall_score: Mapped[float] = mapped_column(Float)
+    verdict: Mapped[str] = mapped_column(String(20), index=True)
+    result: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    analyzed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Headline fields; the full ``result`` is read on its own"""
+        return {
+            "candidate_id": self.candidate_id,
+            "job_id": self.job_id,
+            "overall_score": self.overall_score,
+            "verdict": self.verdict,
+            "analyzed_at": _isoformat(self.analyzed_at)
+        }
+
+class AnalysisBatch(Base):
+    """A batch analysis request; progress is counted from its items"""
+    __tablename__ = "analysis_batches"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id", ondelete="CASCADE"), index=True)
+    status: Mapped[str] = mapped_column(String(20), default="queued", index=True)
+    total: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": self.total,
+            "created_at": _isoformat(self.created_at),
+            "finished_at": _isoformat(self.finished_at)
+        }
+
+class AnalysisBatchItem(Base):
+    """One candidate of a batch: pending, done or failed"""
+    __tablename__ = "analysis_batch_items"
+
+    batch_id: Mapped[str] = mapped_column(ForeignKey("analysis_batches.id", ondelete="CASCADE"), primary_key=True)
+    candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
+
+class UploadBatch(Base):
+    """A bulk resume upload; each file becomes an item parsed by the job queue"""
+    __tablename__ = "upload_batches"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    job_id: Mapped[Optional[int]] = mapped_column(ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True)
+    total: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "job_id": self.job_id,
+            "total": self.total,
+            "created_at": _isoformat(self.created_at)
+        }
+
+class UploadBatchItem(Base):
+    """One file of a bulk upload: queued, created, duplicate, skipped or failed"""
+    __tablename__ = "upload_batch_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    batch_id: Mapped[str] = mapped_column(ForeignKey("upload_batches.id", ondelete="CASCADE"), index=True)
+    filename: Mapped[str] = mapped_column(String(255))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    status: Mapped[str] = mapped_column(String(20), default="queued", index=True)
+    candidate_id: Mapped[Optional[int]] = mapped_column(ForeignKey("candidates.id", ondelete="SET NULL"), nullable=True)
+    detail: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "status": self.status,
+            "candidate_id": self.candidate_id,
+            "detail": self.detail
+        }
+
+class IndexChange(Base):
+    """A candidate (or job) some process wrote, so the others can refresh their in-memory indexes
+
+    Rows are not foreign keys: they outlive the candidates and jobs they name.
+    """
+    __tablename__ = "index_changes"
+    # AUTOINCREMENT on SQLite, so ids are never reused after old rows are pruned
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    source: Mapped[str] = mapped_column(String(32))  # PROCESS_ID of the writer
+    candidate_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    job_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, index=True)
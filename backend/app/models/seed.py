@@ -0,0 +1,157 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.database import AnalysisResult, Candidate, Job
+
+# Demo data loaded into an empty database
+SEED_JOBS = [
+    {
+        "title": "Frontend Developer",
+        "company": "Tech Corp",
+        "description": "We are looking for a skilled React developer to join our dynamic team. The ideal candidate will have experience building responsive web applications using modern frontend technologies.",
+        "requirements": "Bachelor's degree in Computer Science or related field. Strong problem-solving skills and attention to detail.",
+        "skills_required": ["React", "JavaScript", "HTML", "CSS", "TypeScript"],
+        "skills_preferred": ["Node.js", "GraphQL", "Docker", "AWS", "Jest"],
+        "location": "Remote",
+        "experience_min": 2,
+        "experience_max": 5,
+        "is_active": True,
+        "created_at": datetime.fromisoformat("2024-01-10T09:00:00")
+    },
+    {
+        "title": "Python Developer",
+        "company": "AI Solutions",
+        "description": "Seeking an experienced Python developer for ML and backend development projects. You will work on cutting-edge AI applications and scalable web services.",
+        "requirements": "3+ years of Python development experience. Experience with machine learning frameworks preferred.",
+        "skills_required": ["Python", "Django", "PostgreSQL", "Git"],
+        "skills_preferred": ["Machine Learning", "TensorFlow", "Docker", "Redis", "Celery"],
+        "location": "Bangalore, India",
+        "experience_min": 3,
+        "experience_max": 7,
+        "is_active": True,
+        "created_at": datetime.fromisoformat("2024-01-08T14:30:00")
+    },
+    {
+        "title": "Full Stack Developer",
+        "company": "StartupXYZ",
+        "description": "Join our fast-growing startup as a full-stack developer. Work on both frontend and backend technologies to build innovative products.",
+        "requirements": "Experience with both frontend and backend technologies. Startup mindset and ability to work in a fast-paced environment.",
+        "skills_required": ["JavaScript", "React", "Node.js", "MongoDB"],
+        "skills_preferred": ["TypeScript", "AWS", "Docker", "Redis"],
+        "location": "San Francisco, CA",
+        "experience_min": 1,
+        "experience_max": 4,
+        "is_active": True,
+        "created_at": datetime.fromisoformat("2024-01-12T11:15:00")
+    }
+]
+
+SEED_CANDIDATES = [
+    {
+        "name": "Sarah Johnson",
+        "email": "sarah.johnson@email.com",
+        "phone": "+1-555-0123",
+        "location": "San Francisco, CA",
+        "job_id": 1,
+        "resume_filename": "sarah_resume.pdf",
+        "overall_score": 92,
+        "verdict": "High",
+        "matched_skills": ["React", "TypeScript", "JavaScript", "CSS", "HTML"],
+        "missing_skills": ["Docker", "Kubernetes"],
+        "status": "analyzed",
+        "applied_at": datetime.fromisoformat("2024-01-15T10:30:00")
+    },
+    {
+        "name": "Emily Rodriguez",
+        "email": "emily.rodriguez@email.com", 
+        "phone": "+1-555-0124",
+        "location": "Austin, TX",
+        "job_id": 1,
+        "resume_filename": "emily_resume.pdf",
+        "overall_score": 85,
+        "verdict": "High",
+        "matched_skills": ["React", "JavaScript", "Node.js", "CSS"],
+        "missing_skills": ["TypeScript", "GraphQL"],
+        "status": "analyzed",
+        "applied_at": datetime.fromisoformat("2024-01-13T14:20:00")
+    },
+    {
+        "name": "Michael Chen",
+        "email": "michael.chen@email.com",
+        "phone": "+1-555-0125", 
+        "location": "New York, NY",
+        "job_id": 2,
+        "resume_filename": "michael_resume.pdf",
+        "overall_score": 78,
+        "verdict": "Medium",
+        "matched_skills": ["Python", "Django", "SQL", "Git"],
+        "missing_skills": ["React", "AWS"],
+        "status": "analyzed",
+        "applied_at": datetime.fromisoformat("2024-01-14T09:15:00")
+    },
+    {
+        "name": "David Kim",
+        "email": "david.kim@email.com",
+        "phone": "+1-555-0126",
+        "location": "Seattle, WA", 
+        "job_id": 2,
+        "resume_filename": "david_resume.pdf",
+        "overall_score": 65,
+        "verdict": "Medium",
+        "matched_skills": ["Java", "Spring", "MySQL"],
+        "missing_skills": ["React", "JavaScript"],
+        "status": "analyzed",
+        "applied_at": datetime.fromisoformat("2024-01-12T16:45:00")
+    },
+    {
+        "name": "Lisa Wang",
+        "email": "lisa.wang@email.com",
+        "phone": "+1-555-0127",
+        "location": "Los Angeles, CA",
+        "job_id": 1,
+        "resume_filename": "lisa_resume.pdf", 
+        "overall_score": 45,
+        "verdict": "Low",
+        "matched_skills": ["HTML", "CSS", "JavaScript"],
+        "missing_skills": ["React", "TypeScript", "Node.js"],
+        "status": "analyzed",
+        "applied_at": datetime.fromisoformat("2024-01-11T11:30:00")
+    }
+]
+
+async def seed_database(db: AsyncSession):
+    """Insert the demo jobs and candidates if the database has no jobs yet"""
+    if (await db.execute(select(Job.id).limit(1))).first() is not None:
+        return
+    jobs = [Job(**job) for job in SEED_JOBS]
+    db.add_all(jobs)
+    await db.flush()
+    # Seed candidates name their job by its 1-based position in SEED_JOBS
+    candidates = [
+        Candidate(**{**candidate, "job_id": jobs[candidate["job_id"] - 1].id})
+        for candidate in SEED_CANDIDATES
+    ]
+    db.add_all(candidates)
+    await db.flush()
+    # Leaderboards rank analysis results, so the scored demo candidates get one each
+    db.add_all(
+        AnalysisResult(
+            candidate_id=c.id,
+            job_id=c.job_id,
+            overall_score=c.overall_score,
+            verdict=c.verdict,
+            result={
+                "candidate_id": c.id,
+                "job_id": c.job_id,
+                "overall_score": c.overall_score,
+                "verdict": c.verdict,
+                "matched_skills": c.matched_skills,
+                "missing_skills": c.missing_skills
+            }
+        )
+        for c in candidates
+        if c.overall_score is not None
+    )
+    await db.commit()
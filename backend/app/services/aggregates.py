@@ -0,0 +1,131 @@
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# (job_id, status, verdict, overall_score) of one candidate
+Entry = Tuple[Optional[int], str, Optional[str], Optional[float]]
+
+# Matches every verdict, including None (not analysed yet)
+ANY = object()
+
+class PoolStats:
+    """Counters for one pool of candidates, broken down by status and verdict.
+
+    Reads sum over the handful of (status, verdict) buckets, so they cost
+    the same whatever the number of candidates.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()  # (status, verdict) -> candidates
+        self.score_sums: Dict[str, float] = defaultdict(float)  # status -> sum of overall_score
+        self.score_counts: Counter = Counter()  # status -> candidates with a score
+
+    def add(self, status: str, verdict: Optional[str], score: Optional[float], sign: int = 1):
+        self.counts[(status, verdict)] += sign
+        if not self.counts[(status, verdict)]:
+            del self.counts[(status, verdict)]
+        if score is not None:
+            self.score_sums[status] += sign * score
+            self.score_counts[status] += sign
+            if not self.score_counts[status]:
+                del self.score_counts[status]
+                del self.score_sums[status]
+
+    def total(self, status: Optional[str] = None, verdict: Any = ANY) -> int:
+        """Candidates in ``status`` (None: any) with ``verdict`` (None: not analysed; ANY: any)"""
+        return sum(
+            count for (s, v), count in self.counts.items()
+            if (status is None or s == status) and (verdict is ANY or v == verdict)
+        )
+
+    def verdicts(self, status: Optional[str] = None) -> Dict[Optional[str], int]:
+        counts: Counter = Counter()
+        for (s, verdict), count in self.counts.items():
+            if status is None or s == status:
+                counts[verdict] += count
+        return dict(counts)
+
+    def average_score(self, status: Optional[str] = None) -> float:
+        statuses = [status] if status is not None else list(self.score_counts)
+        scored = sum(self.score_counts[s] for s in statuses)
+        return sum(self.score_sums[s] for s in statuses) / scored if scored else 0.0
+
+class CandidateAggregates:
+    """Dashboard totals maintained incrementally as candidates change.
+
+    Every candidate's (job, status, verdict, score) is remembered, so an
+    update subtracts its old contribution and adds the new one: counts,
+    score sums and verdict histograms are kept for all candidates and per
+    job. Built from the database at startup and updated wherever
+    candidates are created, analysed, change status or are deleted.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: Dict[int, Entry] = {}
+        self._all = PoolStats()
+        self._jobs: Dict[Optional[int], PoolStats] = defaultdict(PoolStats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _apply(self, entry: Entry, sign: int):
+        job_id, status, verdict, score = entry
+        self._all.add(status, verdict, score, sign)
+        self._jobs[job_id].add(status, verdict, score, sign)
+
+    def _set(self, candidate_id: int, entry: Optional[Entry]):
+        previous = self._entries.pop(candidate_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        if entry is not None:
+            self._entries[candidate_id] = entry
+            self._apply(entry, 1)
+
+    def update(self, candidate: Dict):
+        """Insert or refresh a candidate (a ``Candidate.to_dict()``)"""
+        with self._lock:
+            self._set(candidate["id"], (
+                candidate.get("job_id"),
+                candidate.get("status") or "uploaded",
+                candidate.get("verdict"),
+                candidate.get("overall_score")
+            ))
+
+    def update_status(self, candidate_ids: Iterable[int], status: str, where_status: Optional[str] = None):
+        """Mirror an ``UPDATE candidates SET status = ...`` (optionally only rows currently in ``where_status``)"""
+        with self._lock:
+            for candidate_id in candidate_ids:
+                entry = self._entries.get(candidate_id)
+                if entry is None or (where_status is not None and entry[1] != where_status):
+                    continue
+                self._set(candidate_id, (entry[0], status, entry[2], entry[3]))
+
+    def remove(self, candidate_id: int):
+        with self._lock:
+            self._set(candidate_id, None)
+
+    def detach_job(self, job_id: int):
+        """A deleted job's candidates keep existing without a job (ON DELETE SET NULL)"""
+        with self._lock:
+            for candidate_id, entry in list(self._entries.items()):
+                if entry[0] == job_id:
+                    self._set(candidate_id, (None, entry[1], entry[2], entry[3]))
+            self._jobs.pop(job_id, None)
+
+    def rebuild(self, candidates: Iterable[Dict]):
+        with self._lock:
+            self._entries = {}
+            self._all = PoolStats()
+            self._jobs = defaultdict(PoolStats)
+            for candidate in candidates:
+                self.update(candidate)
+
+    def pool(self, job_id: Optional[int] = None) -> PoolStats:
+        """Counters for all candidates, or for one job's applicants"""
+        if job_id is None:
+            return self._all
+        return self._jobs.get(job_id) or PoolStats()
+
+# Global aggregates instance
+candidate_aggregates = CandidateAggregates()
@@ -0,0 +1,253 @@
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Try importing sentence-transformers with fallback
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    logger.warning("sentence-transformers not found. Using hashed TF-IDF embeddings.")
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "at", "by", "from",
+    "as", "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "we", "our",
+    "you", "your", "i", "my", "me", "he", "she", "they", "their", "will", "have", "has", "had",
+})
+
+class HashedTfidfEncoder:
+    """Dependency-free text vectors: hashed unigrams + bigrams with TF-IDF weights.
+
+    Tokens are hashed (CRC32, with a sign bit to cancel collisions) into a
+    fixed number of buckets, so no vocabulary has to be kept. Term
+    frequencies are sublinear; IDF weights are 1 (stopwords are dropped)
+    until ``fit`` estimates them from a corpus. Vectors are L2-normalised
+    float32, so cosine similarity is a dot product.
+    """
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.idf = np.ones(dim, dtype=np.float32)
+        self.documents = 0  # corpus size of the last fit (0: not fitted)
+
+    @property
+    def weights_id(self) -> str:
+        """Short digest of the IDF weights; vectors encoded with different weights are not comparable"""
+        return f"{zlib.crc32(self.idf.tobytes()):08x}" if self.documents else "unfitted"
+
+    def _features(self, text: str) -> Counter:
+        tokens = [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+        return Counter(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+    def _bucket(self, feature: str):
+        hashed = zlib.crc32(feature.encode("utf-8"))
+        return hashed % self.dim, (1.0 if hashed & 0x80000000 else -1.0)
+
+    def fit(self, corpus: Sequence[str]):
+        """Estimate bucket IDF weights from a corpus of documents"""
+        document_frequency = np.zeros(self.dim, dtype=np.float64)
+        for text in corpus:
+            buckets = {self._bucket(feature)[0] for feature in self._features(text)}
+            document_frequency[list(buckets)] += 1
+        self.idf = (np.log((1 + len(corpus)) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.documents = len(corpus)
+
+    def save(self, path: Path):
+        """Write the fitted weights (atomically, so other processes never read half a file)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(".tmp")
+        with open(temp, "wb") as f:
+            np.savez(f, idf=self.idf, documents=self.documents)
+        os.replace(temp, path)
+
+    def load(self, path: Path):
+        with np.load(path) as saved:
+            if saved["idf"].shape != (self.dim,):
+                return
+            self.idf = saved["idf"].astype(np.float32)
+            self.documents = int(saved["documents"])
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                bucket, sign = self._bucket(feature)
+                vectors[row, bucket] += sign * (1.0 + math.log(count))
+        vectors *= self.idf
+        return normalize_rows(vectors)
+
+class EmbeddingEngine:
+    """Text embeddings for resumes and jobs, computed on CPU.
+
+    Uses the sentence-transformers model named by EMBEDDING_MODEL when it
+    is installed and already available locally (nothing is downloaded),
+    and hashed TF-IDF vectors otherwise. The model is loaded once, on first
+    use; texts are encoded in batches of EMBEDDING_BATCH_SIZE.
+
+    The hashed IDF weights are fitted on the resume and job corpus by
+    ``fit_if_needed`` (at API startup) and saved to ``idf_path``; every
+    process reloads them when the file changes. A refit changes
+    ``model_id``, so stored vectors from the old weights are re-embedded.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        backend: str = "auto",
+        batch_size: int = 32,
+        fallback_dim: int = 512,
+        idf_path: Optional[Path] = None,
+        refit_growth: float = 2.0
+    ):
+        self.model_name = model_name
+        self.requested_backend = backend
+        self.batch_size = batch_size
+        self.fallback = HashedTfidfEncoder(fallback_dim)
+        self.idf_path = idf_path
+        self.refit_growth = refit_growth
+        self._idf_token = None
+        self._model = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if self.requested_backend == "hashed" or not SENTENCE_TRANSFORMERS_AVAILABLE:
+                return
+            try:
+                self._model = SentenceTransformer(self.model_name, device="cpu", local_files_only=True)
+                logger.info(f"Loaded embedding model {self.model_name}")
+            except Exception as e:
+                logger.warning(f"Embedding model {self.model_name} unavailable offline ({str(e)}). Using hashed TF-IDF embeddings.")
+                self._model = None
+
+    def _reload_idf(self):
+        """Pick up IDF weights another process (or an earlier run) saved"""
+        if self.idf_path is None:
+            return
+        try:
+            stat = self.idf_path.stat()
+        except FileNotFoundError:
+            return
+        token = (stat.st_ino, stat.st_mtime_ns)
+        if token != self._idf_token:
+            self.fallback.load(self.idf_path)
+            self._idf_token = token
+
+    def fit_if_needed(self, corpus: Sequence[str]) -> bool:
+        """Fit the hashed IDF weights if they were never fitted or the corpus grew ``refit_growth`` times
+
+        Returns True if the weights changed. A no-op with a sentence-transformers model.
+        """
+        self._load()
+        if self._model is not None or not corpus:
+            return False
+        with self._lock:
+            self._reload_idf()
+            if self.fallback.documents and len(corpus) < self.refit_growth * self.fallback.documents:
+                return False
+            self.fallback.fit(corpus)
+            if self.idf_path is not None:
+                self.fallback.save(self.idf_path)
+                stat = self.idf_path.stat()
+                self._idf_token = (stat.st_ino, stat.st_mtime_ns)
+        logger.info(f"Fitted hashed TF-IDF weights on {len(corpus)} documents")
+        return True
+
+    @property
+    def backend(self) -> str:
+        self._load()
+        return "sentence-transformers" if self._model is not None else "hashed-tfidf"
+
+    @property
+    def dim(self) -> int:
+        self._load()
+        if self._model is not None:
+            return self._model.get_sentence_embedding_dimension()
+        return self.fallback.dim
+
+    @property
+    def model_id(self) -> str:
+        """Identifies the vector space; embeddings from different ids are not comparable"""
+        if self.backend == "sentence-transformers":
+            return f"st:{self.model_name}"
+        with self._lock:
+            self._reload_idf()
+        return f"hashed-tfidf:{self.fallback.dim}:{self.fallback.weights_id}"
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as L2-normalised float32 rows, shape (len(texts), dim)"""
+        self._load()
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        if self._model is None:
+            with self._lock:
+                self._reload_idf()
+            return self.fallback.encode(texts)
+        vectors = self._model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return vectors.astype(np.float32, copy=False)
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length (zero rows stay zero)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+def cosine_similarity_matrix(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every row of ``left`` with every row of ``right``"""
+    return normalize_rows(left) @ normalize_rows(right).T
+
+def resume_embedding_text(resume: Dict[str, Any]) -> str:
+    """Text a parsed resume is embedded from"""
+    return resume.get("text") or " ".join(resume.get("skills") or [])
+
+def job_embedding_text(job: Dict[str, Any]) -> str:
+    """Text a job is embedded from: title, description, requirements and skills"""
+    parts = [
+        job.get("title") or "",
+        job.get("description") or "",
+        job.get("requirements") or "",
+        " ".join(job.get("skills_required") or []),
+        " ".join(job.get("skills_preferred") or []),
+    ]
+    return "\n".join(part for part in parts if part)
+
+# Global embedding engine instance
+_engine: Optional[EmbeddingEngine] = None
+
+def get_embedding_engine() -> EmbeddingEngine:
+    """Get the embedding engine (singleton pattern)"""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = EmbeddingEngine(
+            model_name=settings.EMBEDDING_MODEL,
+            backend=settings.EMBEDDING_BACKEND,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            fallback_dim=settings.EMBEDDING_FALLBACK_DIM,
+            idf_path=settings.UPLOAD_DIR / "embeddings" / f"idf-{settings.EMBEDDING_FALLBACK_DIM}.npz",
+            refit_growth=settings.EMBEDDING_IDF_REFIT_GROWTH
+        )
+    return _engine
@@ -0,0 +1,205 @@
+import threading
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.services.ai_engine import normalize_rows
+from app.services.embedding_store import get_embedding_store
+
+# Rows scored per block when assigning vectors to centroids
+ASSIGN_BLOCK = 4096
+
+class IVFFlatIndex:
+    """Approximate cosine nearest-neighbour search over unit vectors (IVF-flat).
+
+    Vectors are clustered with spherical k-means into ``sqrt(n)``-ish
+    inverted lists; a query scores the centroids, then only the vectors in
+    the ``probes`` closest lists. Below ``min_train_size`` vectors the index
+    is not trained and every query is an exact scan. New vectors are
+    assigned to the nearest existing centroid, and the centroids are
+    retrained once the index has grown ``retrain_growth`` times past the
+    size it was trained at.
+    """
+
+    def __init__(self, dim: int, probes: int = 8, min_train_size: int = 1024, retrain_growth: float = 4.0, seed: int = 0):
+        self.dim = dim
+        self.probes = probes
+        self.min_train_size = min_train_size
+        self.retrain_growth = retrain_growth
+        self.seed = seed
+        self._lock = threading.RLock()
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._keys: List[Optional[Hashable]] = []
+        self._row_of: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+        self._centroids: Optional[np.ndarray] = None
+        self._list_of_row = np.zeros(0, dtype=np.int32)
+        self._lists: List[set] = []
+        self._list_arrays: Dict[int, np.ndarray] = {}
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._row_of
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    # -- updates ---------------------------------------------------------
+
+    def _ensure_rows(self, rows: int):
+        if rows <= len(self._vectors):
+            return
+        # Grow geometrically so appends stay amortised O(1)
+        new_rows = max(rows, len(self._vectors) * 2, 64)
+        grown = np.zeros((new_rows, self.dim), dtype=np.float32)
+        grown[:len(self._vectors)] = self._vectors
+        self._vectors = grown
+        lists = np.full(new_rows, -1, dtype=np.int32)
+        lists[:len(self._list_of_row)] = self._list_of_row
+        self._list_of_row = lists
+
+    def add_many(self, keys: Sequence[Hashable], vectors: np.ndarray):
+        """Insert or replace vectors for ``keys``"""
+        vectors = normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dim))
+        with self._lock:
+            rows = []
+            for key in keys:
+                row = self._row_of.get(key)
+                if row is None:
+                    row = self._free.pop() if self._free else len(self._keys)
+                    if row == len(self._keys):
+                        self._keys.append(None)
+                    self._keys[row] = key
+                    self._row_of[key] = row
+                rows.append(row)
+            self._ensure_rows(len(self._keys))
+            rows = np.array(rows, dtype=np.int64)
+            self._vectors[rows] = vectors
+
+            if self.trained:
+                self._unassign(rows)
+                self._assign(rows)
+            if len(self) >= self.min_train_size and len(self) >= self._trained_size * self.retrain_growth:
+                self.train()
+
+    def add(self, key: Hashable, vector: np.ndarray):
+        self.add_many([key], vector[None, :])
+
+    def remove(self, key: Hashable):
+        with self._lock:
+            row = self._row_of.pop(key, None)
+            if row is None:
+                return
+            if self.trained:
+                self._unassign(np.array([row]))
+            self._vectors[row] = 0
+            self._keys[row] = None
+            self._free.append(row)
+
+    def _live_rows(self) -> np.ndarray:
+        return np.fromiter(self._row_of.values(), dtype=np.int64, count=len(self._row_of))
+
+    def _nearest_centroid(self, vectors: np.ndarray) -> np.ndarray:
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), ASSIGN_BLOCK):
+            block = vectors[start:start + ASSIGN_BLOCK]
+            assignments[start:start + ASSIGN_BLOCK] = np.argmax(block @ self._centroids.T, axis=1)
+        return assignments
+
+    def _assign(self, rows: np.ndarray):
+        for row, list_id in zip(rows.tolist(), self._nearest_centroid(self._vectors[rows]).tolist()):
+            self._list_of_row[row] = list_id
+            self._lists[list_id].add(row)
+            self._list_arrays.pop(list_id, None)
+
+    def _unassign(self, rows: np.ndarray):
+        for row in rows.tolist():
+            list_id = self._list_of_row[row]
+            if list_id >= 0:
+                self._lists[list_id].discard(row)
+                self._list_arrays.pop(list_id, None)
+                self._list_of_row[row] = -1
+
+    def train(self, iterations: int = 10):
+        """Cluster the current vectors into inverted lists (spherical k-means)"""
+        with self._lock:
+            rows = self._live_rows()
+            if len(rows) < self.min_train_size:
+                return
+            n_lists = max(1, int(np.sqrt(len(rows))))
+            rng = np.random.default_rng(self.seed)
+            sample = self._vectors[rng.choice(rows, size=min(len(rows), 64 * n_lists), replace=False)]
+            self._centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+
+            for _ in range(iterations):
+                assignments = self._nearest_centroid(sample)
+                sums = np.zeros_like(self._centroids)
+                np.add.at(sums, assignments, sample)
+                empty = ~sums.any(axis=1)
+                # Reseed empty clusters from random sample points
+                sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+                self._centroids = normalize_rows(sums)
+
+            self._lists = [set() for _ in range(n_lists)]
+            self._list_arrays = {}
+            self._list_of_row[:] = -1
+            self._assign(rows)
+            self._trained_size = len(rows)
+
+    # -- queries ---------------------------------------------------------
+
+    def _candidate_rows(self, query: np.ndarray) -> np.ndarray:
+        if not self.trained:
+            return self._live_rows()
+        probes = min(self.probes, len(self._centroids))
+        closest = np.argpartition(-(self._centroids @ query), probes - 1)[:probes]
+        arrays = []
+        for list_id in closest.tolist():
+            if list_id not in self._list_arrays:
+                self._list_arrays[list_id] = np.fromiter(self._lists[list_id], dtype=np.int64)
+            arrays.append(self._list_arrays[list_id])
+        return np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int64)
+
+    def search(self, query: np.ndarray, k: int = 10) -> Tuple[List[Hashable], np.ndarray]:
+        """Keys of the ``k`` most similar vectors and their cosine similarities, best first"""
+        query = normalize_rows(np.asarray(query, dtype=np.float32).reshape(1, self.dim))[0]
+        with self._lock:
+            rows = self._candidate_rows(query)
+            if len(rows) == 0 or k <= 0:
+                return [], np.zeros(0, dtype=np.float32)
+            scores = self._vectors[rows] @ query
+            k = min(k, len(rows))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [self._keys[r] for r in rows[top].tolist()], scores[top]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "vectors": len(self),
+            "lists": len(self._lists) if self.trained else 0,
+            "trained_size": self._trained_size
+        }
+
+# Global candidate index instance
+_candidate_index: Optional[IVFFlatIndex] = None
+
+def get_candidate_index() -> IVFFlatIndex:
+    """Get the ANN index over stored resume embeddings (singleton pattern)"""
+    global _candidate_index
+    if _candidate_index is None:
+        settings = get_settings()
+        store = get_embedding_store("resumes")
+        _candidate_index = IVFFlatIndex(
+            dim=store.dim,
+            probes=settings.ANN_PROBES,
+            min_train_size=settings.ANN_MIN_TRAIN_SIZE
+        )
+        keys, vectors = store.matrix()
+        if keys:
+            _candidate_index.add_many(keys, vectors)
+    return _candidate_index
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """Split ``items`` into consecutive chunks of at most ``size``"""
+    size = max(1, size)
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+class BatchScheduler:
+    """Run a handler over fixed-size chunks with bounded concurrency.
+
+    Items are grouped into chunks of ``chunk_size`` and at most
+    ``concurrency`` chunks are in flight at once (an asyncio.Semaphore), so
+    a batch of thousands of candidates becomes a few dozen vectorized calls
+    instead of thousands of concurrent coroutines. A chunk that raises is
+    reported back to the caller and does not stop the rest of the batch.
+    """
+
+    def __init__(self, chunk_size: int, concurrency: int):
+        self.chunk_size = max(1, chunk_size)
+        self.concurrency = max(1, concurrency)
+
+    async def run(
+        self,
+        items: Sequence[T],
+        handler: Callable[[List[T]], Awaitable[None]]
+    ) -> List[Tuple[List[T], Optional[BaseException]]]:
+        """Run ``handler`` on every chunk; returns (chunk, error or None) in chunk order"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_chunk(chunk: List[T]) -> Tuple[List[T], Optional[BaseException]]:
+            async with semaphore:
+                try:
+                    await handler(chunk)
+                except Exception as e:
+                    logger.error(f"Batch chunk of {len(chunk)} items failed: {str(e)}")
+                    return chunk, e
+                return chunk, None
+
+        return await asyncio.gather(*(run_chunk(chunk) for chunk in chunked(items, self.chunk_size)))
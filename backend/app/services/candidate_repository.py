@@ -0,0 +1,224 @@
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, undefer
+
+from app.models.database import AnalysisResult, Candidate, IndexChange, Job
+from app.services.aggregates import candidate_aggregates
+from app.services.ai_engine import get_embedding_engine, resume_embedding_text
+from app.services.ann_index import get_candidate_index
+from app.services.embedding_store import get_embedding_store
+from app.services.leaderboard import job_leaderboards
+from app.services.skill_index import candidate_skill_index
+from app.services.skill_vectors import candidate_skill_matrix
+from app.services.text_search import get_resume_text_index
+
+# -- reads ---------------------------------------------------------------
+
+async def list_candidates(
+    db: AsyncSession,
+    job_id: Optional[int] = None,
+    status: Optional[str] = None,
+    verdict: Optional[str] = None,
+    email: Optional[str] = None,
+    after_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> Tuple[List[Candidate], Optional[int]]:
+    """One page of candidates in id order, and the cursor for the next page (None on the last)
+
+    With ``after_id`` the page starts right after that candidate (keyset
+    pagination): the (job_id, id) / (status, id) / (verdict, id) indexes
+    seek straight to it, so deep pages cost the same as the first one.
+    ``skip`` is an OFFSET and is only meant for shallow pages.
+    """
+    query = select(Candidate)
+    if email is not None:
+        query = query.where(Candidate.email == email)
+    if job_id is not None:
+        query = query.where(Candidate.job_id == job_id)
+    if status is not None:
+        query = query.where(Candidate.status == status)
+    if verdict is not None:
+        query = query.where(Candidate.verdict == verdict)
+    if after_id is not None:
+        query = query.where(Candidate.id > after_id)
+    elif skip:
+        query = query.offset(skip)
+
+    # One extra row tells whether another page follows
+    rows = (await db.scalars(query.order_by(Candidate.id).limit(limit + 1))).all()
+    page = rows[:limit]
+    return page, page[-1].id if len(rows) > limit and page else None
+
+async def count_candidates(
+    db: AsyncSession,
+    job_id: Optional[int] = None,
+    status: Optional[str] = None,
+    verdict: Optional[str] = None
+) -> int:
+    """Number of candidates matching the filters
+
+    Counted in SQL rather than from the in-memory aggregates, which see
+    other processes' writes only once ``apply_index_changes`` replays them.
+    """
+    query = select(func.count()).select_from(Candidate)
+    if job_id is not None:
+        query = query.where(Candidate.job_id == job_id)
+    if status is not None:
+        query = query.where(Candidate.status == status)
+    if verdict is not None:
+        query = query.where(Candidate.verdict == verdict)
+    return await db.scalar(query)
+
+def candidate_profile(candidate: Dict) -> Dict[str, Any]:
+    """Resume data the scorer judges a candidate by (``Candidate.to_dict(include_resume=True)``)"""
+    # The extraction stored at upload; candidates without one are judged by the skills on record
+    return candidate.get("resume_data") or {"skills": candidate.get("matched_skills", []) or []}
+
+# -- in-memory indexes ---------------------------------------------------
+# Every write to the candidates and analysis_results tables goes through
+# one of these hooks, so the skill matrix, skill index, aggregates,
+# leaderboards, embedding and full-text indexes stay in step with the
+# database. The embedding store and full-text index are files every
+# process shares; the rest live in one process, so writers also log the
+# candidates they touch in index_changes (``record_index_changes``) and the
+# API replays other processes' rows (``apply_index_changes``).
+
+# Tells this process's index_changes rows from those of other processes
+PROCESS_ID = uuid.uuid4().hex
+
+def index_candidate_skills(candidate: Dict):
+    """Refresh the candidate's skills in the shared skill bit matrix and inverted index"""
+    skills = candidate_profile(candidate)["skills"]
+    candidate_skill_matrix.update(candidate["id"], skills)
+    candidate_skill_index.update(candidate["id"], skills)
+
+def index_candidate_embeddings(candidates: List[Dict]):
+    """Embed candidates whose resume text is new or changed into the resume embedding store"""
+    texts = {c["id"]: resume_embedding_text(candidate_profile(c)) for c in candidates}
+    keys, vectors = get_embedding_store("resumes").sync(texts, get_embedding_engine())
+    if keys:
+        get_candidate_index().add_many(keys, vectors)
+
+async def index_candidates(candidates: List[Dict]):
+    """Candidates were created or updated (``Candidate.to_dict(include_resume=True)`` each): refresh every index
+
+    The embedding encode and ANN update run in a worker thread, off the event loop.
+    """
+    for candidate in candidates:
+        index_candidate_skills(candidate)
+        candidate_aggregates.update(candidate)
+    await asyncio.to_thread(index_candidate_embeddings, candidates)
+
+async def index_candidate(candidate: Dict):
+    """Refresh every index that holds the candidate"""
+    await index_candidates([candidate])
+
+def index_analysis_results(results: List[Dict]):
+    """Candidates were scored (``AnalysisResult.to_dict()`` each): rank them on the job they were scored against"""
+    for result in results:
+        job_leaderboards.update(result)
+
+def index_resume_text(candidate_id: int, text: str):
+    """Make a candidate's parsed resume text searchable"""
+    if text and text.strip():
+        get_resume_text_index().add(candidate_id, text)
+
+def index_status_change(candidate_ids: Iterable[int], status: str, where_status: Optional[str] = None):
+    """Mirror a bulk ``UPDATE candidates SET status = ...``; status only feeds the aggregates"""
+    candidate_aggregates.update_status(candidate_ids, status, where_status=where_status)
+
+def unindex_candidate(candidate_id: int):
+    """A candidate was deleted"""
+    candidate_skill_matrix.remove(candidate_id)
+    candidate_skill_index.remove(candidate_id)
+    candidate_aggregates.remove(candidate_id)
+    job_leaderboards.remove(candidate_id)
+    get_embedding_store("resumes").delete(candidate_id)
+    get_candidate_index().remove(candidate_id)
+    get_resume_text_index().delete(candidate_id)
+
+def compact_candidate_embeddings():
+    """Reclaim dead rows deletes left in the resume embedding store (rewrites the file: run it off the event loop)"""
+    get_embedding_store("resumes").compact_if_needed()
+
+def unindex_job(job_id: int):
+    """A job was deleted; its candidates remain without a job (ON DELETE SET NULL)"""
+    candidate_aggregates.detach_job(job_id)
+    job_leaderboards.remove_job(job_id)
+
+def rebuild_indexes(candidates: List[Dict], analysis_results: List[Dict]):
+    """Build every in-memory candidate index from the full candidate and analysis result lists"""
+    for candidate in candidates:
+        index_candidate_skills(candidate)
+    candidate_aggregates.rebuild(candidates)
+    job_leaderboards.rebuild(analysis_results)
+    index_candidate_embeddings(candidates)
+    # The full-text index is persistent: forget candidates deleted while it was offline, and
+    # index those it is missing (a lost index file, or candidates from before it existed)
+    text_index = get_resume_text_index()
+    text_index.retain(candidate["id"] for candidate in candidates)
+    indexed = text_index.ids()
+    missing = []
+    for candidate in candidates:
+        text = (candidate.get("resume_data") or {}).get("text", "")
+        if candidate["id"] not in indexed and text and text.strip():
+            missing.append((candidate["id"], text))
+    text_index.add_many(missing)
+
+# -- changes from other processes ----------------------------------------
+
+def record_index_changes(db: AsyncSession, candidate_ids: Iterable[int] = (), job_id: Optional[int] = None):
+    """Log the candidates (or the job) a transaction writes for other processes' indexes (caller commits)"""
+    db.add_all(IndexChange(source=PROCESS_ID, candidate_id=candidate_id) for candidate_id in candidate_ids)
+    if job_id is not None:
+        db.add(IndexChange(source=PROCESS_ID, job_id=job_id))
+
+async def latest_index_change(db: AsyncSession) -> int:
+    """Id of the newest index_changes row (0 if there is none)"""
+    return await db.scalar(select(func.max(IndexChange.id))) or 0
+
+async def apply_index_changes(db: AsyncSession, after_id: int, limit: int = 1000) -> int:
+    """Refresh this process's indexes from rows other processes logged after ``after_id``
+
+    Candidates are re-read from the database, so a row only says which ones
+    to look at. Returns the id to continue from.
+    """
+    rows = (await db.execute(
+        select(IndexChange.id, IndexChange.source, IndexChange.candidate_id, IndexChange.job_id)
+        .where(IndexChange.id > after_id)
+        .order_by(IndexChange.id)
+        .limit(limit)
+    )).all()
+    if not rows:
+        return after_id
+    foreign = [row for row in rows if row.source != PROCESS_ID]
+    candidate_ids = {row.candidate_id for row in foreign if row.candidate_id is not None}
+    job_ids = {row.job_id for row in foreign if row.job_id is not None}
+
+    if candidate_ids:
+        candidates = (await db.scalars(
+            select(Candidate).where(Candidate.id.in_(candidate_ids)).options(undefer(Candidate.resume_data))
+        )).all()
+        results = (await db.scalars(
+            select(AnalysisResult).where(AnalysisResult.candidate_id.in_(candidate_ids))
+            .options(defer(AnalysisResult.result))
+        )).all()
+        for candidate_id in candidate_ids - {c.id for c in candidates}:
+            unindex_candidate(candidate_id)
+        await index_candidates([c.to_dict(include_resume=True) for c in candidates])
+        index_analysis_results([r.to_dict() for r in results])
+    if job_ids:
+        for job_id in job_ids - set(await db.scalars(select(Job.id).where(Job.id.in_(job_ids)))):
+            unindex_job(job_id)
+    return rows[-1].id
+
+async def prune_index_changes(db: AsyncSession, before: datetime):
+    """Drop index_changes rows every process has long since applied"""
+    await db.execute(delete(IndexChange).where(IndexChange.created_at < before))
+    await db.commit()
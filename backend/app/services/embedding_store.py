@@ -0,0 +1,317 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# flock keeps processes sharing a store from interleaving writes; without it
+# (Windows) only one process may write to the store directory
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from app.core.config import get_settings
+from app.services.ai_engine import EmbeddingEngine, get_embedding_engine
+
+logger = logging.getLogger(__name__)
+
+def text_fingerprint(text: str) -> str:
+    """Short digest of the text a vector was computed from"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+class EmbeddingStore:
+    """Persistent float32 vectors, appended to a file and read through a memory map.
+
+    Each store generation is two append-only files: ``<name>.<gen>.f32``
+    holds the raw vectors (one ``dim``-wide float32 row per write) and
+    ``<name>.<gen>.ids`` logs ``[key, row, fingerprint]`` per write (row -1
+    marks a delete). ``<name>.meta.json`` names the current generation and
+    the vector space (model id and dim); a store written by another model is
+    discarded. Rows are read through ``np.memmap``, so processes sharing the
+    directory read the same page-cache pages without copying.
+
+    The API and standalone worker processes write to the same files, so
+    every write holds an exclusive ``flock`` on ``<name>.lock``, first
+    replays the log entries (or the new generation) other processes wrote,
+    and takes its row numbers from the size of the vector file. Reads
+    replay under a shared lock.
+
+    Overwrites and deletes leave dead rows behind; ``compact`` rewrites the
+    live rows into a new generation and switches ``meta.json`` atomically.
+    It is not run by ``delete``: callers run ``compact_if_needed`` off the
+    request path.
+    """
+
+    def __init__(self, directory: Path, name: str, model_id: str, dim: int, compact_ratio: float = 0.25):
+        self.directory = Path(directory)
+        self.name = name
+        self.model_id = model_id
+        self.dim = dim
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._rows: Dict[Hashable, int] = {}
+        self._fingerprints: Dict[Hashable, Optional[str]] = {}
+        self._total_rows = 0
+        self._ids_offset = 0  # bytes of the ids log replayed so far
+        self._meta_token: Optional[Tuple[int, int]] = None
+        self._map: Optional[np.memmap] = None
+        self.generation = 0
+        self._load()
+
+    # -- files -----------------------------------------------------------
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / f"{self.name}.meta.json"
+
+    @property
+    def _lock_path(self) -> Path:
+        return self.directory / f"{self.name}.lock"
+
+    def _vectors_path(self, generation: int) -> Path:
+        return self.directory / f"{self.name}.{generation}.f32"
+
+    def _ids_path(self, generation: int) -> Path:
+        return self.directory / f"{self.name}.{generation}.ids"
+
+    @property
+    def _row_bytes(self) -> int:
+        return self.dim * 4
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool = True):
+        """Hold the store's lock file against other processes (no-op where flock is unavailable)"""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._file_lock():
+            if self._meta_path.exists():
+                meta = json.loads(self._meta_path.read_text())
+                if meta.get("model_id") != self.model_id or meta.get("dim") != self.dim:
+                    logger.info(f"Embedding store '{self.name}' was built with {meta.get('model_id')}; starting a new one")
+                    self._remove_generation(meta.get("generation", 0))
+                    self._switch_generation(0)
+            else:
+                self._switch_generation(0)
+            self._catch_up()
+
+    def _catch_up(self):
+        """Replay what other processes wrote since the last call (the file lock must be held)"""
+        stat = self._meta_path.stat()
+        token = (stat.st_ino, stat.st_mtime_ns)
+        if token != self._meta_token:
+            generation = json.loads(self._meta_path.read_text())["generation"]
+            if generation != self.generation or self._meta_token is None:
+                # First load, or another process compacted: start over on its generation
+                self.generation = generation
+                self._rows, self._fingerprints = {}, {}
+                self._ids_offset = 0
+                self._map = None
+            self._meta_token = token
+
+        vectors_path = self._vectors_path(self.generation)
+        self._total_rows = vectors_path.stat().st_size // self._row_bytes if vectors_path.exists() else 0
+        ids_path = self._ids_path(self.generation)
+        if not ids_path.exists() or ids_path.stat().st_size == self._ids_offset:
+            return
+        with open(ids_path, "rb") as f:
+            f.seek(self._ids_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final line
+                self._ids_offset += len(line)
+                try:
+                    key, row, fingerprint = json.loads(line)
+                except ValueError:
+                    continue
+                if row < 0:
+                    self._rows.pop(key, None)
+                    self._fingerprints.pop(key, None)
+                elif row < self._total_rows:
+                    self._rows[key] = row
+                    self._fingerprints[key] = fingerprint
+
+    def refresh(self):
+        """Pick up vectors and deletes written by other processes"""
+        with self._lock, self._file_lock(exclusive=False):
+            self._catch_up()
+
+    def _switch_generation(self, generation: int):
+        """Point meta.json at ``generation`` (written atomically)"""
+        temp = self._meta_path.with_suffix(".tmp")
+        temp.write_text(json.dumps({"generation": generation, "model_id": self.model_id, "dim": self.dim}))
+        os.replace(temp, self._meta_path)
+
+    def _remove_generation(self, generation: int):
+        for path in (self._vectors_path(generation), self._ids_path(generation)):
+            path.unlink(missing_ok=True)
+
+    def _log(self, entries: List[Tuple[Hashable, int, Optional[str]]]):
+        with open(self._ids_path(self.generation), "a") as f:
+            f.writelines(json.dumps([key, row, fingerprint]) + "\n" for key, row, fingerprint in entries)
+
+    def _trim_torn_writes(self):
+        """Cut a partial row or log line left by a writer that crashed (the exclusive lock must be held)"""
+        vectors_path, ids_path = self._vectors_path(self.generation), self._ids_path(self.generation)
+        if vectors_path.exists() and vectors_path.stat().st_size != self._total_rows * self._row_bytes:
+            os.truncate(vectors_path, self._total_rows * self._row_bytes)
+        if ids_path.exists() and ids_path.stat().st_size != self._ids_offset:
+            os.truncate(ids_path, self._ids_offset)
+
+    # -- reads -----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def keys(self) -> List[Hashable]:
+        return list(self._rows)
+
+    def fingerprint(self, key: Hashable) -> Optional[str]:
+        return self._fingerprints.get(key)
+
+    def _vectors(self) -> np.ndarray:
+        """Read-only memory map over every row written to this generation"""
+        if self._map is None or self._map.shape[0] != self._total_rows:
+            if self._total_rows == 0:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            self._map = np.memmap(
+                self._vectors_path(self.generation), dtype=np.float32, mode="r", shape=(self._total_rows, self.dim)
+            )
+        return self._map
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Vector for ``key`` (a read-only view into the memory map), or None"""
+        with self._lock:
+            self.refresh()
+            row = self._rows.get(key)
+            return None if row is None else self._vectors()[row]
+
+    def get_many(self, keys: Sequence[Hashable]) -> Tuple[List[Hashable], np.ndarray]:
+        """Keys that have vectors and their rows stacked into one (n, dim) array"""
+        with self._lock:
+            self.refresh()
+            found = [key for key in keys if key in self._rows]
+            rows = np.fromiter((self._rows[key] for key in found), dtype=np.int64, count=len(found))
+            return found, np.asarray(self._vectors()[rows])
+
+    def matrix(self) -> Tuple[List[Hashable], np.ndarray]:
+        """Every live key and its vector"""
+        with self._lock:
+            self.refresh()
+            return self.get_many(self.keys())
+
+    # -- writes ----------------------------------------------------------
+
+    def put_many(self, keys: Sequence[Hashable], vectors: np.ndarray, fingerprints: Optional[Sequence[Optional[str]]] = None):
+        """Append vectors (overwriting earlier ones for the same keys)"""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(len(keys), self.dim)
+        fingerprints = fingerprints or [None] * len(keys)
+        with self._lock, self._file_lock():
+            self._catch_up()
+            self._trim_torn_writes()
+            first_row = self._total_rows
+            with open(self._vectors_path(self.generation), "ab") as f:
+                f.write(vectors.tobytes())
+            self._log([(key, first_row + i, fp) for i, (key, fp) in enumerate(zip(keys, fingerprints))])
+            self._catch_up()
+
+    def put(self, key: Hashable, vector: np.ndarray, fingerprint: Optional[str] = None):
+        self.put_many([key], vector[None, :], [fingerprint])
+
+    def delete(self, key: Hashable):
+        """Forget ``key`` (its row stays dead until ``compact``)"""
+        with self._lock, self._file_lock():
+            self._catch_up()
+            if key not in self._rows:
+                return
+            self._trim_torn_writes()
+            self._log([(key, -1, None)])
+            self._catch_up()
+
+    @property
+    def dead_rows(self) -> int:
+        return self._total_rows - len(self._rows)
+
+    def compact_if_needed(self) -> bool:
+        """Compact once dead rows pass ``compact_ratio`` of the file; returns True if it did"""
+        with self._lock:
+            self.refresh()
+            if self.dead_rows <= self.compact_ratio * self._total_rows:
+                return False
+            self.compact()
+            return True
+
+    def compact(self):
+        """Rewrite live rows into a new generation and drop the old files"""
+        with self._lock, self._file_lock():
+            self._catch_up()
+            keys = self.keys()
+            rows = np.fromiter((self._rows[key] for key in keys), dtype=np.int64, count=len(keys))
+            vectors = np.asarray(self._vectors()[rows])
+            old_generation, new_generation = self.generation, self.generation + 1
+            with open(self._vectors_path(new_generation), "wb") as f:
+                f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            with open(self._ids_path(new_generation), "w") as f:
+                f.writelines(json.dumps([key, row, self._fingerprints.get(key)]) + "\n" for row, key in enumerate(keys))
+            self._switch_generation(new_generation)
+            self._catch_up()
+            # Open memory maps keep the unlinked file alive until they are dropped
+            self._remove_generation(old_generation)
+
+    def sync(self, texts: Dict[Hashable, str], engine: EmbeddingEngine) -> Tuple[List[Hashable], np.ndarray]:
+        """Embed the texts whose key is missing or whose text changed; returns those keys and vectors"""
+        self.refresh()
+        stale = {key: text for key, text in texts.items() if self._fingerprints.get(key) != text_fingerprint(text)}
+        if not stale:
+            return [], np.zeros((0, self.dim), dtype=np.float32)
+        vectors = engine.encode(list(stale.values()))
+        self.put_many(list(stale), vectors, [text_fingerprint(t) for t in stale.values()])
+        return list(stale), vectors
+
+    def stats(self) -> Dict[str, int]:
+        return {"vectors": len(self._rows), "dead_rows": self.dead_rows, "generation": self.generation, "dim": self.dim}
+
+def stored_embeddings(name: str, texts: Dict[Hashable, str]) -> np.ndarray:
+    """Vectors for ``texts`` (rows in key order), embedding any that are missing or stale"""
+    store = get_embedding_store(name)
+    store.sync(texts, get_embedding_engine())
+    return store.get_many(list(texts))[1]
+
+# Global embedding stores, one per record type ("resumes", "jobs")
+_stores: Dict[str, EmbeddingStore] = {}
+
+def get_embedding_store(name: str) -> EmbeddingStore:
+    """Get the embedding store for a record type (singleton per name)
+
+    Reopened when the engine's vector space changes (refitted IDF weights),
+    which discards the vectors from the old one.
+    """
+    engine = get_embedding_engine()
+    if name not in _stores or _stores[name].model_id != engine.model_id:
+        settings = get_settings()
+        _stores[name] = EmbeddingStore(
+            directory=settings.UPLOAD_DIR / "embeddings",
+            name=name,
+            model_id=engine.model_id,
+            dim=engine.dim,
+            compact_ratio=settings.EMBEDDING_STORE_COMPACT_RATIO
+        )
+    return _stores[name]
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+    """One subscriber's bounded event queue, filtered on event fields"""
+
+    def __init__(self, bus: "EventBus", filters: Dict[str, Any], queue_size: int):
+        self.bus = bus
+        self.filters = filters
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        return all(event.get(field) == value for field, value in self.filters.items())
+
+    def offer(self, event: Dict[str, Any]):
+        if not self.matches(event):
+            return
+        if self.queue.full():
+            # A slow consumer loses its oldest events rather than stalling publishers
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None if nothing arrives within ``timeout`` seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class EventBus:
+    """In-process publish/subscribe for analysis status transitions.
+
+    Publishers never block: each subscriber has its own bounded queue and
+    ``publish`` only enqueues events whose fields match the subscriber's
+    filters (e.g. ``batch_id=...``). Must be used from the event loop
+    thread. Events only reach subscribers in the same process, so workers
+    started with ``python -m app.worker`` are not visible here.
+    """
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+
+    def subscribe(self, **filters) -> Subscription:
+        """Subscribe to events whose fields equal the given (non-None) filters"""
+        subscription = Subscription(
+            self, {field: value for field, value in filters.items() if value is not None}, self.queue_size
+        )
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    def publish(self, event: Dict[str, Any]):
+        for subscription in list(self._subscribers):
+            subscription.offer(event)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": len(self._subscribers),
+            "dropped": sum(s.dropped for s in self._subscribers)
+        }
+
+# Global event bus instance
+_event_bus: Optional[EventBus] = None
+
+def get_event_bus() -> EventBus:
+    """Get the analysis event bus (singleton pattern)"""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus(queue_size=get_settings().EVENTS_QUEUE_SIZE)
+    return _event_bus
@@ -0,0 +1,390 @@
+import json
+import logging
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Try importing redis with fallback
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+class JobQueue(ABC):
+    """Persistent work queue with visibility timeouts, retries and idempotent keys.
+
+    ``enqueue`` stores a job under an idempotency key: submitting the same
+    key again while the job is queued or running returns the existing job
+    instead of adding a duplicate (a finished job with that key is queued
+    again). ``claim`` hands a job to a worker and hides it for
+    ``visibility_timeout`` seconds; a job that is not completed or failed in
+    that time (the worker died) becomes claimable again. ``fail`` retries
+    with exponential backoff until ``max_attempts`` is reached. A job whose
+    last attempt timed out is marked failed and handed out once more with
+    ``expired`` set, so the worker runs its failure handler instead of it.
+    """
+
+    def __init__(self, visibility_timeout: float, max_attempts: int, retry_delay: float):
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def backoff(self, attempts: int) -> float:
+        return self.retry_delay * (2 ** max(0, attempts - 1))
+
+    @abstractmethod
+    def enqueue(self, kind: str, payload: Dict[str, Any], key: Optional[str] = None) -> Dict[str, Any]:
+        """Queue a job (or return the queued or running one with the same key)"""
+
+    @abstractmethod
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Next due job for this worker, or None when nothing is due"""
+
+    @abstractmethod
+    def complete(self, job_id: str):
+        """Mark a claimed job done"""
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str) -> bool:
+        """Record a failed attempt; returns True if the job will be retried"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A job by id, or None"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Number of jobs in each status"""
+
+    def close(self):
+        pass
+
+class SQLiteJobQueue(JobQueue):
+    """JobQueue stored in a local SQLite file (shared by the API and worker processes)"""
+
+    def __init__(self, db_path: Path, **options):
+        super().__init__(**options)
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None, timeout=30)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS queue_jobs ("
+                " id TEXT PRIMARY KEY,"
+                " key TEXT UNIQUE NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " visible_at REAL NOT NULL,"
+                " last_error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_queue_jobs_ready ON queue_jobs (status, visible_at)"
+            )
+        return self._conn
+
+    @staticmethod
+    def _row(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], key: Optional[str] = None) -> Dict[str, Any]:
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                existing = db.execute("SELECT * FROM queue_jobs WHERE key = ?", (key,)).fetchone()
+                if existing is not None and existing["status"] in (QUEUED, RUNNING):
+                    db.execute("COMMIT")
+                    return self._row(existing)
+                if existing is not None:
+                    # Finished earlier: run it again under the same id
+                    db.execute(
+                        "UPDATE queue_jobs SET kind = ?, payload = ?, status = ?, attempts = 0, visible_at = ?,"
+                        " last_error = NULL, updated_at = ? WHERE id = ?",
+                        (kind, json.dumps(payload), QUEUED, now, now, existing["id"])
+                    )
+                    job_id = existing["id"]
+                else:
+                    job_id = uuid.uuid4().hex
+                    db.execute(
+                        "INSERT INTO queue_jobs (id, key, kind, payload, status, attempts, visible_at, created_at, updated_at)"
+                        " VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?)",
+                        (job_id, key, kind, json.dumps(payload), QUEUED, now, now, now)
+                    )
+                job = db.execute("SELECT * FROM queue_jobs WHERE id = ?", (job_id,)).fetchone()
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+        return self._row(job)
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                # Queued jobs that are due, and running jobs whose visibility timeout lapsed
+                row = db.execute(
+                    "SELECT * FROM queue_jobs WHERE status IN (?, ?) AND visible_at <= ?"
+                    " ORDER BY visible_at LIMIT 1",
+                    (QUEUED, RUNNING, now)
+                ).fetchone()
+                if row is None:
+                    db.execute("COMMIT")
+                    return None
+                if row["status"] == RUNNING and row["attempts"] >= self.max_attempts:
+                    db.execute(
+                        "UPDATE queue_jobs SET status = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                        (FAILED, row["last_error"] or "visibility timeout expired", now, row["id"])
+                    )
+                    job = db.execute("SELECT * FROM queue_jobs WHERE id = ?", (row["id"],)).fetchone()
+                    db.execute("COMMIT")
+                    return {**self._row(job), "expired": True}
+                db.execute(
+                    "UPDATE queue_jobs SET status = ?, attempts = attempts + 1, visible_at = ?, updated_at = ?"
+                    " WHERE id = ?",
+                    (RUNNING, now + self.visibility_timeout, now, row["id"])
+                )
+                job = db.execute("SELECT * FROM queue_jobs WHERE id = ?", (row["id"],)).fetchone()
+                db.execute("COMMIT")
+                return self._row(job)
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+
+    def complete(self, job_id: str):
+        with self._lock:
+            self._db().execute(
+                "UPDATE queue_jobs SET status = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+                (DONE, time.time(), job_id)
+            )
+
+    def fail(self, job_id: str, error: str) -> bool:
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            row = db.execute("SELECT attempts FROM queue_jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False
+            retry = row["attempts"] < self.max_attempts
+            db.execute(
+                "UPDATE queue_jobs SET status = ?, visible_at = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                (QUEUED if retry else FAILED, now + self.backoff(row["attempts"]), error, now, job_id)
+            )
+        return retry
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._row(self._db().execute("SELECT * FROM queue_jobs WHERE id = ?", (job_id,)).fetchone())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db().execute("SELECT status, COUNT(*) FROM queue_jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+class RedisJobQueue(JobQueue):
+    """JobQueue stored in Redis, for workers on several hosts.
+
+    Each job is a hash; ``keys`` maps idempotency keys to job ids, and a
+    sorted set ``schedule`` holds every queued or running job scored by the
+    time it becomes claimable. ``counts`` keeps the number of jobs in each
+    status, so ``stats`` does not walk every job. Claiming and status
+    changes are Lua scripts, so two workers never receive the same job and
+    the counts move with the statuses.
+    """
+
+    CLAIM_SCRIPT = """
+    local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)
+    if #due == 0 then return nil end
+    local job_key = ARGV[3] .. due[1]
+    local old = redis.call('HGET', job_key, 'status')
+    if old and old ~= 'running' then
+        redis.call('HINCRBY', KEYS[2], old, -1)
+        redis.call('HINCRBY', KEYS[2], 'running', 1)
+    end
+    redis.call('ZADD', KEYS[1], tonumber(ARGV[1]) + tonumber(ARGV[2]), due[1])
+    redis.call('HSET', job_key, 'status', 'running', 'updated_at', ARGV[1])
+    redis.call('HINCRBY', job_key, 'attempts', 1)
+    return due[1]
+    """
+
+    # KEYS: job hash, counts; ARGV: new status, then field/value pairs to set
+    SET_STATUS_SCRIPT = """
+    local old = redis.call('HGET', KEYS[1], 'status')
+    if old ~= ARGV[1] then
+        if old then redis.call('HINCRBY', KEYS[2], old, -1) end
+        redis.call('HINCRBY', KEYS[2], ARGV[1], 1)
+    end
+    redis.call('HSET', KEYS[1], 'status', ARGV[1], unpack(ARGV, 2))
+    """
+
+    def __init__(self, url: str, prefix: str = "resumeiq:queue", **options):
+        super().__init__(**options)
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self._claim = self.client.register_script(self.CLAIM_SCRIPT)
+        self._set_status_script = self.client.register_script(self.SET_STATUS_SCRIPT)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    @property
+    def _schedule(self) -> str:
+        return f"{self.prefix}:schedule"
+
+    @property
+    def _keys(self) -> str:
+        return f"{self.prefix}:keys"
+
+    @property
+    def _counts(self) -> str:
+        return f"{self.prefix}:counts"
+
+    def _set_status(self, job_id: str, status: str, **fields):
+        """Move a job to ``status`` (and set ``fields``), keeping the per-status counts in step"""
+        args = [status]
+        for field, value in fields.items():
+            args += [field, value]
+        self._set_status_script(keys=[self._job_key(job_id), self._counts], args=args)
+
+    def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.client.hgetall(self._job_key(job_id))
+        if not job:
+            return None
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] = int(job["attempts"])
+        for field in ("visible_at", "created_at", "updated_at"):
+            if field in job:
+                job[field] = float(job[field])
+        return job
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], key: Optional[str] = None) -> Dict[str, Any]:
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        job_id = self.client.hget(self._keys, key)
+        if job_id is not None:
+            existing = self._load(job_id)
+            if existing is not None and existing["status"] in (QUEUED, RUNNING):
+                return existing
+        else:
+            job_id = uuid.uuid4().hex
+            # Another API process may register the same key first; use its job
+            if not self.client.hsetnx(self._keys, key, job_id):
+                return self._load(self.client.hget(self._keys, key))
+        self._set_status(
+            job_id, QUEUED, id=job_id, key=key, kind=kind, payload=json.dumps(payload),
+            attempts=0, visible_at=now, last_error="", created_at=now, updated_at=now
+        )
+        self.client.zadd(self._schedule, {job_id: now})
+        return self._load(job_id)
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        while True:
+            job_id = self._claim(
+                keys=[self._schedule, self._counts], args=[time.time(), self.visibility_timeout, f"{self.prefix}:job:"]
+            )
+            if job_id is None:
+                return None
+            job = self._load(job_id)
+            if job is None:
+                self.client.zrem(self._schedule, job_id)
+                continue
+            if job["attempts"] > self.max_attempts:
+                # Claimed again after its last attempt's visibility timeout lapsed
+                self.client.zrem(self._schedule, job_id)
+                self._set_status(
+                    job_id, FAILED, attempts=self.max_attempts,
+                    last_error=job["last_error"] or "visibility timeout expired", updated_at=time.time()
+                )
+                return {**self._load(job_id), "expired": True}
+            return job
+
+    def complete(self, job_id: str):
+        self.client.zrem(self._schedule, job_id)
+        self._set_status(job_id, DONE, last_error="", updated_at=time.time())
+
+    def fail(self, job_id: str, error: str) -> bool:
+        job = self._load(job_id)
+        if job is None:
+            return False
+        now = time.time()
+        retry = job["attempts"] < self.max_attempts
+        if retry:
+            self.client.zadd(self._schedule, {job_id: now + self.backoff(job["attempts"])})
+        else:
+            self.client.zrem(self._schedule, job_id)
+        self._set_status(job_id, QUEUED if retry else FAILED, last_error=error, updated_at=now)
+        return retry
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._load(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        counts = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+        counts.update({
+            status: int(count) for status, count in self.client.hgetall(self._counts).items() if status in counts
+        })
+        return counts
+
+    def close(self):
+        self.client.close()
+
+# Global job queue instance
+_queue: Optional[JobQueue] = None
+
+def get_job_queue() -> JobQueue:
+    """Get the analysis job queue (singleton pattern)"""
+    global _queue
+    if _queue is None:
+        settings = get_settings()
+        options = {
+            "visibility_timeout": settings.QUEUE_VISIBILITY_TIMEOUT,
+            "max_attempts": settings.QUEUE_MAX_ATTEMPTS,
+            "retry_delay": settings.QUEUE_RETRY_DELAY
+        }
+        if settings.REDIS_ENABLED and REDIS_AVAILABLE:
+            _queue = RedisJobQueue(settings.REDIS_URL, **options)
+        else:
+            if settings.REDIS_ENABLED:
+                logger.warning("redis package not found. Using the SQLite job queue.")
+            _queue = SQLiteJobQueue(settings.UPLOAD_DIR / "job_queue.sqlite3", **options)
+    return _queue
@@ -0,0 +1,93 @@
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class Leaderboard:
+    """Candidates of one job kept in ``overall_score`` order (best first).
+
+    Entries live in a sorted list of ``(-score, candidate_id)``, so a
+    result update is a binary search plus one insertion, a page of the top
+    k is a slice, and a candidate's rank is a binary search — nothing
+    re-sorts the pool. Ties are broken by the lower candidate id.
+    """
+
+    def __init__(self):
+        self._order: List[Tuple[float, int]] = []
+        self._scores: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, candidate_id: int) -> bool:
+        return candidate_id in self._scores
+
+    def update(self, candidate_id: int, score: float):
+        self.remove(candidate_id)
+        self._scores[candidate_id] = score
+        insort(self._order, (-score, candidate_id))
+
+    def remove(self, candidate_id: int):
+        score = self._scores.pop(candidate_id, None)
+        if score is not None:
+            del self._order[bisect_left(self._order, (-score, candidate_id))]
+
+    def top(self, limit: int, offset: int = 0) -> List[Tuple[int, float]]:
+        """(candidate_id, score) pairs ranked ``offset + 1`` to ``offset + limit``"""
+        return [(candidate_id, -negated) for negated, candidate_id in self._order[offset:offset + limit]]
+
+    def rank(self, candidate_id: int) -> Optional[int]:
+        """1-based rank of a candidate, or None if it has no score on this board"""
+        score = self._scores.get(candidate_id)
+        if score is None:
+            return None
+        return bisect_left(self._order, (-score, candidate_id)) + 1
+
+    def score(self, candidate_id: int) -> Optional[float]:
+        return self._scores.get(candidate_id)
+
+class JobLeaderboards:
+    """One Leaderboard per job, holding the candidates scored against it
+
+    A candidate's latest analysis (``AnalysisResult``) decides its board
+    and score, so a candidate re-scored against another job moves there.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._boards: Dict[int, Leaderboard] = defaultdict(Leaderboard)
+        self._job_of: Dict[int, int] = {}
+
+    def update(self, result: Dict):
+        """Place a candidate by its latest analysis (an ``AnalysisResult.to_dict()``), or take it off"""
+        with self._lock:
+            self.remove(result["candidate_id"])
+            job_id, score = result.get("job_id"), result.get("overall_score")
+            if job_id is not None and score is not None:
+                self._boards[job_id].update(result["candidate_id"], score)
+                self._job_of[result["candidate_id"]] = job_id
+
+    def remove(self, candidate_id: int):
+        with self._lock:
+            job_id = self._job_of.pop(candidate_id, None)
+            if job_id is not None:
+                self._boards[job_id].remove(candidate_id)
+
+    def remove_job(self, job_id: int):
+        with self._lock:
+            board = self._boards.pop(job_id, None)
+            for candidate_id, _ in board.top(len(board)) if board else []:
+                self._job_of.pop(candidate_id, None)
+
+    def rebuild(self, results: Iterable[Dict]):
+        with self._lock:
+            self._boards = defaultdict(Leaderboard)
+            self._job_of = {}
+            for result in results:
+                self.update(result)
+
+    def get(self, job_id: int) -> Leaderboard:
+        return self._boards.get(job_id) or Leaderboard()
+
+# Global leaderboards instance
+job_leaderboards = JobLeaderboards()
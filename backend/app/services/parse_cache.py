@@ -0,0 +1,177 @@
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+from app.services.resume_parser import PARSER_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Least recently used rows read per eviction query
+EVICTION_BATCH = 32
+
+class ParseCache:
+    """Two-tier cache of parsed resumes keyed by file content.
+
+    Keys are the SHA-256 of the resume bytes plus PARSER_VERSION, so the
+    same file uploaded for several jobs is parsed once, and bumping the
+    parser version invalidates old entries. A bounded in-memory LRU sits in
+    front of a SQLite file whose total payload size is capped; the least
+    recently used rows are evicted when it grows past ``max_bytes``. The
+    total is kept in a one-row table by triggers, so it stays right when
+    the API and worker processes share the file and a put never sums the
+    whole table.
+    """
+
+    def __init__(self, db_path: Path, memory_items: int, max_bytes: int):
+        self.db_path = Path(db_path)
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(content_hash: str) -> str:
+        return f"v{PARSER_VERSION}:{content_hash}"
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_resumes ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_parsed_resumes_last_access ON parsed_resumes (last_access)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache_size ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0),"
+                " total INTEGER NOT NULL)"
+            )
+            # Caches created before the running total existed are summed once
+            self._conn.execute(
+                "INSERT OR IGNORE INTO parse_cache_size (id, total)"
+                " SELECT 0, COALESCE(SUM(size), 0) FROM parsed_resumes"
+            )
+            self._conn.executescript(
+                "CREATE TRIGGER IF NOT EXISTS parsed_resumes_size_insert AFTER INSERT ON parsed_resumes"
+                " BEGIN UPDATE parse_cache_size SET total = total + NEW.size; END;"
+                "CREATE TRIGGER IF NOT EXISTS parsed_resumes_size_update AFTER UPDATE OF size ON parsed_resumes"
+                " BEGIN UPDATE parse_cache_size SET total = total + NEW.size - OLD.size; END;"
+                "CREATE TRIGGER IF NOT EXISTS parsed_resumes_size_delete AFTER DELETE ON parsed_resumes"
+                " BEGIN UPDATE parse_cache_size SET total = total - OLD.size; END;"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached parse result, or None"""
+        key = self.make_key(content_hash)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(self._memory[key])
+
+            db = self._db()
+            row = db.execute("SELECT payload FROM parsed_resumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            db.execute("UPDATE parsed_resumes SET last_access = ? WHERE key = ?", (time.time(), key))
+            db.commit()
+            self.disk_hits += 1
+            result = json.loads(row[0])
+            self._remember(key, result)
+            return copy.deepcopy(result)
+
+    def put(self, content_hash: str, result: Dict[str, Any]):
+        """Store a parse result in both tiers"""
+        key = self.make_key(content_hash)
+        payload = json.dumps(result)
+        with self._lock:
+            self._remember(key, copy.deepcopy(result))
+            db = self._db()
+            # An upsert, not INSERT OR REPLACE: REPLACE's implicit delete skips the size triggers
+            db.execute(
+                "INSERT INTO parsed_resumes (key, payload, size, last_access) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET"
+                " payload = excluded.payload, size = excluded.size, last_access = excluded.last_access",
+                (key, payload, len(payload), time.time())
+            )
+            self._evict_disk(db)
+            db.commit()
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, db: sqlite3.Connection):
+        """Delete least recently used rows until the payload total fits"""
+        total = db.execute("SELECT total FROM parse_cache_size").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Oldest rows a batch at a time, so a put never reads the whole table
+        while total > self.max_bytes:
+            rows = db.execute(
+                "SELECT key, size FROM parsed_resumes ORDER BY last_access LIMIT ?", (EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM parsed_resumes WHERE key = ?", (key,))
+                total -= size
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "memory_items": len(self._memory)
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Global parse cache instance
+_cache = None
+
+def get_parse_cache() -> ParseCache:
+    """Get the parse cache (singleton pattern)"""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ParseCache(
+            db_path=settings.UPLOAD_DIR / "parse_cache.sqlite3",
+            memory_items=settings.PARSE_CACHE_MEMORY_ITEMS,
+            max_bytes=settings.PARSE_CACHE_MAX_BYTES
+        )
+    return _cache
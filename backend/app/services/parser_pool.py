@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+from app.services.resume_parser import parse_resume_sync
+
+logger = logging.getLogger(__name__)
+
+class ParserQueueFullError(RuntimeError):
+    """Raised when the parser queue is at its configured depth"""
+
+class ParserRestartedError(ParserQueueFullError):
+    """Raised for a document lost when its worker pool broke or was restarted; retrying is safe"""
+
+class ResumeParsingService:
+    """Run resume parsing in a process pool.
+
+    At most ``max_workers + queue_depth`` documents are admitted at once;
+    further submissions are rejected with ParserQueueFullError instead of
+    piling up inside the executor. Each document gets ``timeout`` seconds,
+    and worker processes are replaced after ``max_tasks_per_worker``
+    documents to contain pdfplumber's memory growth.
+
+    A stuck document can only be stopped by terminating the pool, which
+    also loses the other documents in flight; those (and documents in a
+    pool whose worker crashed) fail with ParserRestartedError, a retryable
+    ParserQueueFullError, and the next document starts a fresh pool.
+    """
+
+    def __init__(self, max_workers: int, queue_depth: int, max_tasks_per_worker: int, timeout: float):
+        self.max_workers = max(1, max_workers)
+        self.queue_depth = max(0, queue_depth)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_depth
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                max_tasks_per_child=self.max_tasks_per_worker or None
+            )
+        return self._executor
+
+    async def parse(self, file_path: Path) -> Dict[str, Any]:
+        """Parse one resume in a worker process"""
+        if self._in_flight >= self.capacity:
+            raise ParserQueueFullError(
+                f"Resume parser is busy ({self._in_flight} documents queued), try again later"
+            )
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                future = loop.run_in_executor(executor, parse_resume_sync, Path(file_path))
+                return await asyncio.wait_for(future, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Parsing {file_path} exceeded {self.timeout}s, restarting parser workers")
+                self._restart(executor)
+                raise TimeoutError(f"Resume parsing timed out after {self.timeout} seconds")
+            except BrokenProcessPool:
+                logger.warning(f"Parser workers restarted while parsing {file_path}")
+                self._restart(executor)
+                raise ParserRestartedError("Resume parser was restarted, try again")
+        finally:
+            self._in_flight -= 1
+
+    def _restart(self, executor: ProcessPoolExecutor):
+        """Drop a pool whose worker is stuck on a document, or that broke"""
+        if self._executor is executor:
+            self._executor = None
+        # A running task cannot be cancelled, so stop the processes directly
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stop all worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+# Global parsing service instance
+_service = None
+
+def get_parsing_service() -> ResumeParsingService:
+    """Get the resume parsing service (singleton pattern)"""
+    global _service
+    if _service is None:
+        settings = get_settings()
+        _service = ResumeParsingService(
+            max_workers=settings.PARSER_WORKERS,
+            queue_depth=settings.PARSER_QUEUE_DEPTH,
+            max_tasks_per_worker=settings.PARSER_MAX_TASKS_PER_WORKER,
+            timeout=settings.MAX_ANALYSIS_TIME
+        )
+    return _service
+
+def shutdown_parsing_service():
+    """Stop the parser pool if it was started"""
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
@@ -1,8 +1,15 @@
+import asyncio
 import re
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 import logging
 
+from app.core.config import get_settings
+from app.services.skill_taxonomy import SOFT_SKILLS_CATEGORY, skill_taxonomy
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,6 +22,13 @@ except ImportError:
     logger.warning("pdfplumber not found. Please install: pip install pdfplumber")
     PDFPLUMBER_AVAILABLE = False
 
+try:
+    from PyPDF2 import PdfReader
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    logger.warning("PyPDF2 not found. PDFs will be read with pdfplumber only")
+    PYPDF2_AVAILABLE = False
+
 try:
     import docx
     DOCX_AVAILABLE = True
@@ -31,13 +45,195 @@ except (ImportError, OSError):
     SPACY_AVAILABLE = False
     nlp = None
 
-async def parse_resume(file_path: Path) -> Dict[str, Any]:
-    """Parse resume and extract structured data"""
+# Bump whenever extraction output changes so cached parse results are ignored
+PARSER_VERSION = 6
+
+# Every spelling of every skill name and alias in the taxonomy, as they appear in resume text
+SKILL_KEYWORDS = skill_taxonomy.keywords()
+SOFT_SKILLS = frozenset(skill_taxonomy.keywords([SOFT_SKILLS_CATEGORY]))
+TECHNICAL_SKILLS = frozenset(SKILL_KEYWORDS) - SOFT_SKILLS
+
+PROGRAMMING_LANGUAGES = [
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby',
+    'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql'
+]
+
+SPOKEN_LANGUAGES = [
+    'english', 'spanish', 'french', 'german', 'chinese', 'japanese', 'korean',
+    'hindi', 'arabic', 'portuguese', 'russian', 'italian', 'dutch'
+]
+
+class KeywordMatcher:
+    """Find every keyword of a fixed vocabulary in one pass over the text.
+    
+    The vocabulary is compiled into a single trie-shaped alternation regex
+    (longest alternative first) wrapped in the same word boundaries the
+    per-keyword searches used. Shorter keywords that are boundary-respecting
+    prefixes of a longer match (``spring`` inside ``spring boot``) are
+    precomputed, and scanning resumes one character after each match start
+    so keywords beginning inside a longer match are still found.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = frozenset(keywords)
+        self.pattern = re.compile(r'\b(?:' + _trie_regex(self.keywords) + r')\b')
+        
+        # keyword -> all keywords matched at the same start position
+        self.implied = {}
+        for keyword in self.keywords:
+            self.implied[keyword] = frozenset({keyword} | {
+                other for other in self.keywords
+                if other != keyword and keyword.startswith(other)
+                and re.match(r'\b' + re.escape(other) + r'\b', keyword)
+            })
+    
+    def find(self, text: str) -> set:
+        """Return the set of keywords present in (already lowercased) text"""
+        found = set()
+        search = self.pattern.search
+        pos = 0
+        match = search(text, pos)
+        while match:
+            found |= self.implied[match.group()]
+            pos = match.start() + 1
+            match = search(text, pos)
+        return found
+
+def _trie_regex(keywords) -> str:
+    """Build a prefix-factored regex alternation that prefers longer keywords"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    
+    def render(node) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            # Ending here is the shortest option, so it is tried last
+            branches.append('')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+    
+    return render(trie)
+
+# Shared by extract_skills and extract_languages
+SKILL_MATCHER = KeywordMatcher(TECHNICAL_SKILLS | SOFT_SKILLS | set(PROGRAMMING_LANGUAGES) | set(SPOKEN_LANGUAGES))
+
+# Precompiled pattern registry shared by every extractor. Compiling once at
+# import keeps the hot path off the re module cache, which is small enough
+# to be evicted when many distinct patterns are in use.
+PATTERNS = {
+    # clean_text
+    "whitespace": re.compile(r'\s+'),
+    "special_chars": re.compile(r'[^\w\s\-\.\@\+\(\)\/\,\;]'),
+    "multi_space": re.compile(r' +'),
+    
+    # extract_experience_years (matched against lowercased text)
+    "experience": [
+        # "5 years of experience", "3+ years experience", etc.
+        re.compile(r'(\d+(?:\.\d+)?)\s*[\+\-]?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)'),
+        # "5+ years in", "3 years working", etc.
+        re.compile(r'(\d+(?:\.\d+)?)\s*[\+\-]?\s*(?:years?|yrs?)\s+(?:in|working|as|with)'),
+        # "experienced for 5 years"
+        re.compile(r'experienced\s+for\s+(\d+(?:\.\d+)?)\s*(?:years?|yrs?)'),
+        # "5 years professional experience"
+        re.compile(r'(\d+(?:\.\d+)?)\s*(?:years?|yrs?)\s+professional')
+    ],
+    
+    # infer_experience_from_dates: ranges like "2020-2023", "Jan 2020 - Present"
+    "date_ranges": [
+        re.compile(r'(\d{4})\s*[-–]\s*(\d{4})', re.IGNORECASE),  # 2020-2023
+        re.compile(r'(\d{4})\s*[-–]\s*(?:present|current)', re.IGNORECASE),  # 2020-Present
+    ],
+    
+    # extract_education (degrees are matched against lowercased text)
+    "degrees": [
+        # Bachelor's degrees
+        re.compile(r'(?:bachelor|b\.?\s*(?:tech|sc|com|a|e|s)|b\.?tech|b\.?sc|b\.?com|b\.?a|b\.?e|b\.?s)'),
+        # Master's degrees
+        re.compile(r'(?:master|m\.?\s*(?:tech|sc|com|a|e|s)|m\.?tech|m\.?sc|m\.?com|m\.?a|m\.?e|m\.?s|mba|ms)'),
+        # Doctoral degrees
+        re.compile(r'(?:doctor|ph\.?d|phd|doctorate)'),
+        # Other qualifications
+        re.compile(r'(?:diploma|certificate|associate)')
+    ],
+    # The leading lookbehinds below only let a match start where the original
+    # unanchored pattern could first succeed (start of a run/line), which
+    # returns the same matches without retrying from every character.
+    "institutions": [
+        re.compile(r'(?:university|college|institute|school)\s+of\s+[\w\s]+', re.IGNORECASE),
+        re.compile(r'(?<![\w\s])[\w\s]+\s+(?:university|college|institute)', re.IGNORECASE),
+        re.compile(r'(?:iit|nit|bits|iiit|isi)\s*[\w\s]*', re.IGNORECASE)
+    ],
+    "graduation_year": re.compile(r'\b(19|20)\d{2}\b'),
+    
+    # extract_projects
+    "bullet_start": re.compile(r'^[\-\•\*\d\.]'),
+    "bullet_prefix": re.compile(r'^[\-\•\*\d\.]+\s*'),
+    
+    # extract_certifications (line-anchored, see the note on institutions)
+    "certifications": [
+        re.compile(r'(?:certified|certification|certificate)\s+(?:in\s+)?([^\n]{5,80})', re.IGNORECASE),
+        re.compile(r'(?<![^\n])([^\n]*(?:aws|azure|google cloud|gcp)[^\n]*(?:certified|certification)[^\n]*)', re.IGNORECASE),
+        re.compile(r'(?<![^\n])([^\n]*(?:pmp|scrum|agile|cissp|ceh|cissp)[^\n]*)', re.IGNORECASE),
+        re.compile(r'(?<![^\n])([^\n]*(?:oracle|microsoft|cisco|comptia)[^\n]*(?:certified|certification)[^\n]*)', re.IGNORECASE)
+    ],
+    
+    # extract_contact_info
+    "email": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    "phones": [
+        re.compile(r'[\+]?[1-9]?\d{1,4}?[-.\s]?\(?\d{1,3}?\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+        re.compile(r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{4,10}'),
+        re.compile(r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}')
+    ],
+    "linkedin": re.compile(r'(?:linkedin\.com/in/|linkedin\.com/pub/)([A-Za-z0-9\-_]+)', re.IGNORECASE),
+    "github": re.compile(r'(?:github\.com/)([A-Za-z0-9\-_]+)', re.IGNORECASE),
+    
+    # extract_portfolio_url
+    "portfolio_urls": [
+        re.compile(r'https?://(?:www\.)?[A-Za-z0-9\-_]+\.(?:com|net|org|io|dev|me)/[A-Za-z0-9\-_/]*', re.IGNORECASE),
+        re.compile(r'(?:portfolio|website):\s*(https?://[^\s]+)', re.IGNORECASE),
+        re.compile(r'(?:personal website|blog):\s*(https?://[^\s]+)', re.IGNORECASE)
+    ]
+}
+
+async def parse_resume(file_path: Path, content_hash: Optional[str] = None) -> Dict[str, Any]:
+    """Parse resume and extract structured data
+    
+    Results are cached by file content, so a resume that was parsed before
+    skips text extraction entirely. Cache misses are parsed in the parser
+    process pool so a large PDF does not block the event loop.
+    """
+    # Import here to avoid circular imports
+    from app.services.parse_cache import get_parse_cache
+    from app.services.parser_pool import get_parsing_service
+    from app.utils.filehandlers import compute_file_hash
+    
+    cache = get_parse_cache()
+    if content_hash is None:
+        content_hash = await asyncio.to_thread(compute_file_hash, file_path)
+    
+    cached = await asyncio.to_thread(cache.get, content_hash)
+    if cached is not None:
+        logger.info(f"Parse cache hit for resume: {file_path.name}")
+        return cached
+    
+    extracted_data = await get_parsing_service().parse(file_path)
+    await asyncio.to_thread(cache.put, content_hash, extracted_data)
+    return extracted_data
+
+def parse_resume_sync(file_path: Path) -> Dict[str, Any]:
+    """Parse resume synchronously (runs inside a parser worker process)"""
     
     try:
+        extraction = {}
+        
         # Extract text based on file type
         if file_path.suffix.lower() == '.pdf':
-            text = extract_text_from_pdf(file_path)
+            text = extract_text_from_pdf(file_path, report=extraction)
         elif file_path.suffix.lower() in ['.docx', '.doc']:
             text = extract_text_from_docx(file_path)
         else:
@@ -46,19 +242,9 @@ async def parse_resume(file_path: Path) -> Dict[str, Any]:
         if not text or len(text.strip()) < 50:
             raise ValueError("Resume text is too short or empty")
         
-        # Extract structured data
-        extracted_data = {
-            "text": text,
-            "word_count": len(text.split()),
-            "skills": extract_skills(text),
-            "experience": extract_experience_years(text),
-            "education": extract_education(text),
-            "projects": extract_projects(text),
-            "certifications": extract_certifications(text),
-            "contact_info": extract_contact_info(text),
-            "languages": extract_languages(text),
-            "achievements": extract_achievements(text)
-        }
+        extracted_data = extract_resume_data(text)
+        if extraction:
+            extracted_data["extraction"] = extraction
         
         logger.info(f"Successfully parsed resume: {file_path.name}")
         return extracted_data
@@ -67,25 +253,154 @@ async def parse_resume(file_path: Path) -> Dict[str, Any]:
         logger.error(f"Error parsing resume {file_path}: {str(e)}")
         raise
 
-def extract_text_from_pdf(file_path: Path) -> str:
-    """Extract text from PDF using pdfplumber"""
-    if not PDFPLUMBER_AVAILABLE:
+def extract_resume_data(text: str) -> Dict[str, Any]:
+    """Run every extractor over already-extracted resume text"""
+    return {
+        "text": text,
+        "word_count": len(text.split()),
+        "skills": extract_skills(text),
+        "experience": extract_experience_years(text),
+        "education": extract_education(text),
+        "projects": extract_projects(text),
+        "certifications": extract_certifications(text),
+        "contact_info": extract_contact_info(text),
+        "languages": extract_languages(text),
+        "achievements": extract_achievements(text)
+    }
+
+class PdfTextBackend(ABC):
+    """Interface for a PDF text extractor used by extract_text_from_pdf"""
+    
+    name: str
+    
+    @property
+    @abstractmethod
+    def available(self) -> bool:
+        """Whether the library behind the backend is installed"""
+    
+    @abstractmethod
+    def iter_pages(self, file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Yield the text of each page in order ('' for pages without text)"""
+
+class PyPDF2Backend(PdfTextBackend):
+    """Reads the PDF text layer directly, without layout analysis"""
+    
+    name = "pypdf2"
+    
+    @property
+    def available(self) -> bool:
+        return PYPDF2_AVAILABLE
+    
+    def iter_pages(self, file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+        reader = PdfReader(str(file_path))
+        for page_num, page in enumerate(reader.pages):
+            if max_pages and page_num >= max_pages:
+                break
+            yield page.extract_text() or ""
+
+class PdfplumberBackend(PdfTextBackend):
+    """Layout-aware extraction; slower but copes with unusual text layers"""
+    
+    name = "pdfplumber"
+    
+    @property
+    def available(self) -> bool:
+        return PDFPLUMBER_AVAILABLE
+    
+    def iter_pages(self, file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+        # Only build page objects for the pages we may read
+        pages_to_parse = range(1, max_pages + 1) if max_pages else None
+        with pdfplumber.open(file_path, pages=pages_to_parse) as pdf:
+            for page in pdf.pages:
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    # Drop the cached layout objects before moving on
+                    page.close()
+
+# Tried in order; later backends are fallbacks for poor output from earlier ones
+PDF_BACKENDS: List[PdfTextBackend] = [PyPDF2Backend(), PdfplumberBackend()]
+
+def read_pdf_pages(backend: PdfTextBackend, file_path: Path, max_pages: Optional[int], max_chars: Optional[int]):
+    """Read pages from one backend up to the cutoffs; returns (text, pages_read)"""
+    parts = []
+    pages_read = 0
+    total_chars = 0
+    with closing(backend.iter_pages(file_path, max_pages)) as pages:
+        for page_text in pages:
+            pages_read += 1
+            if not page_text:
+                logger.warning(f"No text found on page {pages_read} of {file_path.name} ({backend.name})")
+                continue
+            parts.append(page_text)
+            total_chars += len(page_text) + 1
+            if max_chars and total_chars >= max_chars:
+                logger.info(f"Stopped reading {file_path.name} after {max_chars} characters")
+                break
+    
+    text = "\n".join(parts)
+    if max_chars:
+        text = text[:max_chars]
+    return text, pages_read
+
+def pdf_text_looks_poor(text: str, pages_read: int) -> bool:
+    """Whether extracted text is too thin to trust (scanned pages, broken text layer)"""
+    settings = get_settings()
+    if len(text.strip()) < settings.PDF_MIN_TEXT_CHARS:
+        return True
+    return len(text.split()) / max(pages_read, 1) < settings.PDF_MIN_WORDS_PER_PAGE
+
+def extract_text_from_pdf(
+    file_path: Path,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    report: Optional[Dict[str, Any]] = None
+) -> str:
+    """Extract text from PDF, cheapest backend first
+    
+    Each backend in PDF_BACKENDS is tried in turn until one produces text
+    that does not look poor; if none does, the longest result wins. Pages
+    are read one at a time and reading stops after ``max_pages`` pages or
+    ``max_chars`` characters (defaults from settings). When ``report`` is
+    given it is filled with the chosen backend and per-backend timings.
+    """
+    settings = get_settings()
+    max_pages = settings.PDF_MAX_PAGES if max_pages is None else max_pages
+    max_chars = settings.PDF_MAX_CHARS if max_chars is None else max_chars
+    
+    backends = [backend for backend in PDF_BACKENDS if backend.available]
+    if not backends:
         raise ImportError("pdfplumber is required for PDF processing. Install with: pip install pdfplumber")
     
-    text = ""
+    report = {} if report is None else report
+    report["attempts"] = []
+    best_text, best_backend = "", None
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    logger.warning(f"No text found on page {page_num + 1} of {file_path.name}")
+        for backend in backends:
+            started = time.perf_counter()
+            try:
+                text, pages_read = read_pdf_pages(backend, file_path, max_pages, max_chars)
+            except Exception as e:
+                logger.warning(f"{backend.name} failed on {file_path.name}: {str(e)}")
+                report["attempts"].append({"backend": backend.name, "seconds": round(time.perf_counter() - started, 4), "error": str(e)})
+                continue
+            
+            elapsed = time.perf_counter() - started
+            report["attempts"].append({"backend": backend.name, "seconds": round(elapsed, 4), "pages": pages_read, "chars": len(text)})
+            logger.info(f"Extracted {len(text)} chars from {file_path.name} with {backend.name} in {elapsed:.3f}s")
+            
+            if len(text.strip()) > len(best_text.strip()):
+                best_text, best_backend = text, backend.name
+            if not pdf_text_looks_poor(text, pages_read):
+                best_text, best_backend = text, backend.name
+                break
         
-        if not text.strip():
+        if not best_text.strip():
             raise ValueError("No text could be extracted from PDF")
-            
-        return clean_text(text)
+        
+        report["backend"] = best_backend
+        report["seconds"] = round(sum(attempt["seconds"] for attempt in report["attempts"]), 4)
+        return clean_text(best_text)
         
     except Exception as e:
         logger.error(f"Error extracting text from PDF {file_path}: {str(e)}")
@@ -124,99 +439,33 @@ def extract_text_from_docx(file_path: Path) -> str:
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = PATTERNS["whitespace"].sub(' ', text)
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\-\.\@\+\(\)\/\,\;]', ' ', text)
+    text = PATTERNS["special_chars"].sub(' ', text)
     # Remove multiple spaces
-    text = re.sub(r' +', ' ', text)
+    text = PATTERNS["multi_space"].sub(' ', text)
     return text.strip()
 
 def extract_skills(text: str) -> List[str]:
-    """Extract technical and soft skills from resume text"""
-    
-    # Comprehensive skill database
-    technical_skills = {
-        # Programming Languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'nosql', 'html', 'css', 'scss', 'sass',
-        
-        # Frameworks & Libraries
-        'react', 'angular', 'vue.js', 'vue', 'node.js', 'nodejs', 'express.js', 'express', 'django',
-        'flask', 'fastapi', 'spring', 'spring boot', 'laravel', 'symfony', 'rails', 'ember.js',
-        'backbone.js', 'jquery', 'bootstrap', 'tailwind', 'material-ui', 'antd',
-        
-        # Databases
-        'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'dynamodb',
-        'sqlite', 'oracle', 'sql server', 'mariadb', 'couchdb',
-        
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'ci/cd',
-        'terraform', 'ansible', 'puppet', 'chef', 'vagrant', 'heroku', 'vercel', 'netlify',
-        
-        # Data Science & AI/ML
-        'machine learning', 'deep learning', 'ai', 'tensorflow', 'pytorch', 'keras', 'scikit-learn',
-        'pandas', 'numpy', 'matplotlib', 'seaborn', 'plotly', 'jupyter', 'r studio', 'tableau',
-        'power bi', 'spark', 'hadoop', 'kafka',
-        
-        # Mobile Development
-        'react native', 'flutter', 'ios', 'android', 'swift', 'kotlin', 'xamarin', 'cordova',
-        
-        # Tools & Other
-        'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack', 'trello',
-        'postman', 'swagger', 'figma', 'sketch', 'adobe creative suite', 'photoshop'
-    }
-    
-    soft_skills = {
-        'leadership', 'teamwork', 'communication', 'problem solving', 'analytical thinking',
-        'project management', 'time management', 'adaptability', 'creativity', 'collaboration',
-        'critical thinking', 'decision making', 'negotiation', 'presentation', 'mentoring'
-    }
-    
-    found_skills = []
-    text_lower = text.lower()
+    """Extract technical and soft skills from resume text (canonical names, so aliases count once)"""
     
-    # Extract technical skills
-    for skill in technical_skills:
-        # Use word boundaries for better matching
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            # Capitalize properly
-            found_skills.append(skill.title())
-    
-    # Extract soft skills
-    for skill in soft_skills:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill.title())
-    
-    # Remove duplicates and limit results
-    found_skills = list(set(found_skills))
+    found = SKILL_MATCHER.find(text.lower())
+    skills = [skill_taxonomy.skills[i] for i in {SKILL_KEYWORDS[k] for k in found if k in SKILL_KEYWORDS}]
     
     # Sort by relevance (technical skills first, then alphabetically)
-    technical_found = [s for s in found_skills if s.lower() in technical_skills]
-    soft_found = [s for s in found_skills if s.lower() in soft_skills]
+    technical_found = [s.name for s in skills if s.category != SOFT_SKILLS_CATEGORY]
+    soft_found = [s.name for s in skills if s.category == SOFT_SKILLS_CATEGORY]
     
-    return sorted(technical_found) + sorted(soft_found)
+    return sorted(technical_found, key=str.lower) + sorted(soft_found, key=str.lower)
 
 def extract_experience_years(text: str) -> float:
     """Extract years of experience from resume text"""
     
-    patterns = [
-        # "5 years of experience", "3+ years experience", etc.
-        r'(\d+(?:\.\d+)?)\s*[\+\-]?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
-        # "5+ years in", "3 years working", etc.
-        r'(\d+(?:\.\d+)?)\s*[\+\-]?\s*(?:years?|yrs?)\s+(?:in|working|as|with)',
-        # "experienced for 5 years"
-        r'experienced\s+for\s+(\d+(?:\.\d+)?)\s*(?:years?|yrs?)',
-        # "5 years professional experience"
-        r'(\d+(?:\.\d+)?)\s*(?:years?|yrs?)\s+professional'
-    ]
-    
     years = []
     text_lower = text.lower()
     
-    for pattern in patterns:
-        matches = re.findall(pattern, text_lower)
+    for pattern in PATTERNS["experience"]:
+        matches = pattern.findall(text_lower)
         for match in matches:
             try:
                 years.append(float(match))
@@ -232,17 +481,11 @@ def extract_experience_years(text: str) -> float:
 def infer_experience_from_dates(text: str) -> List[float]:
     """Infer experience from employment dates in resume"""
     
-    # Look for date ranges like "2020-2023", "Jan 2020 - Present", etc.
-    date_patterns = [
-        r'(\d{4})\s*[-–]\s*(\d{4})',  # 2020-2023
-        r'(\d{4})\s*[-–]\s*(?:present|current)',  # 2020-Present
-    ]
-    
     years = []
     current_year = 2024  # Update this to current year
     
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in PATTERNS["date_ranges"]:
+        matches = pattern.findall(text)
         for match in matches:
             try:
                 start_year = int(match[0])
@@ -262,17 +505,6 @@ def infer_experience_from_dates(text: str) -> List[float]:
 def extract_education(text: str) -> Dict[str, Any]:
     """Extract education information"""
     
-    degree_patterns = [
-        # Bachelor's degrees
-        r'(?:bachelor|b\.?\s*(?:tech|sc|com|a|e|s)|b\.?tech|b\.?sc|b\.?com|b\.?a|b\.?e|b\.?s)',
-        # Master's degrees  
-        r'(?:master|m\.?\s*(?:tech|sc|com|a|e|s)|m\.?tech|m\.?sc|m\.?com|m\.?a|m\.?e|m\.?s|mba|ms)',
-        # Doctoral degrees
-        r'(?:doctor|ph\.?d|phd|doctorate)',
-        # Other qualifications
-        r'(?:diploma|certificate|associate)'
-    ]
-    
     degrees = []
     institutions = []
     graduation_years = []
@@ -280,23 +512,17 @@ def extract_education(text: str) -> Dict[str, Any]:
     text_lower = text.lower()
     
     # Extract degrees
-    for pattern in degree_patterns:
-        matches = re.findall(pattern, text_lower)
+    for pattern in PATTERNS["degrees"]:
+        matches = pattern.findall(text_lower)
         degrees.extend(matches)
     
     # Extract institutions (look for common university/college indicators)
-    institution_patterns = [
-        r'(?:university|college|institute|school)\s+of\s+[\w\s]+',
-        r'[\w\s]+\s+(?:university|college|institute)',
-        r'(?:iit|nit|bits|iiit|isi)\s*[\w\s]*'
-    ]
-    
-    for pattern in institution_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in PATTERNS["institutions"]:
+        matches = pattern.findall(text)
         institutions.extend([m.strip() for m in matches])
     
     # Extract graduation years
-    year_matches = re.findall(r'\b(19|20)\d{2}\b', text)
+    year_matches = PATTERNS["graduation_year"].findall(text)
     for year in year_matches:
         year_int = int(year)
         if 1990 <= year_int <= 2030:  # Reasonable graduation year range
@@ -309,26 +535,31 @@ def extract_education(text: str) -> Dict[str, Any]:
         "highest_degree": get_highest_degree(degrees)
     }
 
+# Degree keyword -> level, used to rank degrees
+DEGREE_HIERARCHY = {
+    'phd': 5, 'doctorate': 5, 'doctor': 5,
+    'master': 4, 'mba': 4, 'ms': 4, 'm.tech': 4, 'm.sc': 4,
+    'bachelor': 3, 'b.tech': 3, 'b.sc': 3, 'b.com': 3,
+    'diploma': 2,
+    'certificate': 1
+}
+
+def degree_level(degree: str) -> int:
+    """Level of a degree string on the DEGREE_HIERARCHY scale (0 if unknown)"""
+    degree_lower = degree.lower().strip()
+    return max((level for key, level in DEGREE_HIERARCHY.items() if key in degree_lower), default=0)
+
 def get_highest_degree(degrees: List[str]) -> str:
     """Determine the highest degree from a list of degrees"""
     
-    degree_hierarchy = {
-        'phd': 5, 'doctorate': 5, 'doctor': 5,
-        'master': 4, 'mba': 4, 'ms': 4, 'm.tech': 4, 'm.sc': 4,
-        'bachelor': 3, 'b.tech': 3, 'b.sc': 3, 'b.com': 3,
-        'diploma': 2,
-        'certificate': 1
-    }
-    
     highest_level = 0
     highest_degree = "Unknown"
     
     for degree in degrees:
-        degree_lower = degree.lower().strip()
-        for key, level in degree_hierarchy.items():
-            if key in degree_lower and level > highest_level:
-                highest_level = level
-                highest_degree = degree.strip().title()
+        level = degree_level(degree)
+        if level > highest_level:
+            highest_level = level
+            highest_degree = degree.strip().title()
     
     return highest_degree
 
@@ -361,10 +592,10 @@ def extract_projects(text: str) -> List[str]:
         # Extract project information
         if in_project_section and line:
             # Look for bullet points or numbered items
-            if re.match(r'^[\-\•\*\d\.]', line):
+            if PATTERNS["bullet_start"].match(line):
                 if current_project:
                     projects.append(current_project.strip())
-                current_project = re.sub(r'^[\-\•\*\d\.]+\s*', '', line)
+                current_project = PATTERNS["bullet_prefix"].sub('', line)
             else:
                 current_project += " " + line
         
@@ -380,7 +611,7 @@ def extract_projects(text: str) -> List[str]:
     # Clean and deduplicate projects
     cleaned_projects = []
     for project in projects:
-        project = re.sub(r'\s+', ' ', project).strip()
+        project = PATTERNS["whitespace"].sub(' ', project).strip()
         if len(project) > 20 and project not in cleaned_projects:
             cleaned_projects.append(project)
     
@@ -391,16 +622,8 @@ def extract_certifications(text: str) -> List[str]:
     
     certifications = []
     
-    # Common certification patterns
-    cert_patterns = [
-        r'(?:certified|certification|certificate)\s+(?:in\s+)?([^\n]{5,80})',
-        r'([^\n]*(?:aws|azure|google cloud|gcp)[^\n]*(?:certified|certification)[^\n]*)',
-        r'([^\n]*(?:pmp|scrum|agile|cissp|ceh|cissp)[^\n]*)',
-        r'([^\n]*(?:oracle|microsoft|cisco|comptia)[^\n]*(?:certified|certification)[^\n]*)'
-    ]
-    
-    for pattern in cert_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in PATTERNS["certifications"]:
+        matches = pattern.findall(text)
         for match in matches:
             if isinstance(match, tuple):
                 match = match[0] if match[0] else (match[1] if len(match) > 1 else "")
@@ -414,31 +637,15 @@ def extract_certifications(text: str) -> List[str]:
 def extract_contact_info(text: str) -> Dict[str, str]:
     """Extract contact information"""
     
-    # Email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
-    # Phone patterns
-    phone_patterns = [
-        r'[\+]?[1-9]?\d{1,4}?[-.\s]?\(?\d{1,3}?\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-        r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{4,10}',
-        r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}'
-    ]
-    
-    # LinkedIn pattern
-    linkedin_pattern = r'(?:linkedin\.com/in/|linkedin\.com/pub/)([A-Za-z0-9\-_]+)'
-    
-    # GitHub pattern  
-    github_pattern = r'(?:github\.com/)([A-Za-z0-9\-_]+)'
-    
-    emails = re.findall(email_pattern, text)
+    emails = PATTERNS["email"].findall(text)
     
     phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in PATTERNS["phones"]:
+        matches = pattern.findall(text)
         phones.extend(matches)
     
-    linkedin_matches = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    github_matches = re.findall(github_pattern, text, re.IGNORECASE)
+    linkedin_matches = PATTERNS["linkedin"].findall(text)
+    github_matches = PATTERNS["github"].findall(text)
     
     return {
         "email": emails[0] if emails else "",
@@ -452,14 +659,8 @@ def extract_portfolio_url(text: str) -> str:
     """Extract portfolio/website URL"""
     
     # Look for common portfolio patterns
-    url_patterns = [
-        r'https?://(?:www\.)?[A-Za-z0-9\-_]+\.(?:com|net|org|io|dev|me)/[A-Za-z0-9\-_/]*',
-        r'(?:portfolio|website):\s*(https?://[^\s]+)',
-        r'(?:personal website|blog):\s*(https?://[^\s]+)'
-    ]
-    
-    for pattern in url_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in PATTERNS["portfolio_urls"]:
+        matches = pattern.findall(text)
         if matches:
             return matches[0] if isinstance(matches[0], str) else matches[0][0]
     
@@ -468,28 +669,11 @@ def extract_portfolio_url(text: str) -> str:
 def extract_languages(text: str) -> List[str]:
     """Extract programming and spoken languages"""
     
-    programming_languages = [
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby',
-        'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql'
-    ]
-    
-    spoken_languages = [
-        'english', 'spanish', 'french', 'german', 'chinese', 'japanese', 'korean',
-        'hindi', 'arabic', 'portuguese', 'russian', 'italian', 'dutch'
-    ]
-    
-    found_languages = []
-    text_lower = text.lower()
-    
-    # Extract programming languages
-    for lang in programming_languages:
-        if re.search(r'\b' + re.escape(lang) + r'\b', text_lower):
-            found_languages.append(f"{lang.title()} (Programming)")
+    found = SKILL_MATCHER.find(text.lower())
     
-    # Extract spoken languages
-    for lang in spoken_languages:
-        if re.search(r'\b' + re.escape(lang) + r'\b', text_lower):
-            found_languages.append(f"{lang.title()} (Spoken)")
+    # Keep the declared order: programming languages first, then spoken
+    found_languages = [f"{lang.title()} (Programming)" for lang in PROGRAMMING_LANGUAGES if lang in found]
+    found_languages.extend(f"{lang.title()} (Spoken)" for lang in SPOKEN_LANGUAGES if lang in found)
     
     return found_languages
 
@@ -0,0 +1,263 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.services.ai_engine import (
+    cosine_similarity_matrix, get_embedding_engine, job_embedding_text, resume_embedding_text
+)
+from app.services.resume_parser import KeywordMatcher, degree_level
+from app.services.skill_taxonomy import skill_taxonomy
+from app.services.skill_vectors import count_common, encode_skill_sets
+
+# Component weights inside the hard and soft match scores
+HARD_COMPONENT_WEIGHTS = {"skills": 0.6, "experience": 0.25, "education": 0.15}
+SOFT_COMPONENT_WEIGHTS = {"semantic": 0.5, "keywords": 0.3, "projects": 0.2}
+
+# Share of the skills score that comes from required (vs preferred) skills
+REQUIRED_SKILLS_SHARE = 0.8
+
+# Score used for a component when the resume gives us nothing to judge it by
+NEUTRAL_SCORE = 0.5
+
+# Degree levels named in job requirements (same scale as DEGREE_HIERARCHY)
+JOB_DEGREE_PATTERNS = [
+    (5, re.compile(r"\b(?:ph\.?\s?d|doctorate)\b", re.IGNORECASE)),
+    (4, re.compile(r"\b(?:master'?s?|mba|m\.?\s?tech|m\.?\s?sc)\b", re.IGNORECASE)),
+    (3, re.compile(r"\b(?:bachelor'?s?|b\.?\s?tech|b\.?\s?sc|b\.?\s?e|undergraduate)\b", re.IGNORECASE)),
+    (2, re.compile(r"\bdiploma\b", re.IGNORECASE)),
+]
+
+WORD_PATTERN = re.compile(r"[a-z][a-z0-9+#.\-]*[a-z0-9+#]|[a-z]")
+STOPWORDS = frozenset({
+    "the", "and", "for", "with", "you", "our", "are", "will", "have", "has", "this", "that",
+    "from", "your", "who", "all", "can", "ability", "work", "working", "team", "join", "looking",
+    "experience", "years", "year", "strong", "skills", "related", "field", "degree", "preferred",
+    "ideal", "candidate", "using", "build", "building", "both", "etc", "not", "but", "into",
+    "able", "good", "well", "including", "other", "such", "their", "they", "them", "more",
+})
+
+def required_degree_level(job: Dict[str, Any]) -> int:
+    """Lowest degree level a job's requirements text asks for (0 if none)"""
+    text = f"{job.get('requirements') or ''} {job.get('description') or ''}"
+    levels = [level for level, pattern in JOB_DEGREE_PATTERNS if pattern.search(text)]
+    return min(levels) if levels else 0
+
+def keywords(text: str) -> set:
+    """Content words of a text, lowercased and without stopwords"""
+    return {word for word in WORD_PATTERN.findall(text.lower()) if len(word) > 2 and word not in STOPWORDS}
+
+def _presence_matrix(rows: Sequence[set], vocabulary: Dict[str, int]) -> np.ndarray:
+    """0/1 matrix with one row per set and one column per vocabulary term"""
+    matrix = np.zeros((len(rows), len(vocabulary)), dtype=np.float32)
+    for i, terms in enumerate(rows):
+        columns = [vocabulary[term] for term in terms if term in vocabulary]
+        matrix[i, columns] = 1.0
+    return matrix
+
+def _coverage(matched: np.ndarray, totals: np.ndarray, empty_value: float) -> np.ndarray:
+    """matched / totals per column, with ``empty_value`` where a job lists nothing"""
+    safe_totals = np.where(totals > 0, totals, 1.0)
+    return np.where(totals > 0, matched / safe_totals, empty_value)
+
+def embed_resumes(resumes: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """float32 embeddings for parsed resumes (zero rows for resumes without text)"""
+    engine = get_embedding_engine()
+    vectors = np.zeros((len(resumes), engine.dim), dtype=np.float32)
+    rows = [i for i, resume in enumerate(resumes) if (resume.get("text") or "").strip()]
+    if rows:
+        vectors[rows] = engine.encode([resume_embedding_text(resumes[i]) for i in rows])
+    return vectors
+
+def embed_jobs(jobs: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """float32 embeddings for job records"""
+    return get_embedding_engine().encode([job_embedding_text(job) for job in jobs])
+
+def score_matrix(
+    resumes: Sequence[Dict[str, Any]],
+    jobs: Sequence[Dict[str, Any]],
+    resume_embeddings: Optional[np.ndarray] = None,
+    job_embeddings: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """Score every resume against every job in one vectorized pass.
+
+    ``resumes`` are parsed resume dicts (as returned by parse_resume; only
+    ``skills`` is required) and ``jobs`` are job records. Every returned
+    array has shape ``(len(resumes), len(jobs))`` with values in 0-100,
+    so one resume against many jobs and many resumes against one job are
+    both a single call. Precomputed embeddings (rows aligned with
+    ``resumes``/``jobs``) can be passed in; missing ones are encoded here.
+    """
+    settings = get_settings()
+    n_resumes, n_jobs = len(resumes), len(jobs)
+
+    # Skill vocabulary (taxonomy keys, so aliases match) over every job's required and preferred skills
+    required = [skill_taxonomy.keys(job.get("skills_required") or []) for job in jobs]
+    preferred = [skill_taxonomy.keys(job.get("skills_preferred") or []) - req for job, req in zip(jobs, required)]
+    skill_vocab = {skill: i for i, skill in enumerate(sorted(set().union(*required, *preferred), key=str))}
+
+    # Skill sets as packed bit vectors; matches are AND + popcount over R x J
+    resume_skills = [skill_taxonomy.keys(resume.get("skills") or []) for resume in resumes]
+    resume_bits = encode_skill_sets(resume_skills, skill_vocab)[:, None, :]      # R x 1 x W
+    required_bits = encode_skill_sets(required, skill_vocab)[None, :, :]         # 1 x J x W
+    preferred_bits = encode_skill_sets(preferred, skill_vocab)[None, :, :]       # 1 x J x W
+    required_total = np.array([len(skills) for skills in required], dtype=np.float32)[None, :]
+    preferred_total = np.array([len(skills) for skills in preferred], dtype=np.float32)[None, :]
+
+    required_coverage = _coverage(count_common(resume_bits, required_bits), required_total, 1.0)
+    preferred_coverage = _coverage(count_common(resume_bits, preferred_bits), preferred_total, 0.0)
+    skills_score = np.where(
+        preferred_total > 0,
+        REQUIRED_SKILLS_SHARE * required_coverage + (1 - REQUIRED_SKILLS_SHARE) * preferred_coverage,
+        required_coverage
+    )
+
+    # Experience: inside [min, max] is a full match, below scales down, above is a mild penalty
+    years = np.array([_number(resume.get("experience")) for resume in resumes], dtype=np.float32)[:, None]
+    exp_min = np.array([job.get("experience_min") or 0 for job in jobs], dtype=np.float32)[None, :]
+    exp_max = np.array([job.get("experience_max") or 0 for job in jobs], dtype=np.float32)[None, :]
+    exp_max = np.maximum(exp_max, exp_min)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        below = np.where(exp_min > 0, years / np.where(exp_min > 0, exp_min, 1.0), 1.0)
+    above = np.maximum(0.6, 1.0 - 0.1 * (years - exp_max))
+    experience_score = np.where(years < exp_min, below, np.where(years > exp_max, above, 1.0))
+    experience_score = np.where(np.isnan(years), NEUTRAL_SCORE, np.clip(experience_score, 0.0, 1.0))
+
+    # Education: resume degree level against the level the job asks for
+    resume_levels = np.array([_resume_degree_level(resume) for resume in resumes], dtype=np.float32)[:, None]
+    job_levels = np.array([required_degree_level(job) for job in jobs], dtype=np.float32)[None, :]
+    education_score = np.where(
+        job_levels > 0,
+        np.minimum(1.0, resume_levels / np.where(job_levels > 0, job_levels, 1.0)),
+        1.0
+    )
+    education_score = np.where(resume_levels > 0, education_score, NEUTRAL_SCORE)
+
+    # Keyword overlap between resume text and the job description
+    job_keywords = [keywords(f"{job.get('description') or ''} {job.get('requirements') or ''}") for job in jobs]
+    keyword_vocab = {word: i for i, word in enumerate(sorted(set().union(*job_keywords)))}
+    resume_texts = [resume.get("text") or "" for resume in resumes]
+    resume_keyword_matrix = _presence_matrix([keywords(text) for text in resume_texts], keyword_vocab)
+    job_keyword_matrix = _presence_matrix(job_keywords, keyword_vocab)
+    keyword_score = _coverage(resume_keyword_matrix @ job_keyword_matrix.T, job_keyword_matrix.sum(axis=1), 0.0)
+
+    # Project relevance: share of the job's skills mentioned in the resume's projects
+    if skill_vocab:
+        aliases = skill_taxonomy.keywords_for(
+            skill for job in jobs for skill in (job.get("skills_required") or []) + (job.get("skills_preferred") or [])
+        )
+        matcher = keyword_matcher(frozenset(aliases))
+        project_skills = [
+            {aliases[alias] for alias in matcher.find(" ".join(resume.get("projects") or []).lower())}
+            for resume in resumes
+        ]
+    else:
+        project_skills = [set() for _ in resumes]
+    project_bits = encode_skill_sets(project_skills, skill_vocab)[:, None, :]
+    projects_score = _coverage(
+        count_common(project_bits, required_bits | preferred_bits),
+        required_total + preferred_total,
+        0.0
+    )
+
+    # Semantic similarity: cosine of resume and job embeddings, one matrix product
+    if resume_embeddings is None:
+        resume_embeddings = embed_resumes(resumes)
+    if job_embeddings is None:
+        job_embeddings = embed_jobs(jobs)
+    semantic_score = np.clip(cosine_similarity_matrix(resume_embeddings, job_embeddings), 0.0, 1.0)
+
+    # Resumes without text were never parsed, so keywords/projects/semantics say nothing about them
+    has_text = np.array([bool(text.strip()) for text in resume_texts])[:, None]
+    keyword_score = np.where(has_text, keyword_score, NEUTRAL_SCORE)
+    projects_score = np.where(has_text, projects_score, NEUTRAL_SCORE)
+    semantic_score = np.where(has_text, semantic_score, NEUTRAL_SCORE)
+
+    hard = (
+        HARD_COMPONENT_WEIGHTS["skills"] * skills_score
+        + HARD_COMPONENT_WEIGHTS["experience"] * experience_score
+        + HARD_COMPONENT_WEIGHTS["education"] * education_score
+    )
+    soft = (
+        SOFT_COMPONENT_WEIGHTS["semantic"] * semantic_score
+        + SOFT_COMPONENT_WEIGHTS["keywords"] * keyword_score
+        + SOFT_COMPONENT_WEIGHTS["projects"] * projects_score
+    )
+
+    total_weight = (settings.HARD_MATCH_WEIGHT + settings.SOFT_MATCH_WEIGHT) or 1.0
+    overall = (settings.HARD_MATCH_WEIGHT * hard + settings.SOFT_MATCH_WEIGHT * soft) / total_weight
+
+    shape = (n_resumes, n_jobs)
+    return {
+        "overall_score": np.broadcast_to(overall * 100, shape),
+        "hard_match_score": np.broadcast_to(hard * 100, shape),
+        "soft_match_score": np.broadcast_to(soft * 100, shape),
+        "skills_match_score": np.broadcast_to(skills_score * 100, shape),
+        "required_skills_score": np.broadcast_to(required_coverage * 100, shape),
+        "experience_match_score": np.broadcast_to(experience_score * 100, shape),
+        "education_match_score": np.broadcast_to(education_score * 100, shape),
+        "keyword_match_score": np.broadcast_to(keyword_score * 100, shape),
+        "semantic_similarity_score": np.broadcast_to(semantic_score * 100, shape),
+        "projects_relevance_score": np.broadcast_to(projects_score * 100, shape),
+    }
+
+@lru_cache(maxsize=64)
+def keyword_matcher(keywords: frozenset) -> KeywordMatcher:
+    """KeywordMatcher for a keyword set, compiled once (jobs are scored against the same skills repeatedly)"""
+    return KeywordMatcher(keywords)
+
+def verdict_for(score: float) -> str:
+    """Map an overall score to a High/Medium/Low verdict"""
+    if score >= 75:
+        return "High"
+    elif score >= 50:
+        return "Medium"
+    return "Low"
+
+def skill_gaps(resume: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Matched and missing job skills for one resume, in the job's own spelling"""
+    resume_skills = skill_taxonomy.keys(resume.get("skills") or [])
+    required = [(skill_taxonomy.key(s), s) for s in job.get("skills_required") or [] if s.strip()]
+    required_ids = {skill_id for skill_id, _ in required}
+    job_skills = required + [
+        (skill_id, s) for skill_id, s in ((skill_taxonomy.key(s), s) for s in job.get("skills_preferred") or [] if s.strip())
+        if skill_id not in required_ids
+    ]
+    return {
+        "matched_skills": [s for skill_id, s in job_skills if skill_id in resume_skills],
+        "missing_skills": [s for skill_id, s in required if skill_id not in resume_skills]
+    }
+
+def score_pairs(
+    resumes: Sequence[Dict[str, Any]],
+    jobs: Sequence[Dict[str, Any]],
+    resume_embeddings: Optional[np.ndarray] = None,
+    job_embeddings: Optional[np.ndarray] = None
+) -> List[List[Dict[str, Any]]]:
+    """Per-pair score dicts (rounded, with verdict and skill gaps) for every resume x job"""
+    scores = score_matrix(resumes, jobs, resume_embeddings, job_embeddings)
+    results = []
+    for i, resume in enumerate(resumes):
+        row = []
+        for j, job in enumerate(jobs):
+            pair = {name: round(float(values[i, j]), 1) for name, values in scores.items()}
+            pair["verdict"] = verdict_for(pair["overall_score"])
+            pair.update(skill_gaps(resume, job))
+            row.append(pair)
+        results.append(row)
+    return results
+
+def _number(value) -> float:
+    """Float for a numeric field, NaN when it is missing"""
+    try:
+        return float(value) if value is not None else float("nan")
+    except (TypeError, ValueError):
+        return float("nan")
+
+def _resume_degree_level(resume: Dict[str, Any]) -> int:
+    education = resume.get("education") or {}
+    if isinstance(education, dict):
+        return degree_level(education.get("highest_degree") or "")
+    return degree_level(str(education))
@@ -0,0 +1,101 @@
+import heapq
+import threading
+from bisect import bisect_right
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from app.services.skill_taxonomy import skill_taxonomy
+
+class SkillIndex:
+    """Inverted index from taxonomy skill id to the candidates that have it.
+
+    Each skill keeps a posting set of candidate ids and every candidate
+    remembers its own skills, so updates only touch the postings of skills
+    that were added or dropped. Boolean queries intersect starting from
+    the smallest posting, and a skill's frequency is the size of its
+    posting, so neither walks the whole candidate pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[int, Set[Hashable]] = {}
+        self._skills_of: Dict[Hashable, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._skills_of)
+
+    def update(self, key: Hashable, skills: Iterable[str]):
+        """Set (or replace) the skills of one candidate"""
+        with self._lock:
+            wanted = skill_taxonomy.ids(skills)
+            previous = self._skills_of.get(key, set())
+            for skill in previous - wanted:
+                self._discard(skill, key)
+            for skill in wanted - previous:
+                self._postings.setdefault(skill, set()).add(key)
+            self._skills_of[key] = wanted
+
+    def remove(self, key: Hashable):
+        with self._lock:
+            for skill in self._skills_of.pop(key, set()):
+                self._discard(skill, key)
+
+    def _discard(self, skill: int, key: Hashable):
+        posting = self._postings.get(skill)
+        if posting is not None:
+            posting.discard(key)
+            if not posting:
+                del self._postings[skill]
+
+    def rebuild(self, entries: Iterable[Tuple[Hashable, Iterable[str]]]):
+        with self._lock:
+            self._postings, self._skills_of = {}, {}
+            for key, skills in entries:
+                self.update(key, skills)
+
+    def _posting(self, skill: str) -> Set[Hashable]:
+        skill_id = skill_taxonomy.find(skill)
+        return self._postings.get(skill_id, set()) if skill_id is not None else set()
+
+    def count(self, skill: str) -> int:
+        """Number of candidates with a skill"""
+        return len(self._posting(skill))
+
+    def most_common(self, limit: int) -> List[Tuple[str, int]]:
+        """The ``limit`` most frequent skills as (name, candidates) pairs"""
+        with self._lock:
+            top = heapq.nlargest(limit, self._postings.items(), key=lambda item: len(item[1]))
+            return [(skill_taxonomy.skills[skill].name, len(posting)) for skill, posting in top]
+
+    def search(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = ()
+    ) -> Set[Hashable]:
+        """Candidates having every ``all_of`` skill, at least one ``any_of`` skill and no ``none_of`` skill.
+
+        With no positive terms the query runs over every indexed candidate.
+        """
+        with self._lock:
+            required = [self._posting(s) for s in all_of]
+            alternatives = [self._posting(s) for s in any_of]
+            if alternatives:
+                required.append(set().union(*alternatives))
+            if required:
+                required.sort(key=len)
+                matches = required[0].intersection(*required[1:])
+            else:
+                matches = set(self._skills_of)
+            for skill in none_of:
+                matches -= self._posting(skill)
+            return matches
+
+def page_after(keys: Iterable[int], cursor: Optional[int], limit: int) -> Tuple[List[int], Optional[int]]:
+    """One id-ordered page of ``keys`` after ``cursor``, and the cursor for the next page (None on the last)"""
+    ordered = sorted(keys)
+    start = bisect_right(ordered, cursor) if cursor is not None else 0
+    page = ordered[start:start + limit]
+    return page, page[-1] if start + limit < len(ordered) and page else None
+
+# Shared candidate skill index
+candidate_skill_index = SkillIndex()
@@ -0,0 +1,181 @@
+import re
+import threading
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# Category a skill outside the taxonomy (e.g. typed into a job) falls under
+UNCATEGORIZED = "Other"
+
+# category -> [(canonical name, aliases)]. Aliases are written as they
+# appear in resumes. Lookups ignore case, spacing, dots and dashes, and
+# resume text is scanned for every name and alias with its separators
+# written any of those ways, so "Node JS" and "NODE-JS" need no entries of
+# their own. Spellings without a separator ("rstudio") cannot be split, so
+# their spaced forms are listed as aliases. An alias must not be a word of
+# another skill's spelling: a bare "js" would also match "Node.js".
+SKILL_TAXONOMY: Dict[str, List[Tuple[str, Sequence[str]]]] = {
+    "Programming Languages": [
+        ("Python", ()), ("Java", ()), ("JavaScript", ("ecmascript", "es6")), ("TypeScript", ()),
+        ("C++", ("cpp",)), ("C#", ("csharp", "c sharp")), ("PHP", ()), ("Ruby", ()), ("Go", ("golang",)),
+        ("Rust", ()), ("Swift", ()), ("Kotlin", ()), ("Scala", ()), ("R", ()), ("MATLAB", ()), ("SQL", ()),
+        ("NoSQL", ()), ("HTML", ("html5",)), ("CSS", ("css3",)), ("SCSS", ()), ("Sass", ()),
+    ],
+    "Frameworks & Libraries": [
+        ("React", ("react.js", "reactjs")), ("Angular", ("angularjs", "angular.js")), ("Vue.js", ("vue", "vuejs")),
+        ("Node.js", ("nodejs",)), ("Express.js", ("express", "expressjs")), ("Django", ()), ("Flask", ()),
+        ("FastAPI", ()), ("Spring", ()), ("Spring Boot", ()), ("Laravel", ()), ("Symfony", ()),
+        ("Ruby on Rails", ("rails", "ror")), ("Ember.js", ("ember", "emberjs")), ("Backbone.js", ("backbone", "backbonejs")),
+        ("jQuery", ()), ("Bootstrap", ()), ("Tailwind CSS", ("tailwind", "tailwindcss")),
+        ("Material-UI", ("mui", "material ui")), ("Ant Design", ("antd",)),
+    ],
+    "Databases": [
+        ("MySQL", ()), ("PostgreSQL", ("postgres",)), ("MongoDB", ("mongo",)), ("Redis", ()),
+        ("Elasticsearch", ()), ("Cassandra", ()), ("DynamoDB", ()), ("SQLite", ()), ("Oracle", ()),
+        ("SQL Server", ("mssql", "microsoft sql server")), ("MariaDB", ()), ("CouchDB", ()),
+    ],
+    "Cloud & DevOps": [
+        ("AWS", ("amazon web services",)), ("Azure", ("microsoft azure",)),
+        ("GCP", ("google cloud", "google cloud platform")), ("Docker", ()), ("Kubernetes", ("k8s",)),
+        ("Jenkins", ()), ("CI/CD", ()), ("Terraform", ()), ("Ansible", ()), ("Puppet", ()), ("Chef", ()),
+        ("Vagrant", ()), ("Heroku", ()), ("Vercel", ()), ("Netlify", ()),
+    ],
+    "Data Science & AI/ML": [
+        ("Machine Learning", ("ml",)), ("Deep Learning", ()), ("AI", ("artificial intelligence",)),
+        ("TensorFlow", ()), ("PyTorch", ()), ("Keras", ()), ("scikit-learn", ("sklearn",)), ("Pandas", ()),
+        ("NumPy", ()), ("Matplotlib", ()), ("Seaborn", ()), ("Plotly", ()), ("Jupyter", ()),
+        ("RStudio", ("r studio",)), ("Tableau", ()), ("Power BI", ()), ("Spark", ("apache spark", "pyspark")),
+        ("Hadoop", ()), ("Kafka", ("apache kafka",)),
+    ],
+    "Mobile Development": [
+        ("React Native", ()), ("Flutter", ()), ("iOS", ()), ("Android", ()), ("Xamarin", ()), ("Cordova", ()),
+    ],
+    "Tools & Other": [
+        ("Git", ()), ("GitHub", ()), ("GitLab", ()), ("Bitbucket", ()), ("Jira", ()), ("Confluence", ()),
+        ("Slack", ()), ("Trello", ()), ("Postman", ()), ("Swagger", ()), ("Figma", ()), ("Sketch", ()),
+        ("Adobe Creative Suite", ()), ("Photoshop", ()),
+    ],
+    "Soft Skills": [
+        ("Leadership", ()), ("Teamwork", ()), ("Communication", ()), ("Problem Solving", ()),
+        ("Analytical Thinking", ()), ("Project Management", ()), ("Time Management", ()), ("Adaptability", ()),
+        ("Creativity", ()), ("Collaboration", ()), ("Critical Thinking", ()), ("Decision Making", ()),
+        ("Negotiation", ()), ("Presentation", ()), ("Mentoring", ()),
+    ],
+}
+
+SOFT_SKILLS_CATEGORY = "Soft Skills"
+
+# Separators dropped from lookup keys ("+" and "#" stay: C++ and C# are not C)
+SEPARATORS = re.compile(r"[\s.\-_/]+")
+
+def lookup_key(name: str) -> str:
+    """Form a skill name is looked up by: lowercase, without spaces, dots, dashes or slashes"""
+    return SEPARATORS.sub("", name.lower())
+
+def spellings(keyword: str) -> Set[str]:
+    """A lowercase name or alias with its separators written as space, dash, dot or nothing"""
+    return {keyword} | {SEPARATORS.sub(separator, keyword) for separator in (" ", "-", ".", "")}
+
+class Skill(NamedTuple):
+    id: int
+    name: str
+    category: str
+    aliases: Tuple[str, ...]
+
+class SkillTaxonomy:
+    """Canonical skills with aliases and parent categories.
+
+    Every alias is compiled into one ``lookup_key -> skill id`` table at
+    import, so resolving "nodejs", "Node JS" or "node.js" to the same
+    canonical Node.js is a single dict lookup, and skill sets compare as
+    sets of integers. ``skill_id`` interns skills outside the taxonomy
+    under ``UNCATEGORIZED`` when candidate data is indexed, so their ids
+    are stable for the life of the process; query-time comparisons use
+    ``key``, which never interns (a job may ask for anything).
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[Tuple[str, Sequence[str]]]]):
+        self._lock = threading.Lock()
+        self.skills: List[Skill] = []
+        self._ids: Dict[str, int] = {}
+        for category, entries in taxonomy.items():
+            for name, aliases in entries:
+                self._add(name, category, tuple(alias.lower() for alias in aliases))
+        self.known = len(self.skills)
+
+    def _add(self, name: str, category: str, aliases: Tuple[str, ...]) -> int:
+        skill_id = len(self.skills)
+        self.skills.append(Skill(skill_id, name, category, aliases))
+        for alias in (name, *aliases):
+            self._ids.setdefault(lookup_key(alias), skill_id)
+        return skill_id
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def find(self, name: str) -> Optional[int]:
+        """Id of a skill name or alias, or None if it is not known"""
+        return self._ids.get(lookup_key(name))
+
+    def skill_id(self, name: str) -> int:
+        """Id of a skill name or alias, interning unknown skills (for indexing candidate data)"""
+        key = lookup_key(name)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(key)
+                if skill_id is None:
+                    skill_id = self._add(name.strip(), UNCATEGORIZED, ())
+        return skill_id
+
+    def ids(self, names: Iterable[str]) -> Set[int]:
+        """Ids of a list of skill names, interning unknown ones (blank entries are ignored)"""
+        return {self.skill_id(name) for name in names if name and name.strip()}
+
+    def key(self, name: str) -> Hashable:
+        """Id of a known skill, else its lookup key; never interns, for query-time comparisons"""
+        skill_id = self.find(name)
+        return skill_id if skill_id is not None else lookup_key(name)
+
+    def keys(self, names: Iterable[str]) -> Set[Hashable]:
+        """``key`` of each skill name (blank entries are ignored)"""
+        return {self.key(name) for name in names if name and name.strip()}
+
+    def canonical(self, name: str) -> str:
+        """Canonical spelling of a skill ("nodejs" -> "Node.js"); unknown skills come back stripped"""
+        skill_id = self.find(name)
+        return self.skills[skill_id].name if skill_id is not None else name.strip()
+
+    def canonicalize(self, names: Iterable[str]) -> List[str]:
+        """Canonical spellings of a skill list, without duplicates, in first-seen order"""
+        return list(dict.fromkeys(self.canonical(name) for name in names if name and name.strip()))
+
+    def category(self, name: str) -> str:
+        skill_id = self.find(name)
+        return self.skills[skill_id].category if skill_id is not None else UNCATEGORIZED
+
+    def _spellings(self, skill: Skill) -> Set[str]:
+        return {spelling for alias in (skill.name.lower(), *skill.aliases) for spelling in spellings(alias)}
+
+    def keywords(self, categories: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """``lowercase spelling -> id`` for the known skills (of ``categories``), for scanning free text"""
+        wanted = set(categories) if categories is not None else None
+        return {
+            spelling: skill.id
+            for skill in self.skills[:self.known] if wanted is None or skill.category in wanted
+            for spelling in self._spellings(skill)
+        }
+
+    def keywords_for(self, names: Iterable[str]) -> Dict[str, Hashable]:
+        """``lowercase spelling -> key`` for the given skill names (an unknown skill is found by its own spellings)"""
+        keywords = {}
+        for name in names:
+            if not name or not name.strip():
+                continue
+            skill_id = self.find(name)
+            if skill_id is None:
+                keywords.update(dict.fromkeys(spellings(name.strip().lower()), lookup_key(name)))
+            else:
+                keywords.update(dict.fromkeys(self._spellings(self.skills[skill_id]), skill_id))
+        return keywords
+
+# Shared skill taxonomy
+skill_taxonomy = SkillTaxonomy(SKILL_TAXONOMY)
@@ -0,0 +1,148 @@
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.skill_taxonomy import skill_taxonomy
+
+WORD_BITS = 64
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase canonical name, so every alias of a skill shares one key"""
+    return skill_taxonomy.canonical(skill).lower()
+
+def words_for(size: int) -> int:
+    """Number of uint64 words needed for ``size`` bits (at least one)"""
+    return max(1, -(-size // WORD_BITS))
+
+def encode_skill_sets(skill_sets: Sequence[Iterable[str]], vocabulary: Dict[str, int], words: Optional[int] = None) -> np.ndarray:
+    """Pack each skill set into a row of uint64 words (bit i = vocabulary term i)"""
+    words = words or words_for(len(vocabulary))
+    bits = np.zeros((len(skill_sets), words * WORD_BITS), dtype=np.uint8)
+    for row, skills in enumerate(skill_sets):
+        columns = [vocabulary[s] for s in skills if s in vocabulary]
+        bits[row, columns] = 1
+    # Little-endian bit order so bit i of the row lands in word i // 64
+    return np.packbits(bits, axis=1, bitorder="little").view(np.uint64)
+
+def count_common(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Popcount of AND over the last axis (broadcasting like ``left & right``)"""
+    return np.bitwise_count(left & right).sum(axis=-1, dtype=np.int32)
+
+class SkillVocabulary:
+    """Append-only mapping from normalized skill name to bit position"""
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, skill: str) -> bool:
+        return normalize_skill(skill) in self._index
+
+    @property
+    def words(self) -> int:
+        return words_for(len(self._index))
+
+    def add(self, skills: Iterable[str]) -> List[int]:
+        ids = []
+        for skill in skills:
+            key = normalize_skill(skill)
+            if key not in self._index:
+                self._index[key] = len(self._index)
+            ids.append(self._index[key])
+        return ids
+
+    def encode(self, skills: Iterable[str], words: Optional[int] = None) -> np.ndarray:
+        """Bit vector for one skill list, adding unseen skills to the vocabulary"""
+        skills = {normalize_skill(s) for s in skills}
+        self.add(skills)
+        return encode_skill_sets([skills], self._index, max(words or 0, self.words))[0]
+
+    def encode_known(self, skills: Iterable[str], words: Optional[int] = None) -> np.ndarray:
+        """Bit vector for one skill list without touching the vocabulary; unseen skills have no bit"""
+        return encode_skill_sets([{normalize_skill(s) for s in skills}], self._index, max(words or 0, self.words))[0]
+
+class SkillMatrix:
+    """Packed skill bit vectors for a pool of candidates.
+
+    Rows are kept up to date as candidates are created, analysed or
+    deleted, so the matched/missing counts and coverage of a whole
+    applicant pool against one job come from a single AND + popcount over
+    the matrix instead of a Python set intersection per candidate. Only
+    candidate skills grow the vocabulary: a query skill no candidate has
+    gets no bit and counts as missing for everyone.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary):
+        self._lock = threading.RLock()
+        self.vocabulary = vocabulary
+        self._bits = np.zeros((0, 1), dtype=np.uint64)
+        self._keys: List[Optional[Hashable]] = []
+        self._row_of: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._row_of
+
+    def _ensure_shape(self, rows: int, words: int):
+        current_rows, current_words = self._bits.shape
+        if rows <= current_rows and words <= current_words:
+            return
+        # Grow rows geometrically so appends stay amortised O(1)
+        new_rows = max(rows, current_rows * 2, 64) if rows > current_rows else current_rows
+        grown = np.zeros((new_rows, max(words, current_words)), dtype=np.uint64)
+        grown[:current_rows, :current_words] = self._bits
+        self._bits = grown
+
+    def update(self, key: Hashable, skills: Iterable[str]):
+        """Set (or replace) the skill vector of one candidate"""
+        with self._lock:
+            vector = self.vocabulary.encode(skills)
+            row = self._row_of.get(key)
+            if row is None:
+                row = self._free.pop() if self._free else len(self._keys)
+                if row == len(self._keys):
+                    self._keys.append(None)
+                self._keys[row] = key
+                self._row_of[key] = row
+            self._ensure_shape(len(self._keys), len(vector))
+            self._bits[row, :] = 0
+            self._bits[row, :len(vector)] = vector
+
+    def remove(self, key: Hashable):
+        with self._lock:
+            row = self._row_of.pop(key, None)
+            if row is not None:
+                self._bits[row, :] = 0
+                self._keys[row] = None
+                self._free.append(row)
+
+    def match(self, skills: Sequence[str], keys: Optional[Iterable[Hashable]] = None) -> Dict[str, np.ndarray]:
+        """Matched/missing counts and coverage of ``skills`` for every row (or ``keys``)"""
+        wanted = {normalize_skill(s) for s in skills}
+        with self._lock:
+            # update() keeps the matrix as wide as the vocabulary, so the query vector fits it
+            job_vector = self.vocabulary.encode_known(wanted, words=self._bits.shape[1])
+            if keys is None:
+                rows = np.fromiter(self._row_of.values(), dtype=np.int64, count=len(self._row_of))
+            else:
+                rows = np.fromiter((self._row_of[k] for k in keys if k in self._row_of), dtype=np.int64)
+            row_keys = np.array([self._keys[r] for r in rows], dtype=object)
+            matched = count_common(self._bits[rows], job_vector[None, :])
+
+        total = len(wanted)
+        return {
+            "keys": row_keys,
+            "matched": matched,
+            "missing": total - matched,
+            "coverage": matched / total if total else np.ones(len(rows), dtype=np.float64)
+        }
+
+# Shared vocabulary and candidate skill matrix
+skill_vocabulary = SkillVocabulary()
+candidate_skill_matrix = SkillMatrix(skill_vocabulary)
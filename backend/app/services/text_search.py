@@ -0,0 +1,122 @@
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import get_settings
+
+TERM_PATTERN = re.compile(r"\w+")
+
+def match_expression(query: str, match_all: bool = False) -> Optional[str]:
+    """FTS5 MATCH expression for a free-text query (each word quoted, so no query syntax leaks through)"""
+    terms = list(dict.fromkeys(term.lower() for term in TERM_PATTERN.findall(query)))
+    if not terms:
+        return None
+    return (" AND " if match_all else " OR ").join(f'"{term}"' for term in terms)
+
+class ResumeTextIndex:
+    """Full-text index over resume texts, ranked with BM25 (SQLite FTS5).
+
+    Each candidate's resume text is one FTS5 row whose rowid is the
+    candidate id, so adds and deletes are incremental and the index lives
+    in its own SQLite file beside the parse cache. Words are stemmed
+    (porter) so "streaming" also finds "stream". Queries match any of their
+    words by default and are ranked by FTS5's bm25(), which rewards rare
+    words and resumes matching more of the query.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS resume_text USING fts5(text, tokenize = 'porter unicode61')"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM resume_text").fetchone()[0]
+
+    def add(self, candidate_id: int, text: str):
+        """Index (or re-index) one candidate's resume text"""
+        self.add_many([(candidate_id, text)])
+
+    def add_many(self, entries: Iterable[Tuple[int, str]]):
+        """Index (or re-index) several resume texts in one transaction"""
+        with self._lock:
+            db = self._db()
+            for candidate_id, text in entries:
+                db.execute("DELETE FROM resume_text WHERE rowid = ?", (candidate_id,))
+                db.execute("INSERT INTO resume_text (rowid, text) VALUES (?, ?)", (candidate_id, text))
+            db.commit()
+
+    def ids(self) -> Set[int]:
+        """Candidate ids that have indexed text"""
+        with self._lock:
+            return {row[0] for row in self._db().execute("SELECT rowid FROM resume_text")}
+
+    def delete(self, candidate_id: int):
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM resume_text WHERE rowid = ?", (candidate_id,))
+            db.commit()
+
+    def retain(self, candidate_ids: Iterable[int]):
+        """Drop rows of candidates that no longer exist (e.g. deleted while the index was offline)"""
+        with self._lock:
+            db = self._db()
+            db.execute("CREATE TEMP TABLE IF NOT EXISTS live_candidates (id INTEGER PRIMARY KEY)")
+            db.execute("DELETE FROM live_candidates")
+            db.executemany("INSERT OR IGNORE INTO live_candidates (id) VALUES (?)", ((i,) for i in candidate_ids))
+            db.execute("DELETE FROM resume_text WHERE rowid NOT IN (SELECT id FROM live_candidates)")
+            db.execute("DELETE FROM live_candidates")
+            db.commit()
+
+    def search(self, query: str, limit: int = 20, offset: int = 0, match_all: bool = False) -> Tuple[List[Dict], int]:
+        """One page of matching candidates, best first, and the total number of matches.
+
+        Each hit is ``{"candidate_id", "relevance", "snippet"}`` where
+        relevance is the negated bm25() score (higher is better) and the
+        snippet shows matched words in ``[brackets]``.
+        """
+        expression = match_expression(query, match_all=match_all)
+        if expression is None:
+            return [], 0
+        with self._lock:
+            db = self._db()
+            total = db.execute("SELECT COUNT(*) FROM resume_text WHERE resume_text MATCH ?", (expression,)).fetchone()[0]
+            rows = db.execute(
+                "SELECT rowid, bm25(resume_text), snippet(resume_text, 0, '[', ']', '…', 16)"
+                " FROM resume_text WHERE resume_text MATCH ?"
+                " ORDER BY bm25(resume_text) LIMIT ? OFFSET ?",
+                (expression, limit, offset)
+            ).fetchall()
+        hits = [
+            {"candidate_id": candidate_id, "relevance": round(-score, 4), "snippet": snippet}
+            for candidate_id, score, snippet in rows
+        ]
+        return hits, total
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Global resume text index instance
+_index = None
+
+def get_resume_text_index() -> ResumeTextIndex:
+    """Get the resume full-text index (singleton pattern)"""
+    global _index
+    if _index is None:
+        _index = ResumeTextIndex(get_settings().UPLOAD_DIR / "resume_text.sqlite3")
+    return _index
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import uuid
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import UploadFile
+
+# Read size used when streaming files from disk
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Leading bytes of each accepted file type
+FILE_SIGNATURES = {
+    ".pdf": (b"%PDF-",),
+    ".docx": (b"PK\x03\x04",),  # DOCX is a ZIP package
+    ".doc": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),  # OLE2 compound document
+    ".zip": (b"PK\x03\x04", b"PK\x05\x06"),
+}
+
+# PDF readers accept a header anywhere in the first kilobyte
+PDF_HEADER_WINDOW = 1024
+
+class UploadRejectedError(ValueError):
+    """An uploaded file failed a type or size check"""
+
+class FileTooLargeError(UploadRejectedError):
+    """An uploaded file is over the size limit"""
+
+class UnsupportedFileTypeError(UploadRejectedError):
+    """An uploaded file's name or content is not an accepted type"""
+
+def compute_file_hash(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def check_file_signature(suffix: str, head: bytes):
+    """Raise UnsupportedFileTypeError unless ``head`` (the file's first bytes) matches the extension"""
+    suffix = suffix.lower()
+    signatures = FILE_SIGNATURES.get(suffix)
+    if signatures is None:
+        raise UnsupportedFileTypeError(f"Unsupported file type: {suffix or 'no extension'}")
+    if suffix == ".pdf":
+        matches = signatures[0] in head[:PDF_HEADER_WINDOW]
+    else:
+        matches = head.startswith(signatures)
+    if not matches:
+        raise UnsupportedFileTypeError(f"File content is not a valid {suffix.lstrip('.').upper()} file")
+
+class SpoolWriter:
+    """Write a file chunk by chunk, hashing it and enforcing type and size on the way.
+
+    The first chunk is checked against the extension's file signature and
+    the write aborts with FileTooLargeError as soon as ``max_bytes`` is
+    passed, so a rejected upload never lands on disk in full.
+    """
+
+    def __init__(self, path: Path, suffix: str, max_bytes: Optional[int] = None):
+        self.path = path
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._file = open(path, "wb")
+
+    def write(self, chunk: bytes):
+        if self.size == 0:
+            check_file_signature(self.suffix, chunk)
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise FileTooLargeError(f"File exceeds the {self.max_bytes // (1024 * 1024)}MB limit")
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def close(self) -> str:
+        """Close the file and return its SHA-256 hex digest"""
+        self._file.close()
+        if self.size == 0:
+            raise UnsupportedFileTypeError("File is empty")
+        return self._digest.hexdigest()
+
+    def abort(self):
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+def _incoming_path(directory: Path) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f".incoming-{uuid.uuid4().hex}"
+
+def _store_by_hash(temp_path: Path, content_hash: str, suffix: str) -> Path:
+    """Move a spooled file to ``<content hash><suffix>``; identical files share one copy"""
+    path = temp_path.parent / f"{content_hash}{suffix.lower()}"
+    if path.exists():
+        temp_path.unlink()
+    else:
+        temp_path.replace(path)
+    return path
+
+def store_resume(source: BinaryIO, suffix: str, directory: Path, max_bytes: Optional[int] = None) -> Tuple[Path, str]:
+    """Stream a file object into ``directory`` under its content hash; returns (path, content hash)"""
+    writer = SpoolWriter(_incoming_path(directory), suffix, max_bytes)
+    try:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            writer.write(chunk)
+        content_hash = writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return _store_by_hash(writer.path, content_hash, suffix), content_hash
+
+async def spool_upload(
+    upload: UploadFile,
+    directory: Path,
+    allowed_suffixes: Iterable[str],
+    max_bytes: int
+) -> Tuple[Path, str]:
+    """Stream an UploadFile into ``directory`` under its content hash; returns (path, content hash)
+
+    The upload is read in CHUNK_SIZE pieces and hashed in the same pass, so
+    the bytes are never held in memory as a whole and parsing can work
+    from the returned path.
+    """
+    suffix = PurePosixPath(upload.filename or "").suffix.lower()
+    if suffix not in {s.lower() for s in allowed_suffixes}:
+        raise UnsupportedFileTypeError(f"Unsupported file type: {suffix or 'no extension'}")
+    if upload.size is not None and upload.size > max_bytes:
+        raise FileTooLargeError(f"File exceeds the {max_bytes // (1024 * 1024)}MB limit")
+
+    writer = SpoolWriter(_incoming_path(directory), suffix, max_bytes)
+    try:
+        while chunk := await upload.read(CHUNK_SIZE):
+            await asyncio.to_thread(writer.write, chunk)
+        content_hash = writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return _store_by_hash(writer.path, content_hash, suffix), content_hash
+
+def extract_zip_resumes(
+    zip_path: Path,
+    directory: Path,
+    allowed_suffixes: Iterable[str],
+    max_files: int,
+    max_bytes: int
+) -> List[Dict[str, Any]]:
+    """Store every resume inside a ZIP archive, one entry at a time
+
+    Returns one record per file entry: ``{"filename", "status", ...}`` where
+    status is "stored" (with ``path`` and ``content_hash``) or "skipped"
+    (with ``detail``). Entries are streamed straight to disk and the size
+    limit is enforced on the decompressed bytes, not the declared size.
+    """
+    allowed = {suffix.lower() for suffix in allowed_suffixes}
+    entries = []
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            filename = PurePosixPath(info.filename).name
+            if info.is_dir() or not filename or info.filename.startswith("__MACOSX/") or filename.startswith("."):
+                continue
+            suffix = PurePosixPath(filename).suffix.lower()
+            if len(entries) >= max_files:
+                entries.append({"filename": filename, "status": "skipped", "detail": f"Archive has more than {max_files} files"})
+                continue
+            if suffix not in allowed:
+                entries.append({"filename": filename, "status": "skipped", "detail": "Only PDF and DOCX files are allowed"})
+                continue
+            if info.file_size > max_bytes:
+                entries.append({"filename": filename, "status": "skipped", "detail": f"File exceeds the {max_bytes // (1024 * 1024)}MB limit"})
+                continue
+            try:
+                with archive.open(info) as source:
+                    path, content_hash = store_resume(source, suffix, directory, max_bytes)
+            except (UploadRejectedError, zipfile.BadZipFile, RuntimeError) as e:
+                entries.append({"filename": filename, "status": "skipped", "detail": str(e)})
+                continue
+            entries.append({"filename": filename, "status": "stored", "path": path, "content_hash": content_hash})
+    return entries
@@ -0,0 +1,103 @@
+"""Analysis worker: claims jobs from the durable queue and runs them.
+
+Run standalone with ``python -m app.worker`` (from the backend directory)
+to scale analysis separately from the API; set QUEUE_EMBEDDED_WORKERS=0 on
+the API so it only enqueues. Standalone workers update the database, the
+on-disk embedding store and the full-text index, which every process
+shares. The in-memory indexes of an API process (skill matrix and skill
+index, ANN index, leaderboards, and the candidate aggregates behind the
+dashboard stats, reports and job summaries) catch up through the
+index_changes table: every candidate write is logged there, and the API
+replays other processes' rows every INDEX_SYNC_INTERVAL seconds.
+"""
+import asyncio
+import logging
+import signal
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import get_settings
+from app.services.job_queue import JobQueue, get_job_queue
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+def task_handlers() -> Dict[str, Tuple[Handler, Handler]]:
+    """Job kind -> (run, on_permanent_failure)"""
+    # Import here to avoid circular imports
+    from app.api import analysis, candidates
+
+    return {
+        "analysis": (analysis.run_analysis_job, analysis.analysis_job_failed),
+        "parse_resume": (candidates.run_parse_job, candidates.parse_job_failed),
+    }
+
+async def process_job(queue: JobQueue, job: Dict[str, Any], handlers: Dict[str, Tuple[Handler, Handler]]):
+    """Run one claimed job and record the outcome in the queue"""
+    settings = get_settings()
+    run, on_failure = handlers.get(job["kind"], (None, None))
+    if job.get("expired"):
+        # Its last attempt's worker died; the queue already marked it failed
+        logger.error(f"Job {job['id']} ({job['kind']}) failed: {job['last_error']}")
+        if on_failure is not None:
+            await on_failure(job["payload"])
+        return
+    try:
+        if run is None:
+            raise ValueError(f"Unknown job kind '{job['kind']}'")
+        await asyncio.wait_for(run(job["payload"]), timeout=settings.MAX_ANALYSIS_TIME)
+    except Exception as e:
+        error = f"{type(e).__name__}: {str(e)}"
+        retry = await asyncio.to_thread(queue.fail, job["id"], error)
+        logger.error(f"Job {job['id']} ({job['kind']}) attempt {job['attempts']} failed: {error}")
+        if not retry and on_failure is not None:
+            await on_failure(job["payload"])
+    else:
+        await asyncio.to_thread(queue.complete, job["id"])
+
+async def run_worker(stop: asyncio.Event, name: str = "worker"):
+    """Claim and run jobs until ``stop`` is set"""
+    settings = get_settings()
+    queue = get_job_queue()
+    handlers = task_handlers()
+    logger.info(f"🔄 Analysis {name} started")
+    while not stop.is_set():
+        job = await asyncio.to_thread(queue.claim)
+        if job is None:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.QUEUE_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        await process_job(queue, job, handlers)
+    logger.info(f"Analysis {name} stopped")
+
+async def start_workers(count: int) -> Tuple[asyncio.Event, list]:
+    """Start ``count`` worker tasks in this event loop"""
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(run_worker(stop, f"worker-{i + 1}")) for i in range(count)]
+    return stop, tasks
+
+async def stop_workers(stop: asyncio.Event, tasks: list):
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+async def main(concurrency: Optional[int] = None):
+    # Import here to avoid circular imports
+    from app.core.database import engine, init_db
+    from app.main import index_all
+
+    await init_db()
+    await index_all()
+    stop, tasks = await start_workers(concurrency or get_settings().QUEUE_WORKER_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    await stop_workers(stop, tasks)
+    get_job_queue().close()
+    await engine.dispose()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
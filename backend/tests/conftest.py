@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# Keep uploads, caches and the database of a test run out of the working tree
+_scratch = tempfile.mkdtemp(prefix="resumeiq-tests-")
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_scratch, "uploads"))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_scratch, 'resumeiq.db')}")
+os.environ.setdefault("DB_SEED_DEMO_DATA", "false")
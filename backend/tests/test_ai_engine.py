@@ -0,0 +1,44 @@
+import numpy as np
+
+from app.services.ai_engine import EmbeddingEngine, HashedTfidfEncoder
+
+CORPUS = [
+    "python developer building django rest apis",
+    "java developer building spring services",
+    "python data engineer with spark and airflow",
+    "frontend developer with react and typescript",
+]
+
+def hashed_engine(tmp_path, refit_growth=2.0):
+    return EmbeddingEngine(
+        "unused", backend="hashed", fallback_dim=256, idf_path=tmp_path / "idf.npz", refit_growth=refit_growth
+    )
+
+def test_fit_downweights_common_terms():
+    encoder = HashedTfidfEncoder(256)
+    encoder.fit(CORPUS)
+    common, rare = (encoder._bucket(term)[0] for term in ("developer", "airflow"))
+    assert encoder.idf[common] < encoder.idf[rare]
+    assert encoder.documents == len(CORPUS)
+
+def test_fit_if_needed_refits_once_the_corpus_has_grown(tmp_path):
+    engine = hashed_engine(tmp_path)
+    unfitted = engine.model_id
+    assert not engine.fit_if_needed([])
+
+    assert engine.fit_if_needed(CORPUS[:2])
+    fitted = engine.model_id
+    assert fitted != unfitted
+    assert not engine.fit_if_needed(CORPUS[:3])
+    assert engine.fit_if_needed(CORPUS)
+    assert engine.model_id not in (unfitted, fitted)
+
+def test_other_processes_load_the_saved_weights(tmp_path):
+    engine, other = hashed_engine(tmp_path), hashed_engine(tmp_path)
+    before = other.encode(CORPUS[:1])
+    engine.fit_if_needed(CORPUS)
+
+    assert other.model_id == engine.model_id
+    np.testing.assert_allclose(other.encode(CORPUS[:1]), engine.encode(CORPUS[:1]))
+    assert not np.allclose(other.encode(CORPUS[:1]), before)
+    assert not hashed_engine(tmp_path).fit_if_needed(CORPUS)
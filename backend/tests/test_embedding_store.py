@@ -0,0 +1,67 @@
+import numpy as np
+
+from app.services.embedding_store import EmbeddingStore, text_fingerprint
+
+DIM = 4
+
+def open_store(path, model_id="test-model", dim=DIM):
+    return EmbeddingStore(path, "resumes", model_id=model_id, dim=dim, compact_ratio=0.25)
+
+def vectors(n, offset=0):
+    return np.arange(offset, offset + n * DIM, dtype=np.float32).reshape(n, DIM)
+
+def test_reopened_store_reads_what_was_written(tmp_path):
+    store = open_store(tmp_path)
+    store.put_many([1, 2, 3], vectors(3), [text_fingerprint(t) for t in "abc"])
+    store.put(2, vectors(1, offset=100)[0])
+    store.delete(3)
+
+    reopened = open_store(tmp_path)
+    keys, found = reopened.get_many([1, 2, 3])
+    assert keys == [1, 2]
+    np.testing.assert_array_equal(found, np.vstack([vectors(1), vectors(1, offset=100)]))
+    assert reopened.fingerprint(1) == text_fingerprint("a")
+    assert reopened.stats() == {"vectors": 2, "dead_rows": 2, "generation": 0, "dim": DIM}
+
+def test_a_second_process_view_catches_up_on_writes(tmp_path):
+    writer, reader = open_store(tmp_path), open_store(tmp_path)
+    assert reader.get(1) is None
+
+    writer.put_many([1, 2], vectors(2))
+    writer.delete(1)
+    assert reader.get(1) is None
+    np.testing.assert_array_equal(reader.get(2), vectors(2)[1])
+
+    # Rows written by the reader land after the writer's, not on top of them
+    reader.put(3, vectors(1, offset=50)[0])
+    writer.refresh()
+    keys, found = writer.get_many([2, 3])
+    assert keys == [2, 3]
+    np.testing.assert_array_equal(found, np.vstack([vectors(2)[1], vectors(1, offset=50)[0]]))
+
+def test_compaction_starts_a_new_generation_other_views_follow(tmp_path):
+    store, other = open_store(tmp_path), open_store(tmp_path)
+    store.put_many(list(range(8)), vectors(8))
+    for key in range(4):
+        store.delete(key)
+    other.refresh()
+
+    assert store.compact_if_needed()
+    assert not store.compact_if_needed()
+    assert store.stats() == {"vectors": 4, "dead_rows": 0, "generation": 1, "dim": DIM}
+    assert not (tmp_path / "resumes.0.f32").exists()
+
+    keys, found = other.get_many(list(range(8)))
+    assert keys == [4, 5, 6, 7] and other.generation == 1
+    np.testing.assert_array_equal(found, vectors(8)[4:])
+    keys, found = open_store(tmp_path).matrix()
+    assert keys == [4, 5, 6, 7]
+    np.testing.assert_array_equal(found, vectors(8)[4:])
+
+def test_store_from_another_model_is_discarded(tmp_path):
+    open_store(tmp_path).put_many([1, 2], vectors(2))
+
+    store = open_store(tmp_path, model_id="other-model", dim=8)
+    assert len(store) == 0 and store.get(1) is None
+    store.put(1, np.ones(8, dtype=np.float32))
+    np.testing.assert_array_equal(open_store(tmp_path, model_id="other-model", dim=8).get(1), np.ones(8))
@@ -0,0 +1,69 @@
+import asyncio
+
+from app.core.database import SessionLocal, engine, init_db
+from app.models.database import AnalysisResult, Candidate, Job
+from app.services import candidate_repository
+from app.services.aggregates import candidate_aggregates
+from app.services.candidate_repository import apply_index_changes, latest_index_change, record_index_changes
+from app.services.leaderboard import job_leaderboards
+from app.services.skill_index import candidate_skill_index
+from app.services.skill_vectors import candidate_skill_matrix
+
+def test_writes_logged_by_another_process_reach_the_in_memory_indexes(monkeypatch):
+    async def scenario():
+        await init_db()
+        async with SessionLocal() as db:
+            after_id = await latest_index_change(db)
+            job = Job(title="Platform", company="Acme", description="Infrastructure")
+            db.add(job)
+            await db.commit()
+            job_id = job.id
+
+        # A standalone worker: writes straight to the database and logs under its own process id
+        monkeypatch.setattr(candidate_repository, "PROCESS_ID", "worker")
+        async with SessionLocal() as db:
+            candidate = Candidate(
+                name="Lin", email="lin@example.com", job_id=job_id, status="analyzed", overall_score=72.0,
+                verdict="Strong", resume_data={"skills": ["Terraform", "Go"]}
+            )
+            db.add(candidate)
+            await db.flush()
+            db.add(AnalysisResult(
+                candidate_id=candidate.id, job_id=job_id, overall_score=72.0, verdict="Strong", result={}
+            ))
+            record_index_changes(db, [candidate.id])
+            await db.commit()
+            candidate_id = candidate.id
+        monkeypatch.undo()
+
+        assert candidate_id not in candidate_skill_matrix
+        async with SessionLocal() as db:
+            after_id = await apply_index_changes(db, after_id)
+        assert candidate_id in candidate_skill_matrix
+        assert candidate_id in candidate_skill_index.search(all_of=["terraform"])
+        assert candidate_aggregates.pool(job_id).total(status="analyzed") == 1
+        assert job_leaderboards.get(job_id).top(10) == [(candidate_id, 72.0)]
+
+        # Rows this process logged itself are skipped: its hooks already ran
+        async with SessionLocal() as db:
+            await db.delete(await db.get(Candidate, candidate_id))
+            record_index_changes(db, [candidate_id])
+            await db.commit()
+            assert await apply_index_changes(db, after_id) > after_id
+        assert candidate_id in candidate_skill_matrix
+
+        monkeypatch.setattr(candidate_repository, "PROCESS_ID", "api-2")
+        async with SessionLocal() as db:
+            record_index_changes(db, [candidate_id], job_id=job_id)
+            await db.delete(await db.get(Job, job_id))
+            await db.commit()
+        monkeypatch.undo()
+        async with SessionLocal() as db:
+            await apply_index_changes(db, after_id)
+        await engine.dispose()
+        return candidate_id, job_id
+
+    candidate_id, job_id = asyncio.run(scenario())
+    assert candidate_id not in candidate_skill_matrix
+    assert candidate_aggregates.pool(job_id).total() == 0
+    assert len(job_leaderboards.get(job_id)) == 0
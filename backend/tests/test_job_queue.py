@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from app.services import job_queue as job_queue_module
+from app.services.job_queue import DONE, FAILED, QUEUED, RUNNING, JobQueue, SQLiteJobQueue
+from app.worker import process_job
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(job_queue_module, "time", clock)
+    return clock
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    queue = SQLiteJobQueue(tmp_path / "queue.sqlite3", visibility_timeout=30, max_attempts=3, retry_delay=2)
+    yield queue
+    queue.close()
+
+def test_job_queue_is_abstract():
+    with pytest.raises(TypeError):
+        JobQueue(visibility_timeout=30, max_attempts=3, retry_delay=2)
+
+def test_enqueue_is_idempotent_while_queued_or_running(queue):
+    first = queue.enqueue("analysis", {"candidate_ids": [1]}, key="job-1")
+    assert queue.enqueue("analysis", {"candidate_ids": [2]}, key="job-1")["id"] == first["id"]
+    queue.claim()
+    assert queue.enqueue("analysis", {}, key="job-1")["status"] == RUNNING
+
+    queue.complete(first["id"])
+    again = queue.enqueue("analysis", {"candidate_ids": [3]}, key="job-1")
+    assert again["id"] == first["id"]
+    assert (again["status"], again["attempts"], again["payload"]) == (QUEUED, 0, {"candidate_ids": [3]})
+
+def test_failed_attempts_are_retried_with_backoff(queue, clock):
+    job = queue.enqueue("analysis", {})
+    assert queue.claim()["attempts"] == 1
+    assert queue.fail(job["id"], "boom")
+    assert queue.claim() is None  # waiting out retry_delay
+
+    clock.now += 2
+    assert queue.claim()["attempts"] == 2
+    assert queue.fail(job["id"], "boom")
+    clock.now += 3
+    assert queue.claim() is None  # the second retry waits twice as long
+    clock.now += 1
+    assert queue.claim()["attempts"] == 3
+
+    assert not queue.fail(job["id"], "still broken")
+    failed = queue.get(job["id"])
+    assert (failed["status"], failed["last_error"]) == (FAILED, "still broken")
+    assert queue.stats() == {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 1}
+
+def test_expired_visibility_makes_a_job_claimable_again(queue, clock):
+    job = queue.enqueue("analysis", {})
+    queue.claim()
+    clock.now += 29
+    assert queue.claim() is None
+
+    clock.now += 1  # the worker died: its job comes back
+    reclaimed = queue.claim()
+    assert (reclaimed["id"], reclaimed["attempts"], reclaimed.get("expired")) == (job["id"], 2, None)
+    queue.complete(job["id"])
+    clock.now += 60
+    assert queue.claim() is None
+    assert queue.get(job["id"])["status"] == DONE
+
+def test_last_attempt_expiring_hands_the_job_out_once_as_expired(queue, clock):
+    job = queue.enqueue("analysis", {"candidate_ids": [7]})
+    for _ in range(3):
+        assert not queue.claim().get("expired")
+        clock.now += 30
+
+    expired = queue.claim()
+    assert expired["expired"] and expired["status"] == FAILED
+    assert expired["last_error"] == "visibility timeout expired"
+    assert queue.claim() is None
+    assert queue.get(job["id"])["status"] == FAILED
+
+def test_worker_runs_the_failure_handler_for_expired_and_exhausted_jobs(queue, clock):
+    calls = []
+
+    async def run(payload):
+        raise RuntimeError("scorer crashed")
+
+    async def on_failure(payload):
+        calls.append(payload)
+
+    handlers = {"analysis": (run, on_failure)}
+    queue.enqueue("analysis", {"candidate_ids": [1]})
+    asyncio.run(process_job(queue, queue.claim(), handlers))
+    assert calls == []  # will be retried
+
+    clock.now += 2
+    asyncio.run(process_job(queue, queue.claim(), handlers))
+    clock.now += 4
+    asyncio.run(process_job(queue, queue.claim(), handlers))
+    assert calls == [{"candidate_ids": [1]}]
+
+    queue.enqueue("analysis", {"candidate_ids": [2]})
+    for _ in range(3):
+        queue.claim()
+        clock.now += 30
+    asyncio.run(process_job(queue, queue.claim(), handlers))
+    assert calls == [{"candidate_ids": [1]}, {"candidate_ids": [2]}]
@@ -0,0 +1,66 @@
+import re
+
+import pytest
+
+from app.services.resume_parser import (
+    PROGRAMMING_LANGUAGES, SKILL_KEYWORDS, SKILL_MATCHER, SPOKEN_LANGUAGES, KeywordMatcher,
+    extract_languages, extract_skills
+)
+from app.services.skill_taxonomy import skill_taxonomy
+
+SAMPLES = [
+    "Senior engineer: Python, Java and JavaScript; built REST APIs with Django and Flask.",
+    "Spring Boot microservices on AWS with Docker, Kubernetes and Jenkins CI/CD pipelines.",
+    "Frontend work in React Native and React, Vue.js, Angular; styled with Tailwind and Bootstrap.",
+    "Data science: machine learning, deep learning, TensorFlow, PyTorch, scikit-learn, pandas, numpy.",
+    "Databases: PostgreSQL, MySQL, MongoDB, Redis, SQL Server, Elasticsearch.",
+    "Soft skills: leadership, teamwork, problem solving, time management and mentoring.",
+    "Languages: English, Hindi and German. Also R, Go, Rust, C++ and C#.",
+    "Reporting in Power BI and Tableau; notebooks in Jupyter and R Studio; Spark and Kafka streams.",
+    "Designs in Figma and Sketch, tracked in Jira and Confluence, code on GitHub and GitLab.",
+    "springboard, javanese, reactor, goal, pythonic, nodes, expressive: none of these are skills",
+    "",
+]
+
+def old_regex_find(keywords, text):
+    """How skills were matched before the single-pass scan: one word-bounded search per keyword"""
+    return {k for k in keywords if re.search(r"\b" + re.escape(k) + r"\b", text)}
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_keyword_matcher_finds_what_per_keyword_regexes_find(text):
+    text = text.lower()
+    assert SKILL_MATCHER.find(text) == old_regex_find(SKILL_MATCHER.keywords, text)
+
+def test_keyword_matcher_finds_prefixes_and_overlapping_keywords():
+    matcher = KeywordMatcher({"spring", "spring boot", "boot camp", "react", "react native"})
+    assert matcher.find("spring boot camp and react native") == {
+        "spring", "spring boot", "boot camp", "react", "react native"
+    }
+    assert matcher.find("springboard reactor") == set()
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_extract_skills_keeps_every_regex_match(text):
+    old = old_regex_find(SKILL_KEYWORDS, text.lower())
+    assert {skill_taxonomy.canonical(k) for k in old} <= set(extract_skills(text))
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_extract_languages_matches_old_regexes(text):
+    lowered = text.lower()
+    expected = [f"{lang.title()} (Programming)" for lang in PROGRAMMING_LANGUAGES if old_regex_find([lang], lowered)]
+    expected += [f"{lang.title()} (Spoken)" for lang in SPOKEN_LANGUAGES if old_regex_find([lang], lowered)]
+    assert extract_languages(text) == expected
+
+def test_extract_skills_canonical_names_once():
+    skills = extract_skills("NodeJS and node.js; k8s and Kubernetes; leadership")
+    assert skills == ["Kubernetes", "Node.js", "Leadership"]
+
+@pytest.mark.parametrize("text, expected", [
+    ("Built APIs with Node.js", ["Node.js"]),
+    ("Built APIs with Node.js and Express.js", ["Express.js", "Node.js"]),
+    ("Single page apps in Vue.js", ["Vue.js"]),
+    ("Single page apps in React.js", ["React"]),
+    ("Single page apps in Ember.js", ["Ember.js"]),
+    ("Single page apps in JavaScript (ES6) on Node JS", ["JavaScript", "Node.js"]),
+])
+def test_framework_names_do_not_imply_javascript(text, expected):
+    assert sorted(extract_skills(text)) == sorted(expected)
@@ -0,0 +1,80 @@
+import asyncio
+
+from app.api.analysis import store_analysis_results
+from app.core.database import SessionLocal, engine, init_db
+from app.models.database import Candidate, Job
+from app.services.leaderboard import JobLeaderboards, Leaderboard, job_leaderboards
+
+def result(candidate_id, job_id, score):
+    return {"candidate_id": candidate_id, "job_id": job_id, "overall_score": score}
+
+def test_leaderboard_ranks_by_score_then_id():
+    board = Leaderboard()
+    for candidate_id, score in [(1, 70.0), (2, 90.0), (3, 70.0), (4, 50.0)]:
+        board.update(candidate_id, score)
+    board.update(4, 95.0)
+
+    assert board.top(10) == [(4, 95.0), (2, 90.0), (1, 70.0), (3, 70.0)]
+    assert board.top(2, offset=1) == [(2, 90.0), (1, 70.0)]
+    assert [board.rank(c) for c in (4, 2, 1, 3)] == [1, 2, 3, 4]
+    board.remove(2)
+    assert board.rank(1) == 2 and board.rank(2) is None and len(board) == 3
+
+def test_boards_are_kept_per_job():
+    boards = JobLeaderboards()
+    boards.rebuild([result(1, 10, 80.0), result(2, 10, 60.0), result(3, 20, 70.0), result(4, None, 99.0)])
+
+    assert boards.get(10).top(10) == [(1, 80.0), (2, 60.0)]
+    assert boards.get(20).top(10) == [(3, 70.0)]
+    assert boards.get(30).top(10) == []
+
+    boards.remove_job(10)
+    assert len(boards.get(10)) == 0
+    boards.update(result(1, 20, 75.0))
+    assert boards.get(20).top(10) == [(1, 75.0), (3, 70.0)]
+
+def test_rescoring_against_another_job_moves_the_candidate():
+    boards = JobLeaderboards()
+    boards.update(result(1, 10, 80.0))
+    boards.update(result(1, 20, 40.0))
+
+    assert 1 not in boards.get(10)
+    assert boards.get(20).top(10) == [(1, 40.0)]
+
+def analysis(job_id, score, verdict):
+    return {
+        "job_id": job_id,
+        "overall_score": score,
+        "verdict": verdict,
+        "matched_skills": [],
+        "missing_skills": []
+    }
+
+def test_stored_results_rank_a_candidate_on_the_job_it_was_scored_against():
+    async def scenario():
+        await init_db()
+        async with SessionLocal() as db:
+            first = Job(title="Backend", company="Acme", description="APIs")
+            second = Job(title="Data", company="Acme", description="Pipelines")
+            db.add_all([first, second])
+            await db.flush()
+            candidate = Candidate(name="Ada", email="ada@example.com", job_id=first.id, resume_data={"skills": ["Python"]})
+            rival = Candidate(name="Grace", email="grace@example.com", job_id=second.id, resume_data={"skills": ["SQL"]})
+            db.add_all([candidate, rival])
+            await db.commit()
+
+            await store_analysis_results(db, [
+                (candidate, analysis(first.id, 85.0, "Strong")),
+                (rival, analysis(second.id, 60.0, "Moderate"))
+            ])
+            assert job_leaderboards.get(first.id).top(10) == [(candidate.id, 85.0)]
+
+            # The same candidate, scored against the job it did not apply to
+            await store_analysis_results(db, [(candidate, analysis(second.id, 40.0, "Weak"))])
+            ids = first.id, second.id, candidate.id, rival.id
+        await engine.dispose()
+        return ids
+
+    first_id, second_id, candidate_id, rival_id = asyncio.run(scenario())
+    assert candidate_id not in job_leaderboards.get(first_id)
+    assert job_leaderboards.get(second_id).top(10) == [(rival_id, 60.0), (candidate_id, 40.0)]
@@ -0,0 +1,61 @@
+import json
+import sqlite3
+
+from app.services import parse_cache as parse_cache_module
+from app.services.parse_cache import ParseCache
+
+def payload_size(result):
+    return len(json.dumps(result))
+
+def disk_state(path):
+    conn = sqlite3.connect(path)
+    try:
+        keys = {row[0] for row in conn.execute("SELECT key FROM parsed_resumes")}
+        total = conn.execute("SELECT total FROM parse_cache_size").fetchone()[0]
+        actual = conn.execute("SELECT COALESCE(SUM(size), 0) FROM parsed_resumes").fetchone()[0]
+    finally:
+        conn.close()
+    return keys, total, actual
+
+def test_put_evicts_least_recently_used_rows(tmp_path):
+    result = {"text": "x" * 100}
+    size = payload_size(result)
+    cache = ParseCache(tmp_path / "cache.sqlite3", memory_items=1, max_bytes=size * 3)
+
+    for name in ("a", "b", "c"):
+        cache.put(name, result)
+    assert cache.get("a") == result  # from disk, so "a" becomes the newest row
+    cache.put("d", result)
+
+    keys, total, actual = disk_state(cache.db_path)
+    assert keys == {cache.make_key(name) for name in ("a", "c", "d")}
+    assert total == actual == size * 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("b") is None
+    cache.close()
+
+def test_eviction_spans_several_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(parse_cache_module, "EVICTION_BATCH", 2)
+    small = {"text": "x" * 10}
+    large = {"text": "x" * 1000}
+    cache = ParseCache(tmp_path / "cache.sqlite3", memory_items=1, max_bytes=payload_size(large) + 5)
+
+    for i in range(5):
+        cache.put(f"small-{i}", small)
+    cache.put("large", large)
+
+    keys, total, actual = disk_state(cache.db_path)
+    assert keys == {cache.make_key("large")}
+    assert total == actual == payload_size(large)
+    assert cache.stats()["evictions"] == 5
+    cache.close()
+
+def test_overwriting_a_key_keeps_the_size_total(tmp_path):
+    cache = ParseCache(tmp_path / "cache.sqlite3", memory_items=4, max_bytes=10_000)
+    cache.put("a", {"text": "short"})
+    cache.put("a", {"text": "a much longer value"})
+
+    keys, total, actual = disk_state(cache.db_path)
+    assert keys == {cache.make_key("a")}
+    assert total == actual == payload_size({"text": "a much longer value"})
+    cache.close()
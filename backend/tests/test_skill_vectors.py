@@ -0,0 +1,23 @@
+from app.services.skill_vectors import SkillMatrix, SkillVocabulary
+
+def test_match_counts_matched_and_missing_skills_per_candidate():
+    matrix = SkillMatrix(SkillVocabulary())
+    matrix.update(1, ["Python", "PostgreSQL"])
+    matrix.update(2, ["Java"])
+    matrix.update(3, ["python", "postgres", "Docker"])
+
+    result = matrix.match(["Python", "PostgreSQL"], keys=[3, 1, 2, 99])
+    assert list(result["keys"]) == [3, 1, 2]
+    assert list(result["matched"]) == [2, 2, 0]
+    assert list(result["missing"]) == [0, 0, 2]
+
+def test_query_skills_do_not_grow_the_vocabulary():
+    vocabulary = SkillVocabulary()
+    matrix = SkillMatrix(vocabulary)
+    matrix.update(1, ["Python"])
+    size, width = len(vocabulary), matrix._bits.shape[1]
+
+    result = matrix.match(["Python"] + [f"unheard-of skill {i}" for i in range(100)])
+    assert len(vocabulary) == size and matrix._bits.shape[1] == width
+    assert list(result["matched"]) == [1]
+    assert list(result["missing"]) == [100]